@@ -110,8 +110,9 @@ async def main():
         db_manager = get_db_manager()
 
         with db_manager.session_scope() as db:
-            lookback_time = datetime.now(timezone.utc) - timedelta(days=settings.lookback_days)
-            age_limit_date = (datetime.now(timezone.utc) - timedelta(days=settings.max_article_age_days)).date()
+            now = datetime.now(timezone.utc)
+            lookback_time = now - timedelta(days=settings.lookback_days)
+            age_limit_date = (now - timedelta(days=settings.max_article_age_days)).date()
 
             new_articles = db.query(Article).filter(
                 and_(
@@ -431,8 +432,9 @@ async def run_crawl_with_analysis() -> bool:
         while True:
             try:
                 with db_manager.session_scope() as db:
-                    lookback_time = datetime.now(timezone.utc) - timedelta(days=settings.lookback_days)
-                    age_limit_date = (datetime.now(timezone.utc) - timedelta(days=settings.max_article_age_days)).date()
+                    now = datetime.now(timezone.utc)
+                    lookback_time = now - timedelta(days=settings.lookback_days)
+                    age_limit_date = (now - timedelta(days=settings.max_article_age_days)).date()
 
                     batch = db.query(Article).filter(
                         and_(
@@ -249,8 +249,8 @@ class Settings(BaseSettings):
         Returns:
             List of university/source configuration dictionaries with standardized fields
         """
-        import json
         from pathlib import Path
+        from crawler.utils.json_utils import load_json
 
         sources = []
 
@@ -265,8 +265,7 @@ class Settings(BaseSettings):
                 logger.warning(f"Source file not found: {path}, skipping")
                 continue
 
-            with open(path, 'r') as f:
-                data = json.load(f)
+            data = load_json(path)
 
             # Extract universities/sources based on file structure
             if isinstance(data, list):
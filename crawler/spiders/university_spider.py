@@ -15,6 +15,7 @@ import json
 import logging
 
 import feedparser
+from twisted.internet.threads import deferToThread
 
 from crawler.config.settings import settings
 from crawler.db.models import URL, Article
@@ -643,45 +644,68 @@ class UniversityNewsSpider(scrapy.Spider):
             self.logger.info(f"Attempting MCP fallback for {url}")
             self.stats['mcp_fallback_attempts'] += 1
 
-            try:
-                # Fetch content using MCP
-                html_content = self.mcp_fetcher.fetch_with_mcp(url)
-
-                if html_content:
-                    # Create a fake response object for processing
-                    from scrapy.http import TextResponse
-
-                    mcp_response = TextResponse(
-                        url=url,
-                        body=html_content.encode('utf-8'),
-                        encoding='utf-8',
-                        request=failure.request
-                    )
-
-                    # Copy metadata from original request
-                    if 'url_hash' in failure.request.meta:
-                        mcp_response.meta['url_hash'] = failure.request.meta['url_hash']
-                        mcp_response.meta['normalized_url'] = failure.request.meta['normalized_url']
-                    else:
-                        # Generate metadata if not present
-                        from crawler.utils.deduplication import compute_url_hash, normalize_url
-                        normalized = normalize_url(url)
-                        mcp_response.meta['url_hash'] = compute_url_hash(normalized)
-                        mcp_response.meta['normalized_url'] = normalized
+            # The fallback fetch is a blocking HTTP call, so run it in the
+            # reactor thread pool: other requests keep flowing and several
+            # fallbacks can be in flight at once. Parsing (which touches the
+            # database session) happens back on the reactor thread.
+            dfd = deferToThread(self.mcp_fetcher.fetch_document, url)
+            dfd.addCallback(self._parse_mcp_content, failure.request)
+            dfd.addErrback(self._log_mcp_failure, url)
+            return dfd
 
-                    # Mark as MCP-fetched for logging
-                    mcp_response.meta['mcp_fetched'] = True
-
-                    self.stats['mcp_fallback_successes'] += 1
-                    self.logger.info(f"MCP fallback successful for {url}")
+    def _parse_mcp_content(self, document, request):
+        """
+        Process content fetched by the MCP fallback through the normal pipeline.
 
-                    # Process the article using normal pipeline
-                    # We need to manually call parse_article since we're in error handler
-                    # Use Scrapy's callback mechanism properly
-                    return self.parse_article(mcp_response)
+        Args:
+            document: (raw HTML bytes, Content-Type header) from
+                MCPFetcher.fetch_document, or None
+            request: The original failed request
+        """
+        if not document:
+            return None
+
+        html_content, content_type = document
+        url = request.url
+
+        # Create a fake response object for processing; the body is the raw
+        # fetched bytes, decoded with the charset from the original
+        # Content-Type header, else a <meta> declaration, else inferred
+        from scrapy.http import HtmlResponse
+
+        mcp_response = HtmlResponse(
+            url=url,
+            body=html_content,
+            headers={'Content-Type': content_type} if content_type else None,
+            request=request
+        )
 
-            except Exception as e:
-                self.logger.error(f"MCP fallback failed for {url}: {e}")
+        # Copy metadata from original request
+        if 'url_hash' in request.meta:
+            mcp_response.meta['url_hash'] = request.meta['url_hash']
+            mcp_response.meta['normalized_url'] = request.meta['normalized_url']
+        else:
+            # Generate metadata if not present
+            from crawler.utils.deduplication import compute_url_hash, normalize_url
+            normalized = normalize_url(url)
+            mcp_response.meta['url_hash'] = compute_url_hash(normalized)
+            mcp_response.meta['normalized_url'] = normalized
+
+        # Mark as MCP-fetched for logging
+        mcp_response.meta['mcp_fetched'] = True
+
+        self.stats['mcp_fallback_successes'] += 1
+        self.logger.info(f"MCP fallback successful for {url}")
+
+        # Process the article using normal pipeline
+        # We need to manually call parse_article since we're in error handler
+        # Use Scrapy's callback mechanism properly
+        return self.parse_article(mcp_response)
+
+    def _log_mcp_failure(self, failure, url: str):
+        """Log a failed MCP fallback without failing the errback chain."""
+        self.logger.error(f"MCP fallback failed for {url}: {failure.value}")
+        return None
 
     def closed(self, reason):
         """
@@ -0,0 +1,42 @@
+"""
+Shared loading of the institution configuration files.
+
+UniversityClassifier and UniversityNameMapper read the same JSON files from
+crawler/config; each file is parsed once per process and the parsed data is
+shared. Callers must treat the returned data as read-only.
+"""
+
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+from crawler.utils.json_utils import load_json
+
+logger = logging.getLogger(__name__)
+
+# Default location of the institution config files
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+@lru_cache(maxsize=32)
+def _load_resolved(path: Path) -> Optional[Any]:
+    """Parse one config file; None if it does not exist."""
+    if not path.exists():
+        return None
+    logger.debug(f"Loading config file {path}")
+    return load_json(path)
+
+
+def load_config_file(filename: str, config_dir: Optional[Path] = None) -> Optional[Any]:
+    """
+    Get the parsed contents of a config file, loading it on first use.
+
+    Args:
+        filename: File name within the config directory
+        config_dir: Config directory (defaults to crawler/config)
+
+    Returns:
+        Parsed JSON data, or None if the file does not exist
+    """
+    return _load_resolved((Path(config_dir or CONFIG_DIR) / filename).resolve())
@@ -2,175 +2,50 @@
 HTML Report Generator - Creates Drudge Report-style static HTML pages
 """
 import calendar
+import functools
 import hashlib
 import html as html_mod
 import json
 import os
 import re
-from collections import OrderedDict
+import shutil
+import string
+import textwrap
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Optional
 from sqlalchemy import select, func, and_
 from sqlalchemy.orm import Session
 
-from crawler.db.models import Article, AIAnalysis
+from crawler.db.models import Article, AIAnalysis, URL
 from crawler.db.session import get_db
-from crawler.utils.university_classifier import UniversityClassifier
+from crawler.utils.json_utils import load_json
+from crawler.utils.university_classifier import get_classifier
 
+_CONFIG_DIR = Path(__file__).parent.parent / 'config'
 
-class HTMLReportGenerator:
-    """Generates Drudge Report-style HTML pages for crawl results"""
-
-    _NAME_OVERRIDES = {
-        # Hostnames that slip through as display names
-        "stories.tamu.edu": "Texas A&M University",
-        "tamu.edu": "Texas A&M University",
-        "usf.edu": "University of South Florida",
-        "nist.gov": "NIST",
-        # Blog/publication names
-        "The Brink": "Boston University",
-        # CamelCase concatenations
-        "Universityofri": "University of Rhode Island",
-        "FloridaAtlantic": "Florida Atlantic University",
-        "UMassLowell": "UMass Lowell",
-        # Post-cleanup matches (after suffix stripping)
-        "Notre Dame": "University of Notre Dame",
-    }
-
-    def __init__(self, output_dir: str = "html_output", github_pages_dir: str = None, editorial_picks=None):
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Optional separate output for GitHub Pages
-        self.github_pages_dir = Path(github_pages_dir) if github_pages_dir else None
-        if self.github_pages_dir:
-            self.github_pages_dir.mkdir(parents=True, exist_ok=True)
-
-        self.editorial_picks = editorial_picks or []
-        self.classifier = UniversityClassifier()
-        self._source_count = self._count_sources()
-
-    def _count_sources(self) -> int:
-        """Count total monitored sources from config files"""
-        config_dir = Path(__file__).parent.parent / 'config'
-        count = 0
-        for filename, key in [
-            ('peer_institutions.json', 'universities'),
-            ('r1_universities.json', 'universities'),
-            ('major_facilities.json', 'facilities'),
-            ('national_laboratories.json', 'facilities'),
-            ('global_institutions.json', 'universities'),
-        ]:
-            try:
-                with open(config_dir / filename, 'r') as f:
-                    data = json.load(f)
-                    count += len(data.get(key, []))
-            except Exception:
-                pass
-        return count
-
-    @staticmethod
-    def strip_markdown(text: str) -> str:
-        """Strip markdown formatting and structured data from text, returning clean plain text"""
-        if not text:
-            return ""
-
-        # Remove code blocks (triple backticks) - everything between ```
-        text = re.sub(r'```[a-zA-Z]*\n?.*?```', '', text, flags=re.DOTALL)
-        text = re.sub(r'```', '', text)
-
-        # Handle structured list formatting like [**Key**: Description, **Key2**: Description]
-        # Extract title (before the bracket) and first description only
-        match = re.match(r'^([^\[]+)\s*\[', text)
-        if match:
-            # Keep just the title text before the structured list
-            text = match.group(1).strip()
-        else:
-            # If no structured list, process normally
-            # Remove square brackets but keep content
-            text = re.sub(r'[\[\]]', '', text)
-
-        # Remove markdown links [text](url) -> text
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-
-        # Remove bold **text** or __text__ -> text
-        text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
-        text = re.sub(r'__([^_]+)__', r'\1', text)
-
-        # Remove italics *text* or _text_ -> text
-        text = re.sub(r'\*([^\*]+)\*', r'\1', text)
-        text = re.sub(r'_([^_]+)_', r'\1', text)
-
-        # Remove inline code `text` -> text
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-
-        # Remove headers ### text -> text
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-
-        # Remove horizontal rules
-        text = re.sub(r'^[-*_]{3,}$', '', text, flags=re.MULTILINE)
-
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-
-        # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        return text.strip()
-
-    @staticmethod
-    def clean_university_name(name: str) -> str:
-        """Clean raw university names for display.
-
-        Handles hostnames, CamelCase concatenations, blog names, and noisy suffixes.
-        """
-        if not name:
-            return "Unknown"
-
-        # Check explicit overrides first
-        if name in HTMLReportGenerator._NAME_OVERRIDES:
-            return HTMLReportGenerator._NAME_OVERRIDES[name]
-
-        # Strip pipe-delimited suffixes: "University of Central Florida News | UCF Today" -> "University of Central Florida News"
-        if ' | ' in name:
-            name = name.split(' | ')[0].strip()
-
-        # Strip common suffixes
-        for suffix in [' News', ' Today', ' Newsroom', ' Stories']:
-            if name.endswith(suffix):
-                name = name[:-len(suffix)].strip()
-
-        # Check overrides again after cleanup
-        if name in HTMLReportGenerator._NAME_OVERRIDES:
-            return HTMLReportGenerator._NAME_OVERRIDES[name]
-
-        # Handle bare hostnames (contain dots with a TLD)
-        if re.match(r'^[\w.-]+\.(edu|gov|org|com)$', name):
-            clean = re.sub(r'\.(edu|gov|org|com)$', '', name)
-            parts = clean.split('.')
-            readable = parts[-1] if parts else clean
-            return readable.replace('-', ' ').replace('_', ' ').title()
-
-        # Fix CamelCase concatenation: "FloridaAtlantic" -> "Florida Atlantic"
-        if re.search(r'[a-z][A-Z]', name):
-            name = re.sub(r'([a-z])([A-Z])', r'\1 \2', name)
+# Config files listed on the How It Works page
+_SOURCE_LIST_FILES = (
+    'peer_institutions.json',
+    'r1_universities.json',
+    'major_facilities.json',
+    'national_laboratories.json',
+    'global_institutions.json',
+)
 
-        return name.strip() or "Unknown"
 
-    # ── Favicon ────────────────────────────────────────────────────────────
+# Characters that make strip_markdown do more than collapse whitespace
+_MD_SENTINEL_RE = re.compile(r'[`*_\[\]<#]|^-{3,}$', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
 
-    @staticmethod
-    def _get_favicon_link() -> str:
-        return "<link rel=\"icon\" href=\"data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>&#x1F393;</text></svg>\">"
 
-    # ── CSS Helpers ────────────────────────────────────────────────────────
-    # These return plain strings (not f-strings) to avoid brace escaping.
+# ── Static page assets ─────────────────────────────────────────────────────
+# Built once at import; the render methods only substitute per-page content.
 
-    @staticmethod
-    def _get_base_css() -> str:
-        """CSS custom properties, reset, header, nav, footer, focus states"""
-        return """
+_BASE_CSS = """
         :root {
             --color-bg: #ffffff;
             --color-surface: #f8f9fa;
@@ -293,10 +168,7 @@ class HTMLReportGenerator:
         }
         """
 
-    @staticmethod
-    def _get_main_page_css() -> str:
-        """Tab bar, article rows, expand panels, show-more, responsive"""
-        return """
+_MAIN_PAGE_CSS = """
         /* ── Search Bar ── */
         .search-bar {
             position: relative;
@@ -627,10 +499,7 @@ class HTMLReportGenerator:
         }
         """
 
-    @staticmethod
-    def _get_archive_page_css() -> str:
-        """Monthly groupings, bar chart rows, responsive"""
-        return """
+_ARCHIVE_PAGE_CSS = """
         .archive-month {
             margin-bottom: var(--space-xl);
         }
@@ -699,10 +568,7 @@ class HTMLReportGenerator:
         }
         """
 
-    @staticmethod
-    def _get_how_it_works_css() -> str:
-        """Content typography, highlight box, details/summary, source lists"""
-        return """
+_HOW_IT_WORKS_CSS = """
         .content {
             max-width: 900px;
             margin: 0 auto;
@@ -795,106 +661,942 @@ class HTMLReportGenerator:
         }
         """
 
-    # ── HTML Component Helpers ─────────────────────────────────────────────
-
-    def _render_header(self, title: str, meta_text: str = None,
-                       active_page: str = None, is_archive: bool = False) -> str:
-        """Compact single-row header with title left, meta + nav right"""
-        if is_archive:
-            urls = {"today": "../index.html", "archive": "index.html", "how_it_works": "../how_it_works.html"}
-        else:
-            urls = {"today": "index.html", "archive": "archive/index.html", "how_it_works": "how_it_works.html"}
-
-        def cls(page):
-            return ' class="active"' if page == active_page else ''
-
-        meta_html = f'<span class="header-meta">{meta_text}</span>' if meta_text else ''
-
-        return f'''    <div class="header">
-        <h1>{title}</h1>
-        <div class="header-right">
-            {meta_html}
-            <span class="header-nav">
-                <a href="{urls['today']}"{cls('today')}>Today</a>
-                &middot;
-                <a href="{urls['archive']}"{cls('archive')}>Archive</a>
-                &middot;
-                <a href="{urls['how_it_works']}"{cls('how_it_works')}>How It Works</a>
-            </span>
-        </div>
-    </div>'''
-
-    def _render_footer(self, is_archive: bool = False, timestamp: str = None) -> str:
-        if is_archive:
-            urls = {"today": "../index.html", "archive": "index.html", "how_it_works": "../how_it_works.html"}
-        else:
-            urls = {"today": "index.html", "archive": "archive/index.html", "how_it_works": "how_it_works.html"}
-
-        ts = timestamp or datetime.now().strftime('%I:%M %p')
-
-        return f'''
-    <div class="footer">
-        <a href="{urls['today']}">Today</a> &middot;
-        <a href="{urls['archive']}">Archive</a> &middot;
-        <a href="{urls['how_it_works']}">How It Works</a> &middot;
-        <a href="https://github.com/tyson-swetnam/webcrawler" target="_blank">GitHub</a>
-        &nbsp;|&nbsp; {self._source_count} sources &middot; Updated {ts}
-    </div>'''
+# Pagefind UI overrides for the archive index
+_PAGEFIND_CSS = """
+        /* ── Pagefind UI Overrides ── */
+        :root {
+            --pagefind-ui-scale: 0.9;
+            --pagefind-ui-primary: var(--color-text);
+            --pagefind-ui-text: var(--color-text-secondary);
+            --pagefind-ui-background: var(--color-bg);
+            --pagefind-ui-border: var(--color-border);
+            --pagefind-ui-tag: var(--color-surface-alt);
+            --pagefind-ui-border-width: 1px;
+            --pagefind-ui-border-radius: 6px;
+            --pagefind-ui-font: 'DM Sans', system-ui, sans-serif;
+        }
+        .search-section {
+            margin-bottom: var(--space-xl);
+        }
+        .popular-topics {
+            margin-top: var(--space-sm);
+            display: flex;
+            flex-wrap: wrap;
+            gap: 4px;
+        }
+        .topic-pill-clickable {
+            cursor: pointer;
+            transition: background-color var(--transition-fast);
+        }
+        .topic-pill-clickable:hover {
+            background: var(--color-border);
+        }
+        """
 
-    # ── Public Generation Methods ──────────────────────────────────────────
+_MAIN_PAGE_JS = '''<script>
+function switchTab(cat) {
+    var btns = document.querySelectorAll('.tab-btn');
+    btns.forEach(function(b) { b.classList.toggle('active', b.getAttribute('data-tab') === cat); });
 
-    def generate_daily_report(self, date: Optional[datetime] = None) -> str:
-        """Generate HTML report for a specific date (default: today)"""
-        if date is None:
-            date = datetime.now()
+    // Handle Top News section visibility
+    var topSection = document.getElementById('top-news-section');
+    var articleList = document.querySelector('.article-list');
 
-        with get_db() as session:
-            articles = self._fetch_articles_for_date(session, date)
+    if (cat === 'top') {
+        if (topSection) topSection.classList.add('active');
+        if (articleList) articleList.style.display = 'none';
+        return;
+    } else {
+        if (topSection) topSection.classList.remove('active');
+        if (articleList) articleList.style.removeProperty('display');
+    }
 
-        # Write to index.html for current day
-        if date.date() == datetime.now().date():
-            # Main page (root level) - use relative paths without ../
-            html = self._render_main_page(articles, date, is_archive_page=False)
-            output_file = self.output_dir / "index.html"
-            output_file.write_text(html, encoding='utf-8')
+    var MAX_VISIBLE = 25;
+    var rows = document.querySelectorAll('.article-row');
+    var details = document.querySelectorAll('.article-detail');
 
-            # ALSO save dated archive file for today (in archive/ dir)
-            html_archive = self._render_main_page(articles, date, is_archive_page=True)
-            archive_dir = self.output_dir / "archive"
-            archive_dir.mkdir(exist_ok=True)
-            archive_file = archive_dir / f"{date.strftime('%Y-%m-%d')}.html"
-            archive_file.write_text(html_archive, encoding='utf-8')
-        else:
-            # Archive files by date (in archive/ dir)
-            html = self._render_main_page(articles, date, is_archive_page=True)
-            archive_dir = self.output_dir / "archive"
-            archive_dir.mkdir(exist_ok=True)
-            output_file = archive_dir / f"{date.strftime('%Y-%m-%d')}.html"
-            output_file.write_text(html, encoding='utf-8')
+    // Count matching articles for this tab
+    var matchCount = 0;
+    rows.forEach(function(r) {
+        if (cat === 'all' || r.getAttribute('data-category') === cat) matchCount++;
+    });
 
-        # Also write to GitHub Pages directory if configured
-        if self.github_pages_dir:
-            if date.date() == datetime.now().date():
-                # Main page for GitHub Pages
-                html_main = self._render_main_page(articles, date, is_archive_page=False)
-                gh_output_file = self.github_pages_dir / "index.html"
-                gh_output_file.write_text(html_main, encoding='utf-8')
-
-                # Archive file for today
-                html_archive = self._render_main_page(articles, date, is_archive_page=True)
-                gh_archive_dir = self.github_pages_dir / "archive"
-                gh_archive_dir.mkdir(exist_ok=True)
-                gh_archive_file = gh_archive_dir / f"{date.strftime('%Y-%m-%d')}.html"
-                gh_archive_file.write_text(html_archive, encoding='utf-8')
+    // Show/hide rows with per-tab overflow logic
+    var visibleIndex = 0;
+    rows.forEach(function(r) {
+        var match = (cat === 'all' || r.getAttribute('data-category') === cat);
+        if (match) {
+            if (matchCount <= MAX_VISIBLE || visibleIndex < MAX_VISIBLE) {
+                r.style.removeProperty('display');
+                r.classList.remove('tab-hidden');
+            } else {
+                r.style.display = 'none';
+                r.classList.add('tab-hidden');
+                r.classList.remove('expanded');
+            }
+            visibleIndex++;
+        } else {
+            r.style.display = 'none';
+            r.classList.remove('expanded');
+            r.classList.remove('tab-hidden');
+        }
+    });
+    details.forEach(function(d) {
+        var match = (cat === 'all' || d.getAttribute('data-category') === cat);
+        if (!match) {
+            d.classList.remove('open');
+            d.style.display = 'none';
+        } else {
+            d.style.removeProperty('display');
+        }
+    });
+
+    // Show-more button: only if this tab has more than MAX_VISIBLE articles
+    var btn = document.querySelector('.show-more-btn');
+    if (btn) {
+        var overflow = matchCount - MAX_VISIBLE;
+        if (overflow > 0) {
+            btn.style.display = '';
+            btn.setAttribute('data-expanded', 'false');
+            btn.setAttribute('data-show-text', 'Show ' + overflow + ' more');
+            btn.setAttribute('data-hide-text', 'Show fewer');
+            btn.textContent = 'Show ' + overflow + ' more';
+            btn.setAttribute('data-tab', cat);
+        } else {
+            btn.style.display = 'none';
+        }
+    }
+}
+function toggleDetail(row) {
+    var detail = row.nextElementSibling;
+    if (detail && detail.classList.contains('article-detail')) {
+        var isOpen = detail.classList.contains('open');
+        detail.classList.toggle('open');
+        row.classList.toggle('expanded');
+    }
+}
+function toggleMore(btn) {
+    var showing = btn.getAttribute('data-expanded') === 'true';
+    var hidden = document.querySelectorAll('.article-row.tab-hidden');
+    hidden.forEach(function(el) {
+        if (showing) {
+            el.style.display = 'none';
+            // Collapse any open detail panels
+            var next = el.nextElementSibling;
+            if (next && next.classList.contains('article-detail')) {
+                next.classList.remove('open');
+                el.classList.remove('expanded');
+            }
+        } else {
+            el.style.removeProperty('display');
+        }
+    });
+    btn.setAttribute('data-expanded', showing ? 'false' : 'true');
+    btn.textContent = showing ? btn.getAttribute('data-show-text') : btn.getAttribute('data-hide-text');
+}
+// Apply overflow logic on initial page load
+(function() {
+    var activeBtn = document.querySelector('.tab-btn.active');
+    if (activeBtn) switchTab(activeBtn.getAttribute('data-tab'));
+})();
+
+// ── Client-side article search filter ──
+function filterArticles(query) {
+    var q = query.toLowerCase().trim();
+    var rows = document.querySelectorAll('.article-row');
+    var details = document.querySelectorAll('.article-detail');
+    var btn = document.querySelector('.show-more-btn');
+    var clearBtn = document.getElementById('clear-search');
+
+    if (clearBtn) clearBtn.style.display = q ? '' : 'none';
+
+    if (!q) {
+        // Re-apply current tab filter
+        var activeBtn = document.querySelector('.tab-btn.active');
+        if (activeBtn) switchTab(activeBtn.getAttribute('data-tab'));
+        return;
+    }
+
+    // Hide show-more button during search
+    if (btn) btn.style.display = 'none';
+
+    var matchCount = 0;
+    rows.forEach(function(r, i) {
+        var title = (r.getAttribute('data-title') || '').toLowerCase();
+        var univ = (r.getAttribute('data-university') || '').toLowerCase();
+        var summary = (r.getAttribute('data-summary') || '').toLowerCase();
+        var topics = (r.getAttribute('data-topics') || '').toLowerCase();
+        var haystack = title + ' ' + univ + ' ' + summary + ' ' + topics;
+        var match = haystack.indexOf(q) !== -1;
+
+        r.style.display = match ? '' : 'none';
+        r.classList.remove('tab-hidden');
+        if (!match) r.classList.remove('expanded');
+        if (match) matchCount++;
+
+        // Also hide/show corresponding detail panel
+        var detail = r.nextElementSibling;
+        if (detail && detail.classList.contains('article-detail')) {
+            if (!match) {
+                detail.classList.remove('open');
+                detail.style.display = 'none';
+            } else {
+                detail.style.removeProperty('display');
+            }
+        }
+    });
+
+    // Also hide Top News section during search
+    var topSection = document.getElementById('top-news-section');
+    if (topSection) topSection.classList.remove('active');
+    var articleList = document.querySelector('.article-list');
+    if (articleList) articleList.style.removeProperty('display');
+}
+
+function clearSearch() {
+    var input = document.getElementById('article-search');
+    if (input) { input.value = ''; input.focus(); }
+    filterArticles('');
+}
+
+(function() {
+    var input = document.getElementById('article-search');
+    if (!input) return;
+    var timer;
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        timer = setTimeout(function() { filterArticles(input.value); }, 150);
+    });
+})();
+</script>'''
+
+_PAGEFIND_JS = '''<script>
+window.addEventListener('DOMContentLoaded', function() {
+    if (typeof PagefindUI === 'undefined') return;
+    new PagefindUI({
+        element: "#search",
+        showSubResults: false,
+        showImages: false,
+        pageSize: 15,
+        excerptLength: 40,
+        openFilters: ["category"],
+        showEmptyFilters: false,
+        translations: {
+            placeholder: "Search AI news articles...",
+            zero_results: "No articles found for [SEARCH_TERM]"
+        },
+        processResult: function(result) {
+            if (result.meta && result.meta.url) {
+                result.url = result.meta.url;
+            }
+            return result;
+        }
+    });
+});
+function searchTopic(pill) {
+    var input = document.querySelector('.pagefind-ui--input');
+    if (input) {
+        input.value = pill.textContent;
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+    }
+}
+</script>'''
+
+# Day/month names for archive rows, resolved once instead of per row
+_DAY_ABBR = tuple(calendar.day_abbr)
+_MONTH_ABBR = tuple(calendar.month_abbr)
+_MONTH_NAME = tuple(calendar.month_name)
+
+# Article-count markers in generated daily reports (searched as raw bytes)
+_REPORT_HEAD_BYTES = 32768
+_RE_TOTAL_ARTICLES_ATTR = re.compile(rb'data-total-articles="(\d+)"')
+_RE_TOTAL_ARTICLES_TEXT = re.compile(rb'<strong>Total Articles:</strong>\s*(\d+)')
+
+
+class _PageTemplate:
+    """A string.Template page source pre-split into literal text and slots.
+
+    The placeholder scan runs once at import; substitute() then fills the
+    slots and does a single str.join, instead of re-running the Template
+    regex over the whole page on every render.
+    """
+
+    def __init__(self, source: str = ''):
+        self._chunks = ['']
+        self._slots = []
+        last = 0
+        for match in string.Template.pattern.finditer(source):
+            self._add_text(source[last:match.start()])
+            last = match.end()
+            if match.group('escaped') is not None:
+                self._add_text('$')
+                continue
+            name = match.group('named') or match.group('braced')
+            if name is None:
+                raise ValueError(f"Invalid placeholder in page template at offset {match.start()}")
+            self._add_slot(name)
+        self._add_text(source[last:])
+
+    def _add_text(self, text: str):
+        self._chunks[-1] += text
+
+    def _add_slot(self, name: str):
+        self._slots.append((len(self._chunks), name))
+        self._chunks.extend(('', ''))
+
+    def partial(self, **values) -> '_PageTemplate':
+        """Return a copy with the given slots baked into the literal text"""
+        template = _PageTemplate()
+        slot_names = dict(self._slots)
+        for index, chunk in enumerate(self._chunks):
+            name = slot_names.get(index)
+            if name is None:
+                template._add_text(chunk)
+            elif name in values:
+                template._add_text(str(values[name]))
             else:
-                # Archive file for past date
-                html = self._render_main_page(articles, date, is_archive_page=True)
-                gh_archive_dir = self.github_pages_dir / "archive"
-                gh_archive_dir.mkdir(exist_ok=True)
-                gh_output_file = gh_archive_dir / f"{date.strftime('%Y-%m-%d')}.html"
-                gh_output_file.write_text(html, encoding='utf-8')
+                template._add_slot(name)
+        return template
+
+    def substitute(self, **values) -> str:
+        parts = self._chunks[:]
+        for index, name in self._slots:
+            parts[index] = str(values[name])
+        return ''.join(parts)
+
+
+_MAIN_PAGE_TEMPLATE = _PageTemplate('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AI University News - $date_str</title>
+    $favicon
+    $fonts
+    <link rel="stylesheet" href="${prefix}styles/base.css">
+    <link rel="stylesheet" href="${prefix}styles/main.css">
+</head>
+<body>
+$header_html
+
+    $articles_html
+
+$footer_html
+$page_js
+</body>
+</html>''')
+
+_ARCHIVE_PAGE_TEMPLATE = _PageTemplate('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Archive - AI University News</title>
+    $favicon
+    $fonts
+    <link href="../pagefind/pagefind-ui.css" rel="stylesheet">
+    <link rel="stylesheet" href="../styles/base.css">
+    <link rel="stylesheet" href="../styles/archive.css">
+</head>
+<body>
+$header_html
+
+    $search_section
+    $groups_html
+
+$footer_html
+<script src="../pagefind/pagefind-ui.js"></script>
+$pagefind_js
+</body>
+</html>''')
+
+_HOW_IT_WORKS_TEMPLATE = _PageTemplate('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>How It Works - AI University News</title>
+    $favicon
+    $fonts
+    <link rel="stylesheet" href="styles/base.css">
+    <link rel="stylesheet" href="styles/how_it_works.css">
+</head>
+<body>
+$header_html
+
+    <div class="content">
+        <h2>Overview</h2>
+        <p>
+            AI University News is an automated web crawler that monitors press releases and news articles from
+            top universities, national laboratories, and research institutions worldwide, focusing specifically on
+            AI-related research and developments. The system runs daily to discover, analyze, and report the latest
+            AI breakthroughs from academia and research labs.
+        </p>
+
+        <div class="highlight-box">
+            <strong>What makes this unique:</strong> Unlike general news aggregators, this crawler specifically
+            targets university press offices and applies multi-AI analysis to identify truly significant AI research,
+            filtering out noise and delivering high-quality, relevant content.
+        </div>
+
+        <h2>How the Crawler Works</h2>
+
+        <h3>Phase 1: Discovery &amp; Crawling</h3>
+        <p>
+            The crawler visits official news and press release pages from:
+        </p>
+        <ul>
+            <li><strong>Peer Institutions:</strong> Top-tier research universities (MIT, Stanford, Carnegie Mellon, etc.)</li>
+            <li><strong>R1 Universities:</strong> All Carnegie R1 research universities across the United States</li>
+            <li><strong>HPC &amp; Research Centers:</strong> NSF supercomputing centers and DOE computing facilities (TACC, SDSC, NERSC, etc.)</li>
+            <li><strong>National Laboratories:</strong> DOE labs, federal research labs, and FFRDCs (Argonne, DARPA, MITRE, etc.)</li>
+            <li><strong>Global Institutions:</strong> Leading international universities and research organizations (Oxford, ETH Zurich, Tsinghua, etc.)</li>
+        </ul>
+        <p>
+            Using the Scrapy framework, the system respectfully crawls these sites following robots.txt rules,
+            implementing politeness delays between requests, and using proper identification.
+        </p>
+
+        <h3>Phase 2: Content Extraction</h3>
+        <p>
+            When new articles are discovered, the crawler uses Trafilatura (a state-of-the-art content extraction
+            library) to extract clean article text, metadata, publication dates, and author information with
+            95%+ accuracy.
+        </p>
+
+        <h3>Phase 3: Deduplication</h3>
+        <p>
+            The system maintains a PostgreSQL database tracking every URL and content hash to ensure:
+        </p>
+        <ul>
+            <li>No duplicate URLs are processed</li>
+            <li>Updated articles are detected through content hash comparison</li>
+            <li>Fast O(1) lookups using SHA-256 hashing</li>
+        </ul>
+
+        <h3>Phase 4: AI Analysis</h3>
+        <p>
+            This is where the magic happens. Each new article is analyzed by Claude (Sonnet 4.6),
+            Anthropic's frontier model for deep research understanding. Articles are classified by
+            relevance, key topics are extracted, summaries are generated, and confidence scores
+            are assigned.
+        </p>
+
+        <h3>Phase 5: Categorization &amp; Organization</h3>
+        <p>
+            Articles are automatically organized into five categories:
+        </p>
+        <ul>
+            <li><strong>Peer Institutions:</strong> Elite research universities with the highest AI research output</li>
+            <li><strong>R1 Institutions:</strong> All US Carnegie R1 research universities</li>
+            <li><strong>HPC &amp; Research Centers:</strong> NSF supercomputing centers and DOE computing facilities</li>
+            <li><strong>National Laboratories:</strong> DOE national labs, federal government research labs, and FFRDCs</li>
+            <li><strong>Global Institutions:</strong> Leading international universities and research organizations</li>
+        </ul>
+
+        <h3>Phase 6: Publishing</h3>
+        <p>
+            The crawler automatically generates this website with:
+        </p>
+        <ul>
+            <li><strong>Today's Page:</strong> Latest articles from the past 3 days</li>
+            <li><strong>Archive:</strong> Historical daily reports accessible by date</li>
+            <li><strong>Five-Column Layout:</strong> Easy browsing by institution category</li>
+        </ul>
+        <p>
+            Results can also be delivered via Slack webhooks and email notifications for real-time updates.
+        </p>
+
+        <h2>Technical Architecture</h2>
+
+        <h3>Technology Stack</h3>
+        <ul>
+            <li><strong>Language:</strong> Python 3.11+</li>
+            <li><strong>Crawling:</strong> Scrapy 2.11+ with custom spiders</li>
+            <li><strong>Content Extraction:</strong> Trafilatura 2.0+ with htmldate</li>
+            <li><strong>Database:</strong> PostgreSQL 15+ for metadata and tracking</li>
+            <li><strong>AI APIs:</strong> Anthropic Claude (Sonnet 4.6)</li>
+            <li><strong>Deployment:</strong> Systemd service with daily automated runs</li>
+        </ul>
+
+        <h3>Ethical Crawling</h3>
+        <p>
+            This crawler follows web crawling best practices:
+        </p>
+        <ul>
+            <li>Always respects robots.txt directives</li>
+            <li>Implements per-domain rate limiting (1 request/second default)</li>
+            <li>Uses descriptive User-Agent with contact information</li>
+            <li>Implements exponential backoff for failed requests</li>
+            <li>Never attempts to bypass access controls or paywalls</li>
+        </ul>
+
+        <h2>Cost &amp; Efficiency</h2>
+        <p>
+            The system is designed to be cost-effective:
+        </p>
+        <ul>
+            <li><strong>Estimated monthly cost:</strong> ~$$36/month for AI API usage (100 articles/day)</li>
+            <li><strong>Optimization:</strong> Claude Sonnet 4.6 handles all analysis in a single pass, minimizing redundant API calls</li>
+            <li><strong>Caching:</strong> All AI responses stored to avoid reprocessing</li>
+            <li><strong>Smart limits:</strong> Token limits and max articles per run prevent runaway costs</li>
+        </ul>
+
+        <h2>Source Code</h2>
+        <p>
+            This is an open-source project. The complete source code, documentation, and deployment guides
+            are available on GitHub. The system is designed as a standalone Linux application that can be
+            deployed on any server with Python 3.11+ and PostgreSQL.
+        </p>
+
+        $sources_section
+
+        <h2>Updates &amp; Schedule</h2>
+        <p>
+            The crawler runs automatically once per day (typically early morning UTC) and this website updates
+            immediately after each run completes. The archive preserves all historical daily reports for
+            research and trend analysis.
+        </p>
+    </div>
+
+$footer_html
+</body>
+</html>''')
+
+
+class HTMLReportGenerator:
+    """Generates Drudge Report-style HTML pages for crawl results"""
+
+    # Days of publications shown on each daily report
+    REPORT_WINDOW_DAYS = 5
+
+    _NAME_OVERRIDES = {
+        # Hostnames that slip through as display names
+        "stories.tamu.edu": "Texas A&M University",
+        "tamu.edu": "Texas A&M University",
+        "usf.edu": "University of South Florida",
+        "nist.gov": "NIST",
+        # Blog/publication names
+        "The Brink": "Boston University",
+        # CamelCase concatenations
+        "Universityofri": "University of Rhode Island",
+        "FloridaAtlantic": "Florida Atlantic University",
+        "UMassLowell": "UMass Lowell",
+        # Post-cleanup matches (after suffix stripping)
+        "Notre Dame": "University of Notre Dame",
+    }
+
+    def __init__(self, output_dir: str = "html_output", github_pages_dir: str = None, editorial_picks=None):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Optional separate output for GitHub Pages
+        self.github_pages_dir = Path(github_pages_dir) if github_pages_dir else None
+        if self.github_pages_dir:
+            self.github_pages_dir.mkdir(parents=True, exist_ok=True)
+
+        self.editorial_picks = editorial_picks or []
+        self._styles_written = False
+        self.classifier = get_classifier()
+        self._config_cache = {}
+        self._sources_cache = None
+        self._hiw_mtimes = None
+        self._hiw_sources_html = None
+        self._hiw_template = None
+        self._source_count = self._count_sources()
+
+    def _load_config(self, filename: str) -> dict:
+        """Parse a config JSON file once per generator instance"""
+        data = self._config_cache.get(filename)
+        if data is None:
+            data = load_json(_CONFIG_DIR / filename)
+            self._config_cache[filename] = data
+        return data
+
+    def _count_sources(self) -> int:
+        """Count total monitored sources from config files"""
+        count = 0
+        for filename, key in [
+            ('peer_institutions.json', 'universities'),
+            ('r1_universities.json', 'universities'),
+            ('major_facilities.json', 'facilities'),
+            ('national_laboratories.json', 'facilities'),
+            ('global_institutions.json', 'universities'),
+        ]:
+            try:
+                count += len(self._load_config(filename).get(key, []))
+            except Exception:
+                pass
+        return count
+
+    @staticmethod
+    def strip_markdown(text: str) -> str:
+        """Strip markdown formatting and structured data from text, returning clean plain text"""
+        if not text:
+            return ""
+
+        # Fast path: plain text with no markdown/HTML metacharacters only needs
+        # whitespace cleanup, so skip the substitution cascade below
+        if not _MD_SENTINEL_RE.search(text):
+            return _WHITESPACE_RE.sub(' ', text).strip()
+
+        # Remove code blocks (triple backticks) - everything between ```
+        text = re.sub(r'```[a-zA-Z]*\n?.*?```', '', text, flags=re.DOTALL)
+        text = re.sub(r'```', '', text)
+
+        # Handle structured list formatting like [**Key**: Description, **Key2**: Description]
+        # Extract title (before the bracket) and first description only
+        match = re.match(r'^([^\[]+)\s*\[', text)
+        if match:
+            # Keep just the title text before the structured list
+            text = match.group(1).strip()
+        else:
+            # If no structured list, process normally
+            # Remove square brackets but keep content
+            text = re.sub(r'[\[\]]', '', text)
+
+        # Remove markdown links [text](url) -> text
+        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+
+        # Remove bold **text** or __text__ -> text
+        text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
+        text = re.sub(r'__([^_]+)__', r'\1', text)
+
+        # Remove italics *text* or _text_ -> text
+        text = re.sub(r'\*([^\*]+)\*', r'\1', text)
+        text = re.sub(r'_([^_]+)_', r'\1', text)
+
+        # Remove inline code `text` -> text
+        text = re.sub(r'`([^`]+)`', r'\1', text)
+
+        # Remove headers ### text -> text
+        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+
+        # Remove horizontal rules
+        text = re.sub(r'^[-*_]{3,}$', '', text, flags=re.MULTILINE)
+
+        # Remove HTML tags
+        text = re.sub(r'<[^>]+>', '', text)
+
+        # Clean up extra whitespace
+        text = re.sub(r'\s+', ' ', text)
+
+        return text.strip()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _strip_markdown_cached(text: str) -> str:
+        """Memoized strip_markdown; topics and summaries recur across articles"""
+        return HTMLReportGenerator.strip_markdown(text)
+
+    @staticmethod
+    def clean_university_name(name: str) -> str:
+        """Clean raw university names for display.
+
+        Handles hostnames, CamelCase concatenations, blog names, and noisy suffixes.
+        """
+        if not name:
+            return "Unknown"
+
+        # Check explicit overrides first
+        if name in HTMLReportGenerator._NAME_OVERRIDES:
+            return HTMLReportGenerator._NAME_OVERRIDES[name]
+
+        # Strip pipe-delimited suffixes: "University of Central Florida News | UCF Today" -> "University of Central Florida News"
+        if ' | ' in name:
+            name = name.split(' | ')[0].strip()
+
+        # Strip common suffixes
+        for suffix in [' News', ' Today', ' Newsroom', ' Stories']:
+            if name.endswith(suffix):
+                name = name[:-len(suffix)].strip()
+
+        # Check overrides again after cleanup
+        if name in HTMLReportGenerator._NAME_OVERRIDES:
+            return HTMLReportGenerator._NAME_OVERRIDES[name]
+
+        # Handle bare hostnames (contain dots with a TLD)
+        if re.match(r'^[\w.-]+\.(edu|gov|org|com)$', name):
+            clean = re.sub(r'\.(edu|gov|org|com)$', '', name)
+            parts = clean.split('.')
+            readable = parts[-1] if parts else clean
+            return readable.replace('-', ' ').replace('_', ' ').title()
+
+        # Fix CamelCase concatenation: "FloridaAtlantic" -> "Florida Atlantic"
+        if re.search(r'[a-z][A-Z]', name):
+            name = re.sub(r'([a-z])([A-Z])', r'\1 \2', name)
+
+        return name.strip() or "Unknown"
+
+    # ── Favicon ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _get_favicon_link() -> str:
+        return "<link rel=\"icon\" href=\"data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>&#x1F393;</text></svg>\">"
+
+    # ── CSS Helpers ────────────────────────────────────────────────────────
+    # These return the module-level constants so the CSS is built only once.
+
+    @staticmethod
+    def _get_base_css() -> str:
+        """CSS custom properties, reset, header, nav, footer, focus states"""
+        return _BASE_CSS
+
+    @staticmethod
+    def _get_main_page_css() -> str:
+        """Tab bar, article rows, expand panels, show-more, responsive"""
+        return _MAIN_PAGE_CSS
+
+    @staticmethod
+    def _get_archive_page_css() -> str:
+        """Monthly groupings, bar chart rows, responsive"""
+        return _ARCHIVE_PAGE_CSS
+
+    @staticmethod
+    def _get_how_it_works_css() -> str:
+        """Content typography, highlight box, details/summary, source lists"""
+        return _HOW_IT_WORKS_CSS
+
+    # ── External Stylesheets ───────────────────────────────────────────────
+    # Pages link to styles/*.css instead of inlining the same CSS in every
+    # report; the files are (re)written at most once per generator instance.
+
+    def _get_stylesheets(self) -> Dict[str, str]:
+        return {
+            'base.css': self._get_base_css(),
+            'main.css': self._get_main_page_css(),
+            'archive.css': self._get_archive_page_css() + _PAGEFIND_CSS,
+            'how_it_works.css': self._get_how_it_works_css(),
+        }
+
+    def _ensure_styles(self):
+        """Write the shared stylesheets into each output directory if missing or stale"""
+        if self._styles_written:
+            return
+        stylesheets = {
+            name: (textwrap.dedent(css).strip() + '\n').encode('utf-8')
+            for name, css in self._get_stylesheets().items()
+        }
+        for base_dir in [self.output_dir, self.github_pages_dir]:
+            if base_dir is None:
+                continue
+            styles_dir = base_dir / "styles"
+            styles_dir.mkdir(exist_ok=True)
+            for name, payload in stylesheets.items():
+                css_file = styles_dir / name
+                if not css_file.exists() or css_file.read_bytes() != payload:
+                    css_file.write_bytes(payload)
+        self._styles_written = True
+
+    # ── HTML Component Helpers ─────────────────────────────────────────────
+
+    def _render_header(self, title: str, meta_text: str = None,
+                       active_page: str = None, is_archive: bool = False) -> str:
+        """Compact single-row header with title left, meta + nav right"""
+        if is_archive:
+            urls = {"today": "../index.html", "archive": "index.html", "how_it_works": "../how_it_works.html"}
+        else:
+            urls = {"today": "index.html", "archive": "archive/index.html", "how_it_works": "how_it_works.html"}
+
+        def cls(page):
+            return ' class="active"' if page == active_page else ''
+
+        meta_html = f'<span class="header-meta">{meta_text}</span>' if meta_text else ''
+
+        return f'''    <div class="header">
+        <h1>{title}</h1>
+        <div class="header-right">
+            {meta_html}
+            <span class="header-nav">
+                <a href="{urls['today']}"{cls('today')}>Today</a>
+                &middot;
+                <a href="{urls['archive']}"{cls('archive')}>Archive</a>
+                &middot;
+                <a href="{urls['how_it_works']}"{cls('how_it_works')}>How It Works</a>
+            </span>
+        </div>
+    </div>'''
+
+    def _render_footer(self, is_archive: bool = False, timestamp: str = None) -> str:
+        if is_archive:
+            urls = {"today": "../index.html", "archive": "index.html", "how_it_works": "../how_it_works.html"}
+        else:
+            urls = {"today": "index.html", "archive": "archive/index.html", "how_it_works": "how_it_works.html"}
+
+        ts = timestamp or datetime.now().strftime('%I:%M %p')
+
+        return f'''
+    <div class="footer">
+        <a href="{urls['today']}">Today</a> &middot;
+        <a href="{urls['archive']}">Archive</a> &middot;
+        <a href="{urls['how_it_works']}">How It Works</a> &middot;
+        <a href="https://github.com/tyson-swetnam/webcrawler" target="_blank">GitHub</a>
+        &nbsp;|&nbsp; {self._source_count} sources &middot; Updated {ts}
+    </div>'''
+
+    # ── Public Generation Methods ──────────────────────────────────────────
+
+    def generate_daily_report(self, date: Optional[datetime] = None) -> str:
+        """Generate HTML report for a specific date (default: today)"""
+        if date is None:
+            date = datetime.now()
 
-        return str(output_file)
+        with get_db() as session:
+            articles = self._fetch_articles_for_date(session, date)
+
+        return self._write_daily_report(articles, date)
+
+    def generate_range(self, start: datetime, end: datetime, max_workers: Optional[int] = None) -> List[str]:
+        """Generate daily reports for every date from start to end (inclusive)"""
+        dates = []
+        day = start.date()
+        while day <= end.date():
+            dates.append(datetime.combine(day, datetime.min.time()))
+            day += timedelta(days=1)
+        return self.generate_dates(dates, max_workers=max_workers)
+
+    def generate_dates(self, dates: List[datetime], max_workers: Optional[int] = None) -> List[str]:
+        """Generate daily reports for many dates, e.g. an archive backfill.
+
+        Issues a single query over the union of the per-date windows and buckets
+        the rows in Python, instead of one query per date. Rendering is CPU-bound
+        and independent per date, so multiple dates are rendered and written in a
+        process pool (max_workers defaults to the CPU count; 1 keeps it serial).
+        """
+        if not dates:
+            return []
+
+        with get_db() as session:
+            rows = self._fetch_articles_for_range(session, min(dates), max(dates))
+
+        rows_by_day = defaultdict(list)
+        for row in rows:
+            rows_by_day[row.published_date].append(row)
+
+        jobs = []
+        for date in dates:
+            # published_date is a DATE, so the window's lower bound
+            # (day - 5 at 23:59:59) admits the five days ending on `day`
+            window_rows = []
+            for offset in range(self.REPORT_WINDOW_DAYS):
+                window_rows.extend(rows_by_day.get(date.date() - timedelta(days=offset), ()))
+            jobs.append((self._rows_to_articles(window_rows), date))
+
+        self._ensure_styles()
+        if len(jobs) == 1 or max_workers == 1:
+            written = [self._write_report_pages(articles, date) for articles, date in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(),
+                                     initializer=_init_report_worker, initargs=(self,)) as pool:
+                written = list(pool.map(_write_report_pages_in_worker, *zip(*jobs)))
+
+        # Sidecar counts are updated here, once, rather than concurrently by workers
+        self._record_archive_counts({date.strftime('%Y-%m-%d'): len(articles) for articles, date in jobs})
+
+        return written
+
+    def _write_daily_report(self, articles: List[Dict], date: datetime) -> str:
+        """Render and write the report files for one date"""
+        self._ensure_styles()
+        output_file = self._write_report_pages(articles, date)
+        self._record_archive_counts({date.strftime('%Y-%m-%d'): len(articles)})
+        return output_file
+
+    def _write_report_pages(self, articles: List[Dict], date: datetime) -> str:
+        """Render and write the HTML pages for one date. Returns the primary output path."""
+        is_today = date.date() == datetime.now().date()
+        date_filename = f"{date.strftime('%Y-%m-%d')}.html"
+
+        # Render each page variant once and reuse the encoded bytes for every
+        # output directory. The dated archive copy uses ../ relative paths; the
+        # root index.html for the current day does not.
+        archive_payload = self._render_main_page(articles, date, is_archive_page=True).encode('utf-8')
+        main_payload = None
+        if is_today:
+            main_payload = self._render_main_page(articles, date, is_archive_page=False).encode('utf-8')
+
+        # Write to output_dir, then mirror into the GitHub Pages directory if configured
+        archive_src = main_src = None
+        for base_dir in [self.output_dir, self.github_pages_dir]:
+            if base_dir is None:
+                continue
+            archive_dir = base_dir / "archive"
+            archive_dir.mkdir(exist_ok=True)
+            archive_src = self._write_or_mirror(archive_dir / date_filename, archive_payload, archive_src)
+
+            if main_payload is not None:
+                main_src = self._write_or_mirror(base_dir / "index.html", main_payload, main_src)
+
+        return str(main_src or archive_src)
+
+    @staticmethod
+    def _mirror_file(src: Path, dst: Path):
+        """Materialize dst as a copy of src, hardlinking when on the same filesystem"""
+        try:
+            dst.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    def _write_or_mirror(self, dst: Path, payload: bytes, src: Optional[Path]) -> Path:
+        """Write payload to dst, or mirror the already written src. Returns the source file."""
+        if src is None:
+            dst.write_bytes(payload)
+            return dst
+        self._mirror_file(src, dst)
+        return src
+
+    # ── Archive Count Index ────────────────────────────────────────────────
+    # archive/index.json maps each dated report to its article count so the
+    # archive index can be rebuilt without re-reading every report. Each count
+    # is stored with the report's mtime; a report rewritten since (e.g. by a
+    # tool that does not update the sidecar) is rescanned.
+
+    ARCHIVE_COUNTS_FILE = "index.json"
+
+    @classmethod
+    def _load_archive_counts(cls, archive_dir: Path) -> Dict[str, tuple]:
+        """Load the date -> (article count, report mtime_ns) sidecar for an archive directory"""
+        try:
+            data = json.loads((archive_dir / cls.ARCHIVE_COUNTS_FILE).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            date_str: (entry['count'], entry['mtime_ns'])
+            for date_str, entry in data.items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get('count'), int)
+            and isinstance(entry.get('mtime_ns'), int)
+        }
+
+    @classmethod
+    def _save_archive_counts(cls, archive_dir: Path, counts: Dict[str, tuple]):
+        payload = {
+            date_str: {"count": count, "mtime_ns": mtime_ns}
+            for date_str, (count, mtime_ns) in sorted(counts.items())
+        }
+        (archive_dir / cls.ARCHIVE_COUNTS_FILE).write_text(json.dumps(payload, indent=2), encoding='utf-8')
+
+    def _record_archive_counts(self, counts: Dict[str, int]):
+        """Store the article counts of freshly written dated reports"""
+        for base_dir in [self.output_dir, self.github_pages_dir]:
+            if base_dir is None:
+                continue
+            archive_dir = base_dir / "archive"
+            archive_dir.mkdir(exist_ok=True)
+            stored = self._load_archive_counts(archive_dir)
+            for date_str, count in counts.items():
+                try:
+                    mtime_ns = (archive_dir / f"{date_str}.html").stat().st_mtime_ns
+                except OSError:
+                    continue
+                stored[date_str] = (count, mtime_ns)
+            self._save_archive_counts(archive_dir, stored)
 
     def generate_archive_index(self, popular_topics: list = None) -> str:
         """Generate archive index page listing all available dates
@@ -912,47 +1614,76 @@ class HTMLReportGenerator:
             archive_dir = base_dir / "archive"
             if not archive_dir.exists():
                 continue
-            for html_file in archive_dir.glob("20*.html"):
-                date_str = html_file.stem  # e.g., "2025-11-08"
+            counts = self._load_archive_counts(archive_dir)
+            counts_changed = False
+            for date_str, html_path in self._iter_dated_reports(archive_dir):
                 if date_str in archive_files:
                     continue
-                content = html_file.read_text(encoding='utf-8')
-                # Try new format first (data attribute)
-                match = re.search(r'data-total-articles="(\d+)"', content)
-                if not match:
-                    # Try old format (text pattern)
-                    match = re.search(r'<strong>Total Articles:</strong>\s*(\d+)', content)
-                if match:
-                    count = int(match.group(1))
+                mtime_ns = os.stat(html_path).st_mtime_ns
+                cached = counts.get(date_str)
+                if cached is not None and cached[1] == mtime_ns:
+                    count = cached[0]
                 else:
-                    # Fallback: count article divs
-                    count = len(re.findall(r'<div class="article">', content))
+                    # Not in the sidecar index (older report) or rewritten
+                    # since it was recorded: scan the HTML once
+                    count = self._count_articles_in_report(html_path)
+                    counts[date_str] = (count, mtime_ns)
+                    counts_changed = True
 
                 try:
-                    date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
+                    date_obj = datetime.fromisoformat(date_str).date()
                     archive_files[date_str] = (date_obj, count)
                 except ValueError:
                     pass  # Skip invalid date formats
+            if counts_changed:
+                self._save_archive_counts(archive_dir, counts)
 
         # Sort by date descending
         dates = sorted(archive_files.values(), key=lambda x: x[0], reverse=True)
 
-        html = self._render_archive_page(dates, popular_topics=popular_topics or [])
+        self._ensure_styles()
+        payload = self._render_archive_page(dates, popular_topics=popular_topics or []).encode('utf-8')
 
         archive_dir = self.output_dir / "archive"
         archive_dir.mkdir(exist_ok=True)
         output_file = archive_dir / "index.html"
-        output_file.write_text(html, encoding='utf-8')
+        output_file.write_bytes(payload)
 
-        # Also write to GitHub Pages directory if configured
+        # Also mirror to GitHub Pages directory if configured
         if self.github_pages_dir:
             gh_archive_dir = self.github_pages_dir / "archive"
             gh_archive_dir.mkdir(exist_ok=True)
-            gh_output_file = gh_archive_dir / "index.html"
-            gh_output_file.write_text(html, encoding='utf-8')
+            self._mirror_file(output_file, gh_archive_dir / "index.html")
 
         return str(output_file)
 
+    @staticmethod
+    def _iter_dated_reports(archive_dir: Path):
+        """Yield (date_str, path) for each dated report (e.g. 2025-11-08.html) in archive_dir"""
+        with os.scandir(archive_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith('20') and name.endswith('.html'):
+                    yield name[:-5], entry.path
+
+    @staticmethod
+    def _count_articles_in_report(html_path: str) -> int:
+        """Extract the article count from a generated daily report.
+
+        The count marker sits in the page header, so only the first
+        _REPORT_HEAD_BYTES are read; the whole file is read only for very old
+        reports that lack the marker.
+        """
+        with open(html_path, 'rb') as fh:
+            head = fh.read(_REPORT_HEAD_BYTES)
+            # Try new format first (data attribute), then old format (text pattern)
+            match = _RE_TOTAL_ARTICLES_ATTR.search(head) or _RE_TOTAL_ARTICLES_TEXT.search(head)
+            if match:
+                return int(match.group(1))
+            # Fallback: count article divs
+            content = head + fh.read()
+        return content.count(b'<div class="article">')
+
     def generate_search_stubs(self, staging_dir: str) -> tuple:
         """Generate lightweight per-article HTML stubs for Pagefind indexing.
 
@@ -986,9 +1717,9 @@ class HTMLReportGenerator:
         summary_re = re.compile(r'<div class="summary">([^<]*(?:<[^/][^<]*)*?)</div>')
         topic_pill_re = re.compile(r'<span class="topic-pill">([^<]+)</span>')
 
-        for html_file in sorted(archive_dir.glob("20*.html")):
-            date_str = html_file.stem  # e.g. "2026-03-07"
-            content = html_file.read_text(encoding='utf-8')
+        for date_str, html_path in sorted(self._iter_dated_reports(archive_dir)):
+            with open(html_path, encoding='utf-8') as f:
+                content = f.read()
 
             for m in article_block_re.finditer(content):
                 cat = html_mod.unescape(m.group(1))
@@ -1002,7 +1733,7 @@ class HTMLReportGenerator:
                 sm = summary_re.search(detail_html)
                 if sm:
                     # Strip any nested tags from summary
-                    summary = re.sub(r'<[^>]+>', '', sm.group(1)).strip()
+                    summary = html_mod.unescape(re.sub(r'<[^>]+>', '', sm.group(1))).strip()
                     if len(summary) > 200:
                         summary = summary[:200].rsplit(' ', 1)[0] + '...'
 
@@ -1045,15 +1776,15 @@ class HTMLReportGenerator:
 
     def generate_how_it_works(self) -> str:
         """Generate 'How It Works' documentation page"""
-        html = self._render_how_it_works_page()
+        self._ensure_styles()
+        payload = self._render_how_it_works_page().encode('utf-8')
 
         output_file = self.output_dir / "how_it_works.html"
-        output_file.write_text(html, encoding='utf-8')
+        output_file.write_bytes(payload)
 
-        # Also write to GitHub Pages directory if configured
+        # Also mirror to GitHub Pages directory if configured
         if self.github_pages_dir:
-            gh_output_file = self.github_pages_dir / "how_it_works.html"
-            gh_output_file.write_text(html, encoding='utf-8')
+            self._mirror_file(output_file, self.github_pages_dir / "how_it_works.html")
 
         return str(output_file)
 
@@ -1061,11 +1792,32 @@ class HTMLReportGenerator:
 
     def _fetch_articles_for_date(self, session: Session, date: datetime) -> List[Dict]:
         """Fetch AI-related articles published in the last 5 days"""
-        end_date = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-        start_date = end_date - timedelta(days=5)
+        return self._rows_to_articles(self._fetch_articles_for_range(session, date, date))
+
+    def _fetch_articles_for_range(self, session: Session, start: datetime, end: datetime) -> List:
+        """Fetch flat article rows covering the report windows of start..end.
+
+        Selects plain columns with the URL joined in, so no ORM objects are
+        built and no per-row lazy load of Article.url is issued.
+        """
+        end_date = end.replace(hour=23, minute=59, second=59, microsecond=999999)
+        start_date = start.replace(hour=23, minute=59, second=59, microsecond=999999) - timedelta(days=self.REPORT_WINDOW_DAYS)
 
         stmt = (
-            select(Article, AIAnalysis)
+            select(
+                Article.article_id,
+                URL.url,
+                Article.title,
+                Article.university_name,
+                Article.first_scraped,
+                Article.published_date,
+                Article.article_metadata,
+                AIAnalysis.consensus_summary,
+                AIAnalysis.claude_key_points,
+                AIAnalysis.openai_category,
+            )
+            .select_from(Article)
+            .join(URL, Article.url_id == URL.url_id)
             .outerjoin(AIAnalysis, Article.article_id == AIAnalysis.article_id)
             .where(
                 and_(
@@ -1077,32 +1829,32 @@ class HTMLReportGenerator:
             .order_by(Article.published_date.desc())
         )
 
-        results = session.execute(stmt).all()
+        return session.execute(stmt).all()
 
+    @staticmethod
+    def _rows_to_articles(rows: List) -> List[Dict]:
+        """Deduplicate article rows by URL and flatten them into dicts"""
         # Deduplicate by URL — keep the most recently scraped version
         seen_urls = {}
-        for article, ai_analysis in results:
-            url = article.url.url if article.url else ''
-            if url in seen_urls:
-                existing = seen_urls[url]
-                if article.first_scraped > existing[0].first_scraped:
-                    seen_urls[url] = (article, ai_analysis)
-            else:
-                seen_urls[url] = (article, ai_analysis)
+        for row in rows:
+            url = row.url or ''
+            existing = seen_urls.get(url)
+            if existing is None or row.first_scraped > existing.first_scraped:
+                seen_urls[url] = row
 
         articles = []
-        for url, (article, ai_analysis) in seen_urls.items():
+        for url, row in seen_urls.items():
             articles.append({
-                'article_id': article.article_id,
+                'article_id': row.article_id,
                 'url': url,
-                'title': article.title or 'Untitled',
-                'university': article.university_name,
-                'timestamp': article.first_scraped,
-                'published_date': article.published_date,
-                'summary': ai_analysis.consensus_summary if ai_analysis else None,
-                'topics': ai_analysis.claude_key_points if ai_analysis else [],
-                'category': ai_analysis.openai_category if ai_analysis else None,
-                'article_metadata': article.article_metadata,
+                'title': row.title or 'Untitled',
+                'university': row.university_name,
+                'timestamp': row.first_scraped,
+                'published_date': row.published_date,
+                'summary': row.consensus_summary,
+                'topics': row.claude_key_points if row.claude_key_points is not None else [],
+                'category': row.openai_category,
+                'article_metadata': row.article_metadata,
             })
 
         # Re-sort by published_date descending (dict iteration lost ordering)
@@ -1151,20 +1903,21 @@ class HTMLReportGenerator:
             impact_cat = pick.get('impact_category', 'Scientific Breakthrough')
             badge_cls = category_class.get(impact_cat, 'scientific')
             display_name = self.clean_university_name(article.get('university') or 'Unknown')
+            esc = html_mod.escape
 
             rows.append(
                 f'<div class="top-article">'
                 f'<div class="top-article-header">'
                 f'<span class="top-rank">{rank}</span>'
                 f'<div class="top-article-info">'
-                f'<a class="top-headline" href="{article["url"]}" target="_blank">{article["title"]}</a>'
+                f'<a class="top-headline" href="{esc(article["url"])}" target="_blank">{esc(article["title"])}</a>'
                 f'<div class="top-article-meta">'
-                f'<span class="impact-badge {badge_cls}">{impact_cat}</span>'
-                f'<span class="top-univ">{display_name}</span>'
+                f'<span class="impact-badge {badge_cls}">{esc(impact_cat)}</span>'
+                f'<span class="top-univ">{esc(display_name)}</span>'
                 f'</div>'
                 f'</div>'
                 f'</div>'
-                f'<div class="editorial-note">{note}</div>'
+                f'<div class="editorial-note">{esc(note)}</div>'
                 f'</div>'
             )
 
@@ -1200,14 +1953,20 @@ class HTMLReportGenerator:
             'global': 'dot-global',
         }
 
+        # Classify and clean each distinct university once; names recur across articles
+        unique_univs = {article['university'] or 'Unknown' for article in articles}
+        category_of = {
+            univ: category_key_map.get(self.classifier.classify(univ), 'r1')
+            for univ in unique_univs
+        }
+        # Display labels are escaped here, once per university rather than per row
+        univ_label_of = {univ: html_mod.escape(self.clean_university_name(univ)) for univ in unique_univs}
+
         # Annotate each article with its category and display name
         annotated = []
         for article in articles:
             univ = article['university'] or 'Unknown'
-            raw_cat = self.classifier.classify(univ)
-            cat = category_key_map.get(raw_cat, 'r1')
-            display_name = self.clean_university_name(univ)
-            annotated.append({**article, '_cat': cat, '_display_univ': display_name})
+            annotated.append({**article, '_cat': category_of[univ], '_univ_label': univ_label_of[univ]})
 
         # Count per category
         counts = {'peer': 0, 'r1': 0, 'hpc': 0, 'lab': 0, 'global': 0}
@@ -1256,99 +2015,99 @@ class HTMLReportGenerator:
         # Build article rows
         MAX_VISIBLE = 25
         article_rows = []
-        row_index = 0
 
-        # For category tabs: group by university within each category
-        # We'll emit all articles in chronological order (already sorted) with data-category
-        # For grouped views, JS handles university subheader visibility
-        # Build a map of university -> articles per category for grouped view
-        cat_univ_map = {}  # cat -> OrderedDict(univ -> [articles])
-        for a in annotated:
-            cat = a['_cat']
-            univ = a['_display_univ']
-            if cat not in cat_univ_map:
-                cat_univ_map[cat] = OrderedDict()
-            if univ not in cat_univ_map[cat]:
-                cat_univ_map[cat][univ] = []
-            cat_univ_map[cat][univ].append(a)
-
-        def render_article_row(article, idx):
+        # Rows are emitted in chronological order (already sorted) with data-category;
+        # JS handles university subheader visibility for grouped views, so no
+        # per-category/university grouping is needed here
+
+        escape = html_mod.escape
+
+        def render_article_row(article, write):
+            """Write one article row and its detail panel straight into the page buffer"""
             cat = article['_cat']
-            display_name = article['_display_univ']
+            univ_label = article['_univ_label']
             dot_cls = dot_class_map.get(cat, 'dot-r1')
-            overflow_cls = ''
+            # Scraped text is escaped once here; the escaped form is valid both
+            # as element text and inside double-quoted attributes
+            url = escape(article['url'])
+            title = escape(article['title'])
 
-            # Short date for the row
-            pub_short = ''
-            if article.get('published_date'):
-                if isinstance(article['published_date'], str):
-                    pub_short = article['published_date']
+            # Short date for the row, full dates for detail
+            published = article.get('published_date')
+            pub_date_long = ''
+            if published:
+                if isinstance(published, str):
+                    pub_short = pub_date_long = escape(published)
                 else:
-                    pub_short = article['published_date'].strftime('%b %d')
+                    # strftime output for these formats never needs escaping
+                    pub_short = published.strftime('%b %d')
+                    pub_date_long = published.strftime('%B %d, %Y')
             else:
                 pub_short = article['timestamp'].strftime('%b %d')
 
             # Detail panel content
             plain_summary = ''
-            summary_html = ''
-            if article.get('summary'):
-                plain_summary = self.strip_markdown(article['summary'])
+            has_summary = bool(article.get('summary'))
+            if has_summary:
+                plain_summary = self._strip_markdown_cached(article['summary'])
                 if len(plain_summary) > 300:
                     plain_summary = plain_summary[:300].rsplit(' ', 1)[0] + '...'
-                summary_html = f'<div class="summary">{plain_summary}</div>'
 
             clean_topics = []
-            topics_html = ''
             if article.get('topics') and isinstance(article['topics'], list):
-                clean_topics = [self.strip_markdown(str(t)) for t in article['topics'][:4] if t]
+                clean_topics = [self._strip_markdown_cached(str(t)) for t in article['topics'][:4] if t]
                 clean_topics = [t for t in clean_topics if t and len(t) < 50]
-                if clean_topics:
-                    pills = ''.join(f'<span class="topic-pill">{t}</span>' for t in clean_topics)
-                    topics_html = f'<div class="topics">{pills}</div>'
-
-            # Full dates for detail
-            pub_date_long = ''
-            if article.get('published_date'):
-                if isinstance(article['published_date'], str):
-                    pub_date_long = article['published_date']
-                else:
-                    pub_date_long = article['published_date'].strftime('%B %d, %Y')
-            crawl_date_long = article['timestamp'].strftime('%B %d, %Y')
-            meta_parts = []
-            if pub_date_long:
-                meta_parts.append(f'Published: {pub_date_long}')
-            meta_parts.append(f'Crawled: {crawl_date_long}')
-            detail_meta = ' &middot; '.join(meta_parts)
 
             # Data attributes for client-side search filtering
-            data_title = html_mod.escape(article['title'], quote=True)
-            data_univ = html_mod.escape(display_name, quote=True)
-            data_summary = html_mod.escape(plain_summary[:200], quote=True)
-            data_topics = html_mod.escape('|'.join(clean_topics), quote=True)
-
-            row_html = (
-                f'<div class="article-row{overflow_cls}" data-category="{cat}" '
-                f'data-title="{data_title}" data-university="{data_univ}" '
-                f'data-summary="{data_summary}" data-topics="{data_topics}" '
-                f'onclick="toggleDetail(this)">'
-                f'<span class="cat-dot {dot_cls}"></span>'
-                f'<a class="headline-link" href="{article["url"]}" target="_blank" onclick="event.stopPropagation()">{article["title"]}</a>'
-                f'<span class="univ-label">{display_name}</span>'
-                f'<span class="date-label">{pub_short}</span>'
-                f'<span class="chevron">&#9654;</span>'
-                f'</div>'
-                f'<div class="article-detail" data-category="{cat}">'
-                f'{summary_html}'
-                f'{topics_html}'
-                f'<div class="detail-meta">{detail_meta}</div>'
-                f'<div class="detail-link"><a href="{article["url"]}" target="_blank">Read full article &rarr;</a></div>'
-                f'</div>'
-            )
-            return row_html
+            write('<div class="article-row" data-category="')
+            write(cat)
+            write('" data-title="')
+            write(title)
+            write('" data-university="')
+            write(univ_label)
+            write('" data-summary="')
+            write(escape(plain_summary[:200]))
+            write('" data-topics="')
+            write(escape('|'.join(clean_topics)))
+            write('" onclick="toggleDetail(this)"><span class="cat-dot ')
+            write(dot_cls)
+            write('"></span><a class="headline-link" href="')
+            write(url)
+            write('" target="_blank" onclick="event.stopPropagation()">')
+            write(title)
+            write('</a><span class="univ-label">')
+            write(univ_label)
+            write('</span><span class="date-label">')
+            write(pub_short)
+            write('</span><span class="chevron">&#9654;</span></div><div class="article-detail" data-category="')
+            write(cat)
+            write('">')
+            if has_summary:
+                write('<div class="summary">')
+                write(escape(plain_summary))
+                write('</div>')
+            if clean_topics:
+                write('<div class="topics">')
+                for t in clean_topics:
+                    write('<span class="topic-pill">')
+                    write(escape(t))
+                    write('</span>')
+                write('</div>')
+            write('<div class="detail-meta">')
+            if pub_date_long:
+                write('Published: ')
+                write(pub_date_long)
+                write(' &middot; ')
+            write('Crawled: ')
+            write(article['timestamp'].strftime('%B %d, %Y'))
+            write('</div><div class="detail-link"><a href="')
+            write(url)
+            write('" target="_blank">Read full article &rarr;</a></div></div>')
 
         # Render flat chronological list (for "All" tab — default view)
-        for idx, article in enumerate(annotated):
-            article_rows.append(render_article_row(article, idx))
+        write = article_rows.append
+        for article in annotated:
+            render_article_row(article, write)
 
         overflow_count = max(0, total - MAX_VISIBLE)
         show_more_html = ''
@@ -1358,234 +2117,42 @@ class HTMLReportGenerator:
                 f'data-expanded="false" data-show-text="Show {overflow_count} more" '
                 f'data-hide-text="Show fewer">'
                 f'Show {overflow_count} more</button>'
-            )
-
-        # Hide article list initially when Top News is the default tab
-        list_hidden = ' style="display:none"' if default_tab == 'top' else ''
-        list_html = f'<div class="article-list"{list_hidden}>' + ''.join(article_rows) + show_more_html + '</div>'
-
-        search_bar_html = (
-            '<div class="search-bar">'
-            '<input type="text" id="article-search" placeholder="Filter articles..." '
-            'autocomplete="off" aria-label="Filter articles on this page">'
-            '<button id="clear-search" class="clear-search-btn" style="display:none" '
-            'onclick="clearSearch()">&times;</button>'
-            '</div>'
-        )
-
-        if not articles:
-            articles_html = '<p class="no-results">No AI-related articles found for this date.</p>'
-        else:
-            articles_html = stats_html + search_bar_html + tab_bar_html + top_news_html + list_html
-
-        base_css = self._get_base_css()
-        main_css = self._get_main_page_css()
-        meta_text = f'{total} articles &middot; {short_date}'
-        header_html = self._render_header("AI University News", meta_text=meta_text, active_page=active_page, is_archive=is_archive_page)
-        footer_html = self._render_footer(is_archive_page)
-        favicon = self._get_favicon_link()
-        fonts = self._get_google_fonts_link()
-
-        # JavaScript — plain string (no f-string) to avoid brace escaping
-        page_js = '''<script>
-function switchTab(cat) {
-    var btns = document.querySelectorAll('.tab-btn');
-    btns.forEach(function(b) { b.classList.toggle('active', b.getAttribute('data-tab') === cat); });
-
-    // Handle Top News section visibility
-    var topSection = document.getElementById('top-news-section');
-    var articleList = document.querySelector('.article-list');
-
-    if (cat === 'top') {
-        if (topSection) topSection.classList.add('active');
-        if (articleList) articleList.style.display = 'none';
-        return;
-    } else {
-        if (topSection) topSection.classList.remove('active');
-        if (articleList) articleList.style.removeProperty('display');
-    }
-
-    var MAX_VISIBLE = 25;
-    var rows = document.querySelectorAll('.article-row');
-    var details = document.querySelectorAll('.article-detail');
-
-    // Count matching articles for this tab
-    var matchCount = 0;
-    rows.forEach(function(r) {
-        if (cat === 'all' || r.getAttribute('data-category') === cat) matchCount++;
-    });
-
-    // Show/hide rows with per-tab overflow logic
-    var visibleIndex = 0;
-    rows.forEach(function(r) {
-        var match = (cat === 'all' || r.getAttribute('data-category') === cat);
-        if (match) {
-            if (matchCount <= MAX_VISIBLE || visibleIndex < MAX_VISIBLE) {
-                r.style.removeProperty('display');
-                r.classList.remove('tab-hidden');
-            } else {
-                r.style.display = 'none';
-                r.classList.add('tab-hidden');
-                r.classList.remove('expanded');
-            }
-            visibleIndex++;
-        } else {
-            r.style.display = 'none';
-            r.classList.remove('expanded');
-            r.classList.remove('tab-hidden');
-        }
-    });
-    details.forEach(function(d) {
-        var match = (cat === 'all' || d.getAttribute('data-category') === cat);
-        if (!match) {
-            d.classList.remove('open');
-            d.style.display = 'none';
-        } else {
-            d.style.removeProperty('display');
-        }
-    });
-
-    // Show-more button: only if this tab has more than MAX_VISIBLE articles
-    var btn = document.querySelector('.show-more-btn');
-    if (btn) {
-        var overflow = matchCount - MAX_VISIBLE;
-        if (overflow > 0) {
-            btn.style.display = '';
-            btn.setAttribute('data-expanded', 'false');
-            btn.setAttribute('data-show-text', 'Show ' + overflow + ' more');
-            btn.setAttribute('data-hide-text', 'Show fewer');
-            btn.textContent = 'Show ' + overflow + ' more';
-            btn.setAttribute('data-tab', cat);
-        } else {
-            btn.style.display = 'none';
-        }
-    }
-}
-function toggleDetail(row) {
-    var detail = row.nextElementSibling;
-    if (detail && detail.classList.contains('article-detail')) {
-        var isOpen = detail.classList.contains('open');
-        detail.classList.toggle('open');
-        row.classList.toggle('expanded');
-    }
-}
-function toggleMore(btn) {
-    var showing = btn.getAttribute('data-expanded') === 'true';
-    var hidden = document.querySelectorAll('.article-row.tab-hidden');
-    hidden.forEach(function(el) {
-        if (showing) {
-            el.style.display = 'none';
-            // Collapse any open detail panels
-            var next = el.nextElementSibling;
-            if (next && next.classList.contains('article-detail')) {
-                next.classList.remove('open');
-                el.classList.remove('expanded');
-            }
-        } else {
-            el.style.removeProperty('display');
-        }
-    });
-    btn.setAttribute('data-expanded', showing ? 'false' : 'true');
-    btn.textContent = showing ? btn.getAttribute('data-show-text') : btn.getAttribute('data-hide-text');
-}
-// Apply overflow logic on initial page load
-(function() {
-    var activeBtn = document.querySelector('.tab-btn.active');
-    if (activeBtn) switchTab(activeBtn.getAttribute('data-tab'));
-})();
-
-// ── Client-side article search filter ──
-function filterArticles(query) {
-    var q = query.toLowerCase().trim();
-    var rows = document.querySelectorAll('.article-row');
-    var details = document.querySelectorAll('.article-detail');
-    var btn = document.querySelector('.show-more-btn');
-    var clearBtn = document.getElementById('clear-search');
-
-    if (clearBtn) clearBtn.style.display = q ? '' : 'none';
-
-    if (!q) {
-        // Re-apply current tab filter
-        var activeBtn = document.querySelector('.tab-btn.active');
-        if (activeBtn) switchTab(activeBtn.getAttribute('data-tab'));
-        return;
-    }
-
-    // Hide show-more button during search
-    if (btn) btn.style.display = 'none';
-
-    var matchCount = 0;
-    rows.forEach(function(r, i) {
-        var title = (r.getAttribute('data-title') || '').toLowerCase();
-        var univ = (r.getAttribute('data-university') || '').toLowerCase();
-        var summary = (r.getAttribute('data-summary') || '').toLowerCase();
-        var topics = (r.getAttribute('data-topics') || '').toLowerCase();
-        var haystack = title + ' ' + univ + ' ' + summary + ' ' + topics;
-        var match = haystack.indexOf(q) !== -1;
-
-        r.style.display = match ? '' : 'none';
-        r.classList.remove('tab-hidden');
-        if (!match) r.classList.remove('expanded');
-        if (match) matchCount++;
-
-        // Also hide/show corresponding detail panel
-        var detail = r.nextElementSibling;
-        if (detail && detail.classList.contains('article-detail')) {
-            if (!match) {
-                detail.classList.remove('open');
-                detail.style.display = 'none';
-            } else {
-                detail.style.removeProperty('display');
-            }
-        }
-    });
-
-    // Also hide Top News section during search
-    var topSection = document.getElementById('top-news-section');
-    if (topSection) topSection.classList.remove('active');
-    var articleList = document.querySelector('.article-list');
-    if (articleList) articleList.style.removeProperty('display');
-}
-
-function clearSearch() {
-    var input = document.getElementById('article-search');
-    if (input) { input.value = ''; input.focus(); }
-    filterArticles('');
-}
-
-(function() {
-    var input = document.getElementById('article-search');
-    if (!input) return;
-    var timer;
-    input.addEventListener('input', function() {
-        clearTimeout(timer);
-        timer = setTimeout(function() { filterArticles(input.value); }, 150);
-    });
-})();
-</script>'''
+            )
 
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI University News - {date_str}</title>
-    {favicon}
-    {fonts}
-    <style>
-    {base_css}
-    {main_css}
-    </style>
-</head>
-<body>
-{header_html}
+        # Hide article list initially when Top News is the default tab
+        list_hidden = ' style="display:none"' if default_tab == 'top' else ''
+        list_html = f'<div class="article-list"{list_hidden}>' + ''.join(article_rows) + show_more_html + '</div>'
+
+        search_bar_html = (
+            '<div class="search-bar">'
+            '<input type="text" id="article-search" placeholder="Filter articles..." '
+            'autocomplete="off" aria-label="Filter articles on this page">'
+            '<button id="clear-search" class="clear-search-btn" style="display:none" '
+            'onclick="clearSearch()">&times;</button>'
+            '</div>'
+        )
 
-    {articles_html}
+        if not articles:
+            articles_html = '<p class="no-results">No AI-related articles found for this date.</p>'
+        else:
+            articles_html = stats_html + search_bar_html + tab_bar_html + top_news_html + list_html
 
-{footer_html}
-{page_js}
-</body>
-</html>'''
+        meta_text = f'{total} articles &middot; {short_date}'
+        header_html = self._render_header("AI University News", meta_text=meta_text, active_page=active_page, is_archive=is_archive_page)
+        footer_html = self._render_footer(is_archive_page)
+        favicon = self._get_favicon_link()
+        fonts = self._get_google_fonts_link()
+
+        return _MAIN_PAGE_TEMPLATE.substitute(
+            date_str=date_str,
+            favicon=favicon,
+            fonts=fonts,
+            prefix='../' if is_archive_page else '',
+            header_html=header_html,
+            articles_html=articles_html,
+            footer_html=footer_html,
+            page_js=_MAIN_PAGE_JS,
+        )
 
     def _render_archive_page(self, dates: List, popular_topics: list = None) -> str:
         """Render archive index page with monthly groups and bar chart"""
@@ -1595,7 +2162,7 @@ function clearSearch() {
 
         for date_obj, count in dates:
             if isinstance(date_obj, str):
-                date_obj = datetime.strptime(date_obj, '%Y-%m-%d').date()
+                date_obj = datetime.fromisoformat(date_obj).date()
             key = (date_obj.year, date_obj.month)
             if key not in monthly_groups:
                 monthly_groups[key] = []
@@ -1605,34 +2172,28 @@ function clearSearch() {
         if not dates:
             groups_html.append('<p class="no-results">No archived reports available</p>')
         else:
+            write = groups_html.append
             for (year, month), entries in monthly_groups.items():
-                month_name = calendar.month_name[month]
-                heading = f"{month_name} {year}"
-
-                rows = []
+                month_abbr = _MONTH_ABBR[month]
+                write(f'''
+            <div class="archive-month">
+                <h2 class="month-heading">{_MONTH_NAME[month]} {year}</h2>
+                ''')
                 for date_obj, count in entries:
-                    filename = f"{date_obj.strftime('%Y-%m-%d')}.html"
-                    short_date = date_obj.strftime('%a, %b %d')
                     bar_width = (count / max_count * 100) if count > 0 else 0
                     row_class = "archive-row" if count > 0 else "archive-row archive-row-empty"
-
-                    rows.append(f'''
-                <a href="{filename}" class="{row_class}">
-                    <span class="archive-date">{short_date}</span>
+                    # Same text as strftime('%Y-%m-%d') / ('%a, %b %d') without a strftime per row
+                    write(f'''
+                <a href="{date_obj.isoformat()}.html" class="{row_class}">
+                    <span class="archive-date">{_DAY_ABBR[date_obj.weekday()]}, {month_abbr} {date_obj.day:02d}</span>
                     <span class="archive-bar-container">
                         <span class="archive-bar" style="width: {bar_width:.1f}%"></span>
                     </span>
                     <span class="archive-count">{count}</span>
                 </a>''')
-
-                groups_html.append(f'''
-            <div class="archive-month">
-                <h2 class="month-heading">{heading}</h2>
-                {''.join(rows)}
+                write('''
             </div>''')
 
-        base_css = self._get_base_css()
-        archive_css = self._get_archive_page_css()
         header_html = self._render_header("AI University News", meta_text="Archive", active_page='archive', is_archive=True)
         footer_html = self._render_footer(is_archive=True)
         favicon = self._get_favicon_link()
@@ -1654,125 +2215,49 @@ function clearSearch() {
         {topics_section}
     </div>'''
 
-        # Pagefind CSS overrides
-        pagefind_css = """
-        /* ── Pagefind UI Overrides ── */
-        :root {
-            --pagefind-ui-scale: 0.9;
-            --pagefind-ui-primary: var(--color-text);
-            --pagefind-ui-text: var(--color-text-secondary);
-            --pagefind-ui-background: var(--color-bg);
-            --pagefind-ui-border: var(--color-border);
-            --pagefind-ui-tag: var(--color-surface-alt);
-            --pagefind-ui-border-width: 1px;
-            --pagefind-ui-border-radius: 6px;
-            --pagefind-ui-font: 'DM Sans', system-ui, sans-serif;
-        }
-        .search-section {
-            margin-bottom: var(--space-xl);
-        }
-        .popular-topics {
-            margin-top: var(--space-sm);
-            display: flex;
-            flex-wrap: wrap;
-            gap: 4px;
-        }
-        .topic-pill-clickable {
-            cursor: pointer;
-            transition: background-color var(--transition-fast);
-        }
-        .topic-pill-clickable:hover {
-            background: var(--color-border);
-        }
-        """
-
-        # Pagefind JS — plain string to avoid f-string brace issues
-        pagefind_js = '''<script>
-window.addEventListener('DOMContentLoaded', function() {
-    if (typeof PagefindUI === 'undefined') return;
-    new PagefindUI({
-        element: "#search",
-        showSubResults: false,
-        showImages: false,
-        pageSize: 15,
-        excerptLength: 40,
-        openFilters: ["category"],
-        showEmptyFilters: false,
-        translations: {
-            placeholder: "Search AI news articles...",
-            zero_results: "No articles found for [SEARCH_TERM]"
-        },
-        processResult: function(result) {
-            if (result.meta && result.meta.url) {
-                result.url = result.meta.url;
-            }
-            return result;
-        }
-    });
-});
-function searchTopic(pill) {
-    var input = document.querySelector('.pagefind-ui--input');
-    if (input) {
-        input.value = pill.textContent;
-        input.dispatchEvent(new Event('input', { bubbles: true }));
-    }
-}
-</script>'''
-
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Archive - AI University News</title>
-    {favicon}
-    {fonts}
-    <link href="../pagefind/pagefind-ui.css" rel="stylesheet">
-    <style>
-    {base_css}
-    {archive_css}
-    {pagefind_css}
-    </style>
-</head>
-<body>
-{header_html}
-
-    {search_section}
-    {''.join(groups_html)}
-
-{footer_html}
-<script src="../pagefind/pagefind-ui.js"></script>
-{pagefind_js}
-</body>
-</html>'''
+        return _ARCHIVE_PAGE_TEMPLATE.substitute(
+            favicon=favicon,
+            fonts=fonts,
+            header_html=header_html,
+            search_section=search_section,
+            groups_html=''.join(groups_html),
+            footer_html=footer_html,
+            pagefind_js=_PAGEFIND_JS,
+        )
 
-    def _render_how_it_works_page(self) -> str:
-        """Render 'How It Works' documentation page"""
-        # Load source lists
-        config_dir = Path(__file__).parent.parent / 'config'
+    def _load_source_lists(self) -> tuple:
+        """Load (name, news URL) lists for each source category, cached on the instance"""
+        if self._sources_cache is not None:
+            return self._sources_cache
 
         def load_names_with_urls(filename, key, name_field='name'):
             """Load institution names and their primary news URLs."""
             try:
-                with open(config_dir / filename, 'r') as f:
-                    data = json.load(f)
-                    results = []
-                    for item in data.get(key, []):
-                        name = item[name_field]
-                        url = ''
-                        news_sources = item.get('news_sources', [])
-                        if news_sources:
-                            url = news_sources[0].get('url', '')
-                        results.append((name, url))
-                    return results
+                data = self._load_config(filename)
+                results = []
+                for item in data.get(key, []):
+                    name = item[name_field]
+                    url = ''
+                    news_sources = item.get('news_sources', [])
+                    if news_sources:
+                        url = news_sources[0].get('url', '')
+                    results.append((name, url))
+                return results
             except Exception:
                 return []
 
-        peer_institutions = load_names_with_urls('peer_institutions.json', 'universities')
-        r1_universities = load_names_with_urls('r1_universities.json', 'universities')
-        hpc_centers = load_names_with_urls('major_facilities.json', 'facilities')
-        national_labs = load_names_with_urls('national_laboratories.json', 'facilities')
-        global_institutions = load_names_with_urls('global_institutions.json', 'universities')
+        self._sources_cache = (
+            load_names_with_urls('peer_institutions.json', 'universities'),
+            load_names_with_urls('r1_universities.json', 'universities'),
+            load_names_with_urls('major_facilities.json', 'facilities'),
+            load_names_with_urls('national_laboratories.json', 'facilities'),
+            load_names_with_urls('global_institutions.json', 'universities'),
+        )
+        return self._sources_cache
+
+    def _render_sources_section(self) -> str:
+        """Render the collapsible complete source list for the How It Works page"""
+        peer_institutions, r1_universities, hpc_centers, national_labs, global_institutions = self._load_source_lists()
 
         # Build source lists HTML
         def build_collapsible_list(title, items, section_id):
@@ -1781,10 +2266,11 @@ function searchTopic(pill) {
 
             def make_li(name, url):
                 if url:
-                    return f'<li><a href="{url}" target="_blank" rel="noopener">{name}</a></li>'
-                return f'<li>{name}</li>'
+                    return ('<li><a href="' + html_mod.escape(url) + '" target="_blank" rel="noopener">'
+                            + html_mod.escape(name) + '</a></li>')
+                return '<li>' + html_mod.escape(name) + '</li>'
 
-            items_html = ''.join([make_li(name, url) for name, url in sorted(items, key=lambda x: x[0])])
+            items_html = ''.join(make_li(name, url) for name, url in sorted(items, key=itemgetter(0)))
             return f'''
                 <details>
                     <summary><strong>{title}</strong> ({len(items)} sources)</summary>
@@ -1796,7 +2282,7 @@ function searchTopic(pill) {
 
         total_sources = len(peer_institutions) + len(r1_universities) + len(hpc_centers) + len(national_labs) + len(global_institutions)
 
-        sources_section = f'''
+        return f'''
         <h2>Complete Source List</h2>
         <p>
             This crawler monitors {total_sources} sources across five categories:
@@ -1811,167 +2297,54 @@ function searchTopic(pill) {
         </div>
         '''
 
-        base_css = self._get_base_css()
-        hiw_css = self._get_how_it_works_css()
-        header_html = self._render_header("AI University News", meta_text="How It Works", active_page='how_it_works', is_archive=False)
-        footer_html = self._render_footer(is_archive=False)
-        favicon = self._get_favicon_link()
-        fonts = self._get_google_fonts_link()
-
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>How It Works - AI University News</title>
-    {favicon}
-    {fonts}
-    <style>
-    {base_css}
-    {hiw_css}
-    </style>
-</head>
-<body>
-{header_html}
-
-    <div class="content">
-        <h2>Overview</h2>
-        <p>
-            AI University News is an automated web crawler that monitors press releases and news articles from
-            top universities, national laboratories, and research institutions worldwide, focusing specifically on
-            AI-related research and developments. The system runs daily to discover, analyze, and report the latest
-            AI breakthroughs from academia and research labs.
-        </p>
-
-        <div class="highlight-box">
-            <strong>What makes this unique:</strong> Unlike general news aggregators, this crawler specifically
-            targets university press offices and applies multi-AI analysis to identify truly significant AI research,
-            filtering out noise and delivering high-quality, relevant content.
-        </div>
-
-        <h2>How the Crawler Works</h2>
-
-        <h3>Phase 1: Discovery &amp; Crawling</h3>
-        <p>
-            The crawler visits official news and press release pages from:
-        </p>
-        <ul>
-            <li><strong>Peer Institutions:</strong> Top-tier research universities (MIT, Stanford, Carnegie Mellon, etc.)</li>
-            <li><strong>R1 Universities:</strong> All Carnegie R1 research universities across the United States</li>
-            <li><strong>HPC &amp; Research Centers:</strong> NSF supercomputing centers and DOE computing facilities (TACC, SDSC, NERSC, etc.)</li>
-            <li><strong>National Laboratories:</strong> DOE labs, federal research labs, and FFRDCs (Argonne, DARPA, MITRE, etc.)</li>
-            <li><strong>Global Institutions:</strong> Leading international universities and research organizations (Oxford, ETH Zurich, Tsinghua, etc.)</li>
-        </ul>
-        <p>
-            Using the Scrapy framework, the system respectfully crawls these sites following robots.txt rules,
-            implementing politeness delays between requests, and using proper identification.
-        </p>
-
-        <h3>Phase 2: Content Extraction</h3>
-        <p>
-            When new articles are discovered, the crawler uses Trafilatura (a state-of-the-art content extraction
-            library) to extract clean article text, metadata, publication dates, and author information with
-            95%+ accuracy.
-        </p>
-
-        <h3>Phase 3: Deduplication</h3>
-        <p>
-            The system maintains a PostgreSQL database tracking every URL and content hash to ensure:
-        </p>
-        <ul>
-            <li>No duplicate URLs are processed</li>
-            <li>Updated articles are detected through content hash comparison</li>
-            <li>Fast O(1) lookups using SHA-256 hashing</li>
-        </ul>
-
-        <h3>Phase 4: AI Analysis</h3>
-        <p>
-            This is where the magic happens. Each new article is analyzed by Claude (Sonnet 4.6),
-            Anthropic's frontier model for deep research understanding. Articles are classified by
-            relevance, key topics are extracted, summaries are generated, and confidence scores
-            are assigned.
-        </p>
-
-        <h3>Phase 5: Categorization &amp; Organization</h3>
-        <p>
-            Articles are automatically organized into five categories:
-        </p>
-        <ul>
-            <li><strong>Peer Institutions:</strong> Elite research universities with the highest AI research output</li>
-            <li><strong>R1 Institutions:</strong> All US Carnegie R1 research universities</li>
-            <li><strong>HPC &amp; Research Centers:</strong> NSF supercomputing centers and DOE computing facilities</li>
-            <li><strong>National Laboratories:</strong> DOE national labs, federal government research labs, and FFRDCs</li>
-            <li><strong>Global Institutions:</strong> Leading international universities and research organizations</li>
-        </ul>
+    def _get_sources_section(self) -> str:
+        """Return the rendered source list, rebuilding it only when a source file changes"""
+        mtimes = []
+        for filename in _SOURCE_LIST_FILES:
+            try:
+                mtimes.append(os.stat(_CONFIG_DIR / filename).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        mtimes = tuple(mtimes)
+
+        if mtimes != self._hiw_mtimes:
+            # Drop parsed copies so the lists are reloaded from the changed files
+            for filename in _SOURCE_LIST_FILES:
+                self._config_cache.pop(filename, None)
+            self._sources_cache = None
+            self._hiw_sources_html = self._render_sources_section()
+            self._hiw_mtimes = mtimes
+        return self._hiw_sources_html
 
-        <h3>Phase 6: Publishing</h3>
-        <p>
-            The crawler automatically generates this website with:
-        </p>
-        <ul>
-            <li><strong>Today's Page:</strong> Latest articles from the past 3 days</li>
-            <li><strong>Archive:</strong> Historical daily reports accessible by date</li>
-            <li><strong>Five-Column Layout:</strong> Easy browsing by institution category</li>
-        </ul>
-        <p>
-            Results can also be delivered via Slack webhooks and email notifications for real-time updates.
-        </p>
+    def _render_how_it_works_page(self) -> str:
+        """Render 'How It Works' documentation page"""
+        if self._hiw_template is None:
+            # Everything but the sources list and the footer timestamp is
+            # fixed, so bake it into the literal text once
+            self._hiw_template = _HOW_IT_WORKS_TEMPLATE.partial(
+                favicon=self._get_favicon_link(),
+                fonts=self._get_google_fonts_link(),
+                header_html=self._render_header("AI University News", meta_text="How It Works", active_page='how_it_works', is_archive=False),
+            )
 
-        <h2>Technical Architecture</h2>
+        return self._hiw_template.substitute(
+            sources_section=self._get_sources_section(),
+            footer_html=self._render_footer(is_archive=False),
+        )
 
-        <h3>Technology Stack</h3>
-        <ul>
-            <li><strong>Language:</strong> Python 3.11+</li>
-            <li><strong>Crawling:</strong> Scrapy 2.11+ with custom spiders</li>
-            <li><strong>Content Extraction:</strong> Trafilatura 2.0+ with htmldate</li>
-            <li><strong>Database:</strong> PostgreSQL 15+ for metadata and tracking</li>
-            <li><strong>AI APIs:</strong> Anthropic Claude (Sonnet 4.6)</li>
-            <li><strong>Deployment:</strong> Systemd service with daily automated runs</li>
-        </ul>
 
-        <h3>Ethical Crawling</h3>
-        <p>
-            This crawler follows web crawling best practices:
-        </p>
-        <ul>
-            <li>Always respects robots.txt directives</li>
-            <li>Implements per-domain rate limiting (1 request/second default)</li>
-            <li>Uses descriptive User-Agent with contact information</li>
-            <li>Implements exponential backoff for failed requests</li>
-            <li>Never attempts to bypass access controls or paywalls</li>
-        </ul>
+# ── Process-pool workers for generate_dates ───────────────────────────────
 
-        <h2>Cost &amp; Efficiency</h2>
-        <p>
-            The system is designed to be cost-effective:
-        </p>
-        <ul>
-            <li><strong>Estimated monthly cost:</strong> ~$36/month for AI API usage (100 articles/day)</li>
-            <li><strong>Optimization:</strong> Claude Sonnet 4.6 handles all analysis in a single pass, minimizing redundant API calls</li>
-            <li><strong>Caching:</strong> All AI responses stored to avoid reprocessing</li>
-            <li><strong>Smart limits:</strong> Token limits and max articles per run prevent runaway costs</li>
-        </ul>
+_worker_generator = None
 
-        <h2>Source Code</h2>
-        <p>
-            This is an open-source project. The complete source code, documentation, and deployment guides
-            are available on GitHub. The system is designed as a standalone Linux application that can be
-            deployed on any server with Python 3.11+ and PostgreSQL.
-        </p>
 
-        {sources_section}
+def _init_report_worker(generator: HTMLReportGenerator):
+    global _worker_generator
+    _worker_generator = generator
 
-        <h2>Updates &amp; Schedule</h2>
-        <p>
-            The crawler runs automatically once per day (typically early morning UTC) and this website updates
-            immediately after each run completes. The archive preserves all historical daily reports for
-            research and trend analysis.
-        </p>
-    </div>
 
-{footer_html}
-</body>
-</html>'''
+def _write_report_pages_in_worker(articles: List[Dict], date: datetime) -> str:
+    return _worker_generator._write_report_pages(articles, date)
 
 
 def generate_all_reports(output_dir: str = "html_output", github_pages_dir: str = None):
@@ -0,0 +1,67 @@
+"""
+JSON loading and dumping helpers.
+
+Uses orjson (a native implementation, several times faster than the stdlib
+module) when it is installed and falls back to the standard json module
+otherwise.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+# Optional faster parser
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document from bytes or text."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+
+    Non-ASCII text is written as-is, non-string dict keys are converted to
+    strings, and any value the encoder does not know (including datetimes) is
+    written as str(value), matching json.dumps(..., ensure_ascii=False,
+    default=str).
+
+    Args:
+        data: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False, default=str
+    ).encode('utf-8')
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    Parse a JSON file.
+
+    The file is read as bytes in a single call and handed to the parser
+    without a text-decoding layer.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    return loads(Path(path).read_bytes())
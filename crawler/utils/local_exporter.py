@@ -5,18 +5,70 @@ This module saves crawler results to local files in multiple formats
 when notifications are disabled or for archival purposes.
 """
 
-import json
 import csv
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
 import logging
 
 from crawler.config.settings import settings
+from crawler.utils.json_utils import dumps as json_dumps
 from crawler.utils.report_generator import ReportGenerator
 
 logger = logging.getLogger(__name__)
 
+# CSV export columns
+CSV_FIELDNAMES = (
+    'title',
+    'university_name',
+    'published_date',
+    'url',
+    'summary',
+    'author',
+    'word_count',
+    'is_ai_related',
+    'ai_confidence_score',
+)
+
+# File types written by the exporters (cleanup leaves anything else alone)
+EXPORT_SUFFIXES = ('.json', '.csv', '.html', '.txt')
+
+# Suffix of in-progress exports; one left behind by a killed process is
+# removed by cleanup like an old export
+TMP_SUFFIX = '.tmp'
+_CLEANUP_SUFFIXES = EXPORT_SUFFIXES + (TMP_SUFFIX,)
+
+
+@contextmanager
+def _atomic_open(path: Path, mode: str, **kwargs):
+    """
+    Open a temporary sibling of path for writing and move it into place.
+
+    The file is renamed over path with os.replace only after the block
+    completes, so readers never see a partially written export; on error the
+    temporary file is removed and path is left untouched.
+
+    Args:
+        path: Final file path
+        mode: Write mode passed to open()
+        **kwargs: Extra arguments passed to open()
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}{TMP_SUFFIX}")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class LocalExporter:
     """
@@ -26,6 +78,14 @@ class LocalExporter:
     Creates organized directory structure for outputs.
     """
 
+    # (format key, settings flag / exporter method name, shared inputs it takes)
+    _EXPORTERS = (
+        ('json', 'export_json', ('analyses',)),
+        ('csv', 'export_csv', ()),
+        ('html', 'export_html', ('formatted',)),
+        ('text', 'export_text_summary', ('formatted',)),
+    )
+
     def __init__(self, output_dir: str = None):
         """
         Initialize local exporter.
@@ -37,6 +97,11 @@ class LocalExporter:
         self.report_generator = ReportGenerator()
         self._ensure_directories()
 
+    @staticmethod
+    def _today() -> str:
+        """Current UTC date as YYYY-MM-DD (the default report date)"""
+        return datetime.utcnow().strftime('%Y-%m-%d')
+
     def _ensure_directories(self):
         """Create output directory structure if it doesn't exist."""
         directories = [
@@ -68,34 +133,45 @@ class LocalExporter:
         Returns:
             Dictionary of format -> file path mappings
         """
+        # Resolve the report date once so every format is filed under the
+        # same day, even if the export straddles midnight
         if date is None:
-            date = datetime.utcnow().strftime('%Y-%m-%d')
-
+            date = self._today()
+
+        # Enabled formats, in the order they are reported
+        enabled = [entry for entry in self._EXPORTERS if getattr(settings, entry[1])]
+
+        # Inputs shared between formats. The HTML and text reports render the
+        # same per-article summaries (markdown stripping, truncation, date
+        # formatting), so format each article once for both.
+        shared = {'analyses': analyses, 'formatted': None}
+        if any('formatted' in inputs for _, _, inputs in enabled):
+            try:
+                shared['formatted'] = self.report_generator.format_articles(articles)
+            except Exception as e:
+                # Leave it to each exporter to format (and report) on its own
+                logger.warning(f"Failed to pre-format articles: {e}")
+
+        jobs = []
+        for fmt, name, inputs in enabled:
+            kwargs = {'date': date}
+            for key in inputs:
+                kwargs[key] = shared[key]
+            jobs.append((fmt, getattr(self, name), kwargs))
+
+        # Formats write to independent files, so serialization and disk
+        # writes for each run concurrently
         exported_files = {}
-
-        # Export JSON
-        if settings.export_json:
-            json_path = self.export_json(articles, analyses, date)
-            if json_path:
-                exported_files['json'] = str(json_path)
-
-        # Export CSV
-        if settings.export_csv:
-            csv_path = self.export_csv(articles, date)
-            if csv_path:
-                exported_files['csv'] = str(csv_path)
-
-        # Export HTML
-        if settings.export_html:
-            html_path = self.export_html(articles, date)
-            if html_path:
-                exported_files['html'] = str(html_path)
-
-        # Export text summary
-        if settings.export_text_summary:
-            text_path = self.export_text_summary(articles, date)
-            if text_path:
-                exported_files['text'] = str(text_path)
+        if jobs:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [
+                    (fmt, executor.submit(export, articles, **kwargs))
+                    for fmt, export, kwargs in jobs
+                ]
+                for fmt, future in futures:
+                    path = future.result()
+                    if path:
+                        exported_files[fmt] = str(path)
 
         logger.info(f"Exported {len(exported_files)} file formats")
         return exported_files
@@ -118,7 +194,7 @@ class LocalExporter:
             Path to created JSON file
         """
         if date is None:
-            date = datetime.utcnow().strftime('%Y-%m-%d')
+            date = self._today()
 
         try:
             output_path = self.output_dir / "results" / f"results_{date}.json"
@@ -136,8 +212,8 @@ class LocalExporter:
                 }
             }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            with _atomic_open(output_path, 'wb') as f:
+                f.write(json_dumps(data, indent=True))
 
             logger.info(f"Exported JSON: {output_path} ({len(articles)} articles)")
             return output_path
@@ -162,7 +238,7 @@ class LocalExporter:
             Path to created CSV file
         """
         if date is None:
-            date = datetime.utcnow().strftime('%Y-%m-%d')
+            date = self._today()
 
         if not articles:
             logger.info("No articles to export to CSV")
@@ -171,27 +247,16 @@ class LocalExporter:
         try:
             output_path = self.output_dir / "exports" / f"articles_{date}.csv"
 
-            # Define CSV columns
-            fieldnames = [
-                'title',
-                'university_name',
-                'published_date',
-                'url',
-                'summary',
-                'author',
-                'word_count',
-                'is_ai_related',
-                'ai_confidence_score'
-            ]
-
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                writer.writeheader()
-
-                for article in articles:
-                    # Ensure all fields exist with defaults
-                    row = {field: article.get(field, '') for field in fieldnames}
-                    writer.writerow(row)
+            fieldnames = CSV_FIELDNAMES
+
+            with _atomic_open(output_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                # Missing fields default to '' (extra fields are never selected)
+                writer.writerows(
+                    tuple(article.get(field, '') for field in fieldnames)
+                    for article in articles
+                )
 
             logger.info(f"Exported CSV: {output_path} ({len(articles)} articles)")
             return output_path
@@ -203,7 +268,8 @@ class LocalExporter:
     def export_html(
         self,
         articles: List[Dict[str, Any]],
-        date: str = None
+        date: str = None,
+        formatted: List[Dict[str, Any]] = None
     ) -> Path:
         """
         Export HTML report.
@@ -211,22 +277,24 @@ class LocalExporter:
         Args:
             articles: List of article dictionaries
             date: Report date
+            formatted: Optional pre-formatted articles (ReportGenerator.format_articles)
 
         Returns:
             Path to created HTML file
         """
         if date is None:
-            date = datetime.utcnow().strftime('%Y-%m-%d')
+            date = self._today()
 
         try:
             output_path = self.output_dir / "reports" / f"report_{date}.html"
 
             html_content = self.report_generator.generate_html_report(
                 articles,
-                title=f"AI News Digest - {date}"
+                title=f"AI News Digest - {date}",
+                formatted=formatted
             )
 
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with _atomic_open(output_path, 'w', encoding='utf-8') as f:
                 f.write(html_content)
 
             logger.info(f"Exported HTML: {output_path}")
@@ -239,7 +307,8 @@ class LocalExporter:
     def export_text_summary(
         self,
         articles: List[Dict[str, Any]],
-        date: str = None
+        date: str = None,
+        formatted: List[Dict[str, Any]] = None
     ) -> Path:
         """
         Export plain text summary.
@@ -247,23 +316,25 @@ class LocalExporter:
         Args:
             articles: List of article dictionaries
             date: Report date
+            formatted: Optional pre-formatted articles (ReportGenerator.format_articles)
 
         Returns:
             Path to created text file
         """
         if date is None:
-            date = datetime.utcnow().strftime('%Y-%m-%d')
+            date = self._today()
 
         try:
             output_path = self.output_dir / f"summary_{date}.txt"
 
-            text_content = self.report_generator.generate_text_report(articles)
+            text_content = self.report_generator.generate_text_report(articles, formatted=formatted)
 
             # Add statistics header
-            stats = self._generate_statistics(articles)
-            full_content = f"{stats}\n\n{text_content}"
+            stats = self._compute_stats(articles)
+            stats_text = self._generate_statistics(articles, stats)
+            full_content = f"{stats_text}\n\n{text_content}"
 
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with _atomic_open(output_path, 'w', encoding='utf-8') as f:
                 f.write(full_content)
 
             logger.info(f"Exported text summary: {output_path}")
@@ -273,24 +344,50 @@ class LocalExporter:
             logger.error(f"Failed to export text summary: {e}")
             return None
 
-    def _generate_statistics(self, articles: List[Dict[str, Any]]) -> str:
+    @staticmethod
+    def _compute_stats(articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compute article statistics in a single pass over the articles.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            Dictionary with 'total', 'ai_related' and 'universities'
+            ((name, count) pairs, most common first)
+        """
+        universities = Counter()
+        ai_related = 0
+        for article in articles:
+            universities[article.get('university_name', 'Unknown')] += 1
+            if article.get('is_ai_related', False):
+                ai_related += 1
+
+        return {
+            'total': len(articles),
+            'ai_related': ai_related,
+            'universities': universities.most_common(),
+        }
+
+    def _generate_statistics(
+        self,
+        articles: List[Dict[str, Any]],
+        stats: Dict[str, Any] = None
+    ) -> str:
         """
         Generate statistics summary.
 
         Args:
             articles: List of article dictionaries
+            stats: Precomputed result of _compute_stats (computed if omitted)
 
         Returns:
             Statistics text
         """
-        total = len(articles)
-        ai_related = sum(1 for art in articles if art.get('is_ai_related', False))
-
-        # Count by university
-        universities = {}
-        for article in articles:
-            uni = article.get('university_name', 'Unknown')
-            universities[uni] = universities.get(uni, 0) + 1
+        if stats is None:
+            stats = self._compute_stats(articles)
+        total = stats['total']
+        ai_related = stats['ai_related']
 
         stats_lines = [
             "=" * 60,
@@ -303,7 +400,7 @@ class LocalExporter:
             "Articles by University:",
         ]
 
-        for uni, count in sorted(universities.items(), key=lambda x: x[1], reverse=True):
+        for uni, count in stats['universities']:
             stats_lines.append(f"  - {uni}: {count}")
 
         return '\n'.join(stats_lines)
@@ -344,6 +441,9 @@ class LocalExporter:
         """
         Remove export files older than specified days.
 
+        Temporary files left by interrupted exports are removed on the same
+        schedule.
+
         Args:
             keep_days: Number of days to keep files
         """
@@ -359,14 +459,18 @@ class LocalExporter:
             if not directory.exists():
                 continue
 
-            for file_path in directory.glob("*"):
-                if file_path.is_file() and file_path.stat().st_mtime < cutoff_date:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(_CLEANUP_SUFFIXES):
+                        continue
                     try:
-                        file_path.unlink()
+                        if not entry.is_file(follow_symlinks=False) or entry.stat().st_mtime >= cutoff_date:
+                            continue
+                        os.unlink(entry.path)
                         removed_count += 1
-                        logger.debug(f"Removed old export: {file_path}")
+                        logger.debug(f"Removed old export: {entry.path}")
                     except Exception as e:
-                        logger.error(f"Failed to remove {file_path}: {e}")
+                        logger.error(f"Failed to remove {entry.path}: {e}")
 
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} old export files (>{keep_days} days)")
@@ -8,17 +8,95 @@ In the Claude Code environment, MCP tools are available through function calling
 This module provides a clean Python interface for calling those tools.
 """
 
+import atexit
 import logging
+import random
+import threading
+from functools import lru_cache
 from typing import Optional, Dict, Any, Union
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 logger = logging.getLogger(__name__)
 
+# Headers that look like a real browser
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+}
+
+# Shared HTTP session, created on first use so connections stay pooled
+# (and kept alive) across fetches. This stays on requests rather than an
+# HTTP/2 client: fallback fetches are issued one at a time from the crawler,
+# so there are no concurrent streams to multiplex, and urllib3's Retry also
+# retries on 429/5xx status codes, which transport-level retries do not.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Longest pause between two retries, in seconds
+_MAX_BACKOFF = 30.0
+
+
+class _JitteredRetry(Retry):
+    """
+    urllib3 Retry with full jitter.
+
+    Each pause is a random fraction of the capped exponential backoff, so
+    fetchers that failed together do not retry in lockstep. A Retry-After
+    header on a 429/503 response still takes precedence over the backoff.
+    """
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, min(_MAX_BACKOFF, super().get_backoff_time()))
+
+
+def _get_session():
+    """
+    Get the shared requests session, creating it on first use.
+
+    Returns:
+        requests.Session configured with retries and a connection pool
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                retry_strategy = _JitteredRetry(
+                    total=3,
+                    backoff_factor=1,
+                    status_forcelist=[429, 500, 502, 503, 504]
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=32,
+                    max_retries=retry_strategy
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                # Close pooled keep-alive sockets cleanly at interpreter exit
+                atexit.register(session.close)
+                _SESSION = session
+    return _SESSION
+
 
 def call_mcp_fetch(
     url: str,
     images: Union[bool, Dict[str, Any]] = False,
     text: Optional[Dict[str, Any]] = None,
-    security: Optional[Dict[str, Any]] = None
+    security: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Call MCP imageFetch tool to fetch content.
@@ -31,9 +109,15 @@ def call_mcp_fetch(
         images: Image fetching configuration (False to disable)
         text: Text extraction configuration
         security: Security options (e.g., ignoreRobotsTxt)
+        session: HTTP session to use (defaults to the shared pooled session)
 
     Returns:
-        Dictionary with 'text' and optionally 'images' keys, or None if failed
+        Dictionary with 'html' (raw response bytes, undecoded), 'url',
+        'status_code', 'encoding' (from the response headers, may be None)
+        'content_type' (media type without parameters, lower-cased, may be
+        empty), 'content_type_header' (the Content-Type header as sent,
+        including any charset; may be empty) and 'retries' (requests retried
+        before this response) keys, or None if failed
 
     Example:
         result = call_mcp_fetch(
@@ -45,59 +129,37 @@ def call_mcp_fetch(
     try:
         # In the Claude Code environment, we would make the actual MCP call here
         # For now, we'll use a direct approach that simulates what the MCP tool does
-
-        # Import requests for fallback HTTP fetching
-        import requests
-        from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
-
-        # Configure session with retries and better headers
-        session = requests.Session()
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        # Use headers that look like a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        }
+        if session is None:
+            session = _get_session()
 
         logger.debug(f"MCP client fetching: {url}")
 
         # Make the request
-        response = session.get(url, headers=headers, timeout=30, allow_redirects=True)
+        response = session.get(url, headers=_DEFAULT_HEADERS, timeout=30, allow_redirects=True)
         response.raise_for_status()
 
-        # Return the raw HTML content
-        # The crawler's Trafilatura pipeline will handle extraction
-        html_content = response.text
+        # Return the raw HTML bytes without decoding them here (response.text
+        # would run charset detection over the whole body when the headers
+        # give no encoding); the crawler's Trafilatura pipeline will handle
+        # decoding and extraction
+        html_content = response.content
 
         if not html_content:
             logger.warning(f"MCP fetch: No content returned from {url}")
             return None
 
+        content_type_header = response.headers.get('Content-Type', '')
         result = {
             'html': html_content,
             'url': url,
-            'status_code': response.status_code
+            'status_code': response.status_code,
+            'encoding': response.encoding,
+            'content_type': content_type_header.split(';', 1)[0].strip().lower(),
+            'content_type_header': content_type_header,
+            'retries': _retry_count(response)
         }
 
-        logger.info(f"MCP fetch successful: {url} ({len(html_content)} chars raw HTML)")
+        logger.info(f"MCP fetch successful: {url} ({len(html_content)} bytes raw HTML)")
         return result
 
     except requests.exceptions.RequestException as e:
@@ -108,16 +170,26 @@ def call_mcp_fetch(
         return None
 
 
+def _retry_count(response: requests.Response) -> int:
+    """Number of retries urllib3 made before returning this response."""
+    retries = getattr(response.raw, 'retries', None)
+    return len(retries.history) if retries is not None else 0
+
+
+@lru_cache(maxsize=1)
 def is_mcp_available() -> bool:
     """
     Check if MCP tools are available.
 
+    The result is cached, since installed packages do not change while the
+    crawler runs.
+
     Returns:
         True if MCP tools can be used
     """
     # For now, we'll assume MCP is available if we have the required dependencies
+    # (requests is imported at module level)
     try:
-        import requests
         from trafilatura import extract
         return True
     except ImportError:
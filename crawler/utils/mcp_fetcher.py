@@ -8,13 +8,120 @@ The MCP fetch tool can bypass common bot detection mechanisms and retrieve
 content that would otherwise be blocked.
 """
 
+import functools
+import io
 import json
 import logging
-from typing import Optional, Dict, Any
+import re
+import threading
+from collections import Counter
+from typing import Optional, Dict, Any, Tuple
 from html import escape
 
 logger = logging.getLogger(__name__)
 
+# Markdown constructs recognised by _markdown_to_html
+_HEADER_RE = re.compile(r'(#{1,3}) ')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+# Link replacement for already-escaped text: the tag itself is emitted
+# escaped, exactly as escaping the converted line would produce
+_ESCAPED_LINK = r'&lt;a href=&quot;\2&quot;&gt;\1&lt;/a&gt;'
+
+# Status codes that warrant an MCP fallback:
+# - 403 Forbidden (bot detection)
+# - 404 Not Found (might be blocking crawlers)
+# - None (connection/timeout errors)
+_FALLBACK_CODES = frozenset({403, 404, None})
+
+# Response media types that are converted with _markdown_to_html
+_MARKDOWN_TYPES = frozenset({'text/markdown', 'text/x-markdown'})
+
+
+@functools.lru_cache(maxsize=128)
+def _render_markdown_html(markdown: str, url: str) -> str:
+    """
+    Convert markdown to a minimal HTML document (see MCPFetcher._markdown_to_html).
+
+    Pure function of its arguments, so results are memoized: refetching a
+    page whose markdown has not changed skips the conversion entirely.
+    """
+    # Escape HTML special characters in the content
+    # but preserve markdown structure for better parsing.
+    # The whole document is escaped in one call up front: escaping never
+    # produces whitespace or any markdown marker, so the line structure and
+    # every check below are unaffected.
+    # Output is streamed into one buffer, one element per line; paragraph
+    # text is written word-line by word-line rather than collected first.
+    buf = io.StringIO()
+    write = buf.write
+    write(f'<html>\n<head>\n<meta property="og:url" content="{escape(url)}" />\n</head>\n<body>\n<article>\n')
+
+    in_code_block = False
+    in_paragraph = False
+
+    for line in escape(markdown).split('\n'):
+        stripped = line.strip()
+        # Dispatch on the first character; only lines starting with one of
+        # the markdown markers pay for the longer checks
+        first = stripped[:1]
+
+        # Handle code blocks (a fence also ends the current paragraph)
+        if first == '`' and stripped.startswith('```'):
+            if in_paragraph:
+                write('</p>\n')
+                in_paragraph = False
+            in_code_block = not in_code_block
+            write('<pre><code>\n' if in_code_block else '</code></pre>\n')
+            continue
+
+        if in_code_block:
+            write(line)
+            write('\n')
+            continue
+
+        if first == '#':
+            header = _HEADER_RE.match(stripped)
+        else:
+            header = None
+        is_item = (first == '-' or first == '*') and stripped[1:2] == ' '
+
+        # Regular text - continue (or open) the current paragraph
+        if first and not header and not is_item \
+                and not ('[' in stripped and '](' in stripped):
+            write(' ' if in_paragraph else '<p>')
+            write(stripped)
+            in_paragraph = True
+            continue
+
+        # Anything else ends the current paragraph
+        if in_paragraph:
+            write('</p>\n')
+            in_paragraph = False
+
+        # Handle headers (# to ###)
+        if header:
+            level = len(header.group(1))
+            write(f'<h{level}>{stripped[header.end():]}</h{level}>\n')
+
+        # Handle list items
+        elif is_item:
+            write(f'<li>{stripped[2:]}</li>\n')
+
+        # Handle links in markdown format [text](url)
+        elif first:
+            # Simple link conversion (not perfect but good enough)
+            write(f'<p>{_LINK_RE.sub(_ESCAPED_LINK, stripped)}</p>\n')
+
+        # Empty lines are paragraph breaks
+
+    # Close any remaining paragraph
+    if in_paragraph:
+        write('</p>\n')
+
+    write('</article>\n</body>\n</html>')
+
+    return buf.getvalue()
+
 
 class MCPFetcher:
     """
@@ -24,16 +131,21 @@ class MCPFetcher:
     Converts markdown/text output to HTML-like format for Trafilatura parsing.
     """
 
-    def __init__(self):
-        """Initialize MCP fetcher."""
-        self.stats = {
-            'fetch_attempts': 0,
-            'fetch_successes': 0,
-            'fetch_failures': 0
-        }
+    def __init__(self, session=None) -> None:
+        """
+        Initialize MCP fetcher.
+
+        Args:
+            session: Optional requests.Session for fallback fetches; by default
+                the pooled session shared by all fetchers in the process is used
+        """
+        self.session = session
+        self.stats: Counter = Counter(fetch_attempts=0, fetch_successes=0, fetch_failures=0, retries=0)
+        # Fallback fetches run on reactor worker threads
+        self._stats_lock = threading.Lock()
         logger.info("Initialized MCPFetcher for bot protection bypass")
 
-    def fetch_with_mcp(self, url: str) -> Optional[str]:
+    def fetch_with_mcp(self, url: str) -> Optional[bytes]:
         """
         Fetch content using MCP imageFetch tool.
 
@@ -46,9 +158,26 @@ class MCPFetcher:
             url: URL to fetch
 
         Returns:
-            HTML-formatted content or None if fetch failed
+            Raw HTML bytes or None if fetch failed
+        """
+        document = self.fetch_document(url)
+        return document[0] if document else None
+
+    def fetch_document(self, url: str) -> Optional[Tuple[bytes, str]]:
         """
-        self.stats['fetch_attempts'] += 1
+        Fetch content like fetch_with_mcp, keeping its Content-Type header.
+
+        The body is undecoded, so callers need the header to honour a charset
+        that the server declares only there (not in a <meta> tag).
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Tuple of (raw HTML bytes, Content-Type header, possibly empty),
+            or None if fetch failed
+        """
+        self._record('fetch_attempts')
 
         try:
             logger.info(f"Attempting MCP fetch for blocked URL: {url}")
@@ -66,34 +195,47 @@ class MCPFetcher:
                     "maxLength": 50000,  # Get up to 50k chars
                     "raw": False,  # Get markdown format
                     "startIndex": 0
-                }
+                },
+                session=self.session
             )
 
             if not result or not result.get('html'):
                 logger.warning(f"MCP fetch returned no content for {url}")
-                self.stats['fetch_failures'] += 1
+                self._record('fetch_failures')
                 return None
 
-            # Extract the HTML content
-            html_content = result.get('html', result.get('text', ''))
+            if result.get('retries'):
+                self._record('retries', result['retries'])
 
-            # HTML is already in the right format for Trafilatura
-            # No conversion needed
+            html_content = result['html']
+            content_type = result.get('content_type_header') or ''
 
-            self.stats['fetch_successes'] += 1
-            logger.info(f"MCP fetch successful for {url} ({len(html_content)} chars)")
+            # HTML goes to Trafilatura untouched; only a markdown body needs
+            # converting first
+            if result.get('content_type') in _MARKDOWN_TYPES:
+                markdown = html_content.decode(result.get('encoding') or 'utf-8', errors='replace')
+                html_content = self._markdown_to_html(markdown, url).encode('utf-8')
+                content_type = 'text/html; charset=utf-8'
 
-            return html_content
+            self._record('fetch_successes')
+            logger.info(f"MCP fetch successful for {url} ({len(html_content)} bytes)")
+
+            return html_content, content_type
 
         except ImportError:
             logger.warning("MCP client not available - cannot use MCP fallback")
-            self.stats['fetch_failures'] += 1
+            self._record('fetch_failures')
             return None
         except Exception as e:
             logger.error(f"MCP fetch failed for {url}: {e}")
-            self.stats['fetch_failures'] += 1
+            self._record('fetch_failures')
             return None
 
+    def _record(self, key: str, count: int = 1) -> None:
+        """Add to a fetch counter; unknown keys start at zero."""
+        with self._stats_lock:
+            self.stats[key] += count
+
     def _markdown_to_html(self, markdown: str, url: str) -> str:
         """
         Convert markdown content to HTML format for Trafilatura parsing.
@@ -108,85 +250,7 @@ class MCPFetcher:
         Returns:
             HTML-formatted content
         """
-        # Escape HTML special characters in the content
-        # but preserve markdown structure for better parsing
-        lines = markdown.split('\n')
-        html_lines = ['<html>', '<head>', f'<meta property="og:url" content="{escape(url)}" />', '</head>', '<body>', '<article>']
-
-        in_code_block = False
-        current_paragraph = []
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Handle code blocks
-            if stripped.startswith('```'):
-                in_code_block = not in_code_block
-                if in_code_block:
-                    html_lines.append('<pre><code>')
-                else:
-                    html_lines.append('</code></pre>')
-                continue
-
-            if in_code_block:
-                html_lines.append(escape(line))
-                continue
-
-            # Handle headers
-            if stripped.startswith('# '):
-                if current_paragraph:
-                    html_lines.append('<p>' + ' '.join(current_paragraph) + '</p>')
-                    current_paragraph = []
-                html_lines.append(f'<h1>{escape(stripped[2:])}</h1>')
-            elif stripped.startswith('## '):
-                if current_paragraph:
-                    html_lines.append('<p>' + ' '.join(current_paragraph) + '</p>')
-                    current_paragraph = []
-                html_lines.append(f'<h2>{escape(stripped[3:])}</h2>')
-            elif stripped.startswith('### '):
-                if current_paragraph:
-                    html_lines.append('<p>' + ' '.join(current_paragraph) + '</p>')
-                    current_paragraph = []
-                html_lines.append(f'<h3>{escape(stripped[4:])}</h3>')
-
-            # Handle list items
-            elif stripped.startswith('- ') or stripped.startswith('* '):
-                if current_paragraph:
-                    html_lines.append('<p>' + ' '.join(current_paragraph) + '</p>')
-                    current_paragraph = []
-                html_lines.append(f'<li>{escape(stripped[2:])}</li>')
-
-            # Handle links in markdown format [text](url)
-            elif '[' in stripped and '](' in stripped:
-                if current_paragraph:
-                    html_lines.append('<p>' + ' '.join(current_paragraph) + '</p>')
-                    current_paragraph = []
-                # Simple link conversion (not perfect but good enough)
-                import re
-                converted = re.sub(
-                    r'\[([^\]]+)\]\(([^\)]+)\)',
-                    r'<a href="\2">\1</a>',
-                    stripped
-                )
-                html_lines.append(f'<p>{escape(converted)}</p>')
-
-            # Handle empty lines (paragraph breaks)
-            elif not stripped:
-                if current_paragraph:
-                    html_lines.append('<p>' + ' '.join(current_paragraph) + '</p>')
-                    current_paragraph = []
-
-            # Regular text - accumulate into paragraph
-            else:
-                current_paragraph.append(escape(stripped))
-
-        # Close any remaining paragraph
-        if current_paragraph:
-            html_lines.append('<p>' + ' '.join(current_paragraph) + '</p>')
-
-        html_lines.extend(['</article>', '</body>', '</html>'])
-
-        return '\n'.join(html_lines)
+        return _render_markdown_html(markdown, url)
 
     def should_use_mcp_fallback(self, status_code: Optional[int], url: str) -> bool:
         """
@@ -199,16 +263,10 @@ class MCPFetcher:
         Returns:
             True if MCP fallback should be attempted
         """
-        # Use MCP fallback for:
-        # - 403 Forbidden (bot detection)
-        # - 404 Not Found (might be blocking crawlers)
-        # - None (connection/timeout errors)
-        fallback_codes = [403, 404, None]
-
-        should_fallback = status_code in fallback_codes
+        should_fallback = status_code in _FALLBACK_CODES
 
-        if should_fallback:
-            logger.info(f"Status code {status_code} for {url} - MCP fallback recommended")
+        if should_fallback and logger.isEnabledFor(logging.INFO):
+            logger.info("Status code %s for %s - MCP fallback recommended", status_code, url)
 
         return should_fallback
 
@@ -219,18 +277,26 @@ class MCPFetcher:
         Returns:
             Dictionary with fetch statistics
         """
-        return self.stats.copy()
+        with self._stats_lock:
+            return dict(self.stats)
 
 
-def fetch_with_mcp(url: str) -> Optional[str]:
+@functools.lru_cache(maxsize=1)
+def _get_fetcher() -> MCPFetcher:
+    """Return the process-wide MCPFetcher used by fetch_with_mcp()."""
+    return MCPFetcher()
+
+
+def fetch_with_mcp(url: str) -> Optional[bytes]:
     """
     Convenience function for fetching content with MCP.
 
+    All calls share one fetcher, so statistics accumulate across calls.
+
     Args:
         url: URL to fetch
 
     Returns:
-        HTML content or None if fetch failed
+        Raw HTML bytes or None if fetch failed
     """
-    fetcher = MCPFetcher()
-    return fetcher.fetch_with_mcp(url)
+    return _get_fetcher().fetch_with_mcp(url)
@@ -5,16 +5,29 @@ This module implements per-domain rate limiting to ensure
 politeness and respect for website resources.
 """
 
+import asyncio
+import atexit
+import threading
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from crawler.db.models import HostCrawlState
 import logging
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _utc_timestamp(value: datetime) -> float:
+    """Unix timestamp of a stored datetime (naive values are UTC)."""
+    if value.tzinfo is None:
+        return (value - _EPOCH).total_seconds()
+    return value.timestamp()
+
 
 class DomainRateLimiter:
     """
@@ -24,6 +37,11 @@ class DomainRateLimiter:
     according to configured crawl delays and robots.txt directives.
     """
 
+    # Most domains whose last request time is remembered; beyond this the
+    # least recently requested domain is forgotten (it is long past its
+    # delay by then), so memory stays bounded on long crawls
+    MAX_TRACKED_DOMAINS = 100_000
+
     def __init__(self, default_delay: float = 1.0):
         """
         Initialize rate limiter.
@@ -32,11 +50,23 @@ class DomainRateLimiter:
             default_delay: Default delay between requests in seconds
         """
         self.default_delay = default_delay
-        self.domain_requests = defaultdict(deque)
-        self.domain_delays = {}
+        # Monotonic time of the last request per domain; only the latest one
+        # matters for spacing requests. A waiting caller's slot may lie in
+        # the future. Ordered from least to most recently requested.
+        self.last_request_times: 'OrderedDict[str, float]' = OrderedDict()
+        self.domain_delays: Dict[str, float] = {}
+        # Per-domain locks, so threads working on different domains never
+        # contend on the spacing logic
+        self._domain_locks: Dict[str, threading.Lock] = {}
+        # Callers holding or waiting on each domain's lock. A domain in use
+        # is never evicted, so its lock is never replaced under a waiter.
+        self._domain_users: Dict[str, int] = {}
+        # Guards last_request_times, the lock registries and _domain_users;
+        # held only for the dictionary updates
+        self._registry_lock = threading.Lock()
         logger.info(f"Initialized DomainRateLimiter with default_delay={default_delay}s")
 
-    def set_domain_delay(self, domain: str, delay: float):
+    def set_domain_delay(self, domain: str, delay: float) -> None:
         """
         Set custom delay for specific domain.
 
@@ -59,33 +89,69 @@ class DomainRateLimiter:
         """
         return self.domain_delays.get(domain, self.default_delay)
 
-    def wait_if_needed(self, domain: str):
+    def wait_if_needed(self, domain: str) -> None:
         """
         Block execution until it's safe to make request to domain.
 
+        Thread-safe: concurrent callers for the same domain each reserve the
+        next free slot under the domain's lock, then sleep outside it.
+
         Args:
             domain: Domain to check
         """
-        delay = self.get_domain_delay(domain)
-        now = time.time()
-
-        # Clean old requests (older than delay window)
-        while (self.domain_requests[domain] and
-               self.domain_requests[domain][0] <= now - delay):
-            self.domain_requests[domain].popleft()
-
-        # Check if we need to wait
-        if self.domain_requests[domain]:
-            last_request = self.domain_requests[domain][-1]
-            time_since_last = now - last_request
-
-            if time_since_last < delay:
-                sleep_time = delay - time_since_last
-                logger.debug(f"Rate limiting {domain}: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-
-        # Record this request
-        self.domain_requests[domain].append(time.time())
+        lock = self._enter_domain(domain, self._domain_locks, threading.Lock)
+        try:
+            with lock:
+                now = time.monotonic()
+                last_request = self.last_request_times.get(domain)
+                if last_request is None:
+                    slot = now
+                else:
+                    slot = max(now, last_request + self.get_domain_delay(domain))
+                # Record this request
+                self._record_request(domain, slot)
+        finally:
+            self._leave_domain(domain)
+
+        sleep_time = slot - now
+        if sleep_time > 0:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rate limiting %s: sleeping %.2fs", domain, sleep_time)
+            time.sleep(sleep_time)
+
+    def _enter_domain(self, domain: str, locks: Dict[str, Any], lock_factory) -> Any:
+        """Return domain's lock from locks (creating it), marking the domain in use."""
+        with self._registry_lock:
+            lock = locks.get(domain)
+            if lock is None:
+                lock = locks[domain] = lock_factory()
+            self._domain_users[domain] = self._domain_users.get(domain, 0) + 1
+        return lock
+
+    def _leave_domain(self, domain: str) -> None:
+        """Release a use taken by _enter_domain."""
+        with self._registry_lock:
+            users = self._domain_users[domain] - 1
+            if users:
+                self._domain_users[domain] = users
+            else:
+                del self._domain_users[domain]
+
+    def _record_request(self, domain: str, when: float) -> None:
+        """Store a domain's request time, evicting the stalest idle domain if full."""
+        with self._registry_lock:
+            times = self.last_request_times
+            times[domain] = when
+            times.move_to_end(domain)
+            if len(times) > self.MAX_TRACKED_DOMAINS:
+                stale = next((d for d in times if d not in self._domain_users), None)
+                if stale is not None:
+                    del times[stale]
+                    self._forget_domain(stale)
+
+    def _forget_domain(self, domain: str) -> None:
+        """Drop per-domain bookkeeping for a domain evicted from the registry."""
+        self._domain_locks.pop(domain, None)
 
     def can_request_now(self, domain: str) -> bool:
         """
@@ -97,16 +163,11 @@ class DomainRateLimiter:
         Returns:
             True if request can be made now, False otherwise
         """
-        delay = self.get_domain_delay(domain)
-        now = time.time()
-
-        if not self.domain_requests[domain]:
+        last_request = self.last_request_times.get(domain)
+        if last_request is None:
             return True
 
-        last_request = self.domain_requests[domain][-1]
-        time_since_last = now - last_request
-
-        return time_since_last >= delay
+        return time.monotonic() - last_request >= self.get_domain_delay(domain)
 
     def get_next_available_time(self, domain: str) -> float:
         """
@@ -118,12 +179,68 @@ class DomainRateLimiter:
         Returns:
             Unix timestamp of next available request time
         """
-        if not self.domain_requests[domain]:
-            return time.time()
+        now = time.time()
+        last_request = self.last_request_times.get(domain)
+        if last_request is None:
+            return now
+
+        # Convert the monotonic deadline to wall-clock time
+        remaining = last_request + self.get_domain_delay(domain) - time.monotonic()
+        return now + remaining
+
+
+class AsyncDomainRateLimiter(DomainRateLimiter):
+    """
+    Per-domain rate limiting for asyncio code.
+
+    Same delays and bookkeeping as DomainRateLimiter, but wait_if_needed
+    is a coroutine that yields to the event loop while waiting, so requests
+    to other domains proceed in the meantime.
+    """
+
+    def __init__(self, default_delay: float = 1.0):
+        """
+        Initialize async rate limiter.
 
-        delay = self.get_domain_delay(domain)
-        last_request = self.domain_requests[domain][-1]
-        return last_request + delay
+        Args:
+            default_delay: Default delay between requests in seconds
+        """
+        super().__init__(default_delay)
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _forget_domain(self, domain: str) -> None:
+        """Drop per-domain bookkeeping for a domain evicted from the registry."""
+        self._locks.pop(domain, None)
+
+    async def wait_if_needed(self, domain: str) -> None:
+        """
+        Wait (without blocking the event loop) until it's safe to request domain.
+
+        Concurrent callers for the same domain are served one at a time, each
+        spaced by the domain delay.
+
+        Args:
+            domain: Domain to check
+        """
+        lock = self._enter_domain(domain, self._locks, asyncio.Lock)
+        try:
+            async with lock:
+                delay = self.get_domain_delay(domain)
+                last_request = self.last_request_times.get(domain)
+
+                if last_request is not None:
+                    time_since_last = time.monotonic() - last_request
+
+                    if time_since_last < delay:
+                        sleep_time = delay - time_since_last
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Rate limiting %s: sleeping %.2fs", domain, sleep_time)
+                        await asyncio.sleep(sleep_time)
+
+                # Record this request
+                self._record_request(domain, time.monotonic())
+        finally:
+            self._leave_domain(domain)
 
 
 class DatabaseRateLimiter:
@@ -132,8 +249,25 @@ class DatabaseRateLimiter:
 
     Persists crawl state across application restarts and
     respects robots.txt delays.
+
+    Crawl-time updates are staged and committed in groups (see flush()).
+    Pending updates are written by any later call on the limiter once
+    FLUSH_INTERVAL has passed. Call close() when the crawl finishes, or use
+    the limiter as a context manager, so the last updates are committed
+    while the session is still usable. close() also runs at interpreter
+    exit for a limiter that was never closed.
     """
 
+    # Seconds a looked-up host state is reused before it is queried again
+    # (picks up changes made by other crawler processes)
+    STATE_CACHE_TTL = 60.0
+
+    # Crawl-time updates are committed in groups: once this many hosts have
+    # pending changes, or on the first update this many seconds after the
+    # last commit
+    FLUSH_BATCH_SIZE = 50
+    FLUSH_INTERVAL = 1.0
+
     def __init__(self, db: Session, default_delay: float = 1.0):
         """
         Initialize database rate limiter.
@@ -144,10 +278,58 @@ class DatabaseRateLimiter:
         """
         self.db = db
         self.default_delay = default_delay
+        # hostname -> (HostCrawlState or None, monotonic time it was cached,
+        # timing snapshot (last_crawl_ts, delay_s, blocked_until_ts) as epoch
+        # floats, or None when there is no state)
+        self._state_cache: Dict[
+            str,
+            Tuple[Optional[HostCrawlState], float, Optional[Tuple[float, float, Optional[float]]]]
+        ] = {}
+        # hostname -> (column values to insert, columns to overwrite on
+        # conflict) for upserts not yet written
+        self._pending: Dict[str, Tuple[Dict[str, Any], FrozenSet[str]]] = {}
+        self._last_flush = time.monotonic()
+        atexit.register(self.close)
+
+    def __enter__(self) -> 'DatabaseRateLimiter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _cache_state(self, hostname: str, state: Optional[HostCrawlState]) -> None:
+        """Cache state along with its timing fields as plain epoch floats."""
+        timing = None
+        if state is not None:
+            # Effective delay: robots.txt if available, else configured/default
+            delay = state.robots_txt_delay or state.crawl_delay
+            timing = (
+                _utc_timestamp(state.last_crawl_time),
+                delay.total_seconds() if delay else self.default_delay,
+                _utc_timestamp(state.blocked_until) if state.blocked_until else None,
+            )
+        self._state_cache[hostname] = (state, time.monotonic(), timing)
+
+    def _get_host_timing(self, hostname: str) -> Optional[Tuple[float, float, Optional[float]]]:
+        """
+        Get (last crawl, delay seconds, blocked until) for hostname.
+
+        Times are Unix timestamps, so the rate-limit checks are plain float
+        comparisons against time.time().
+
+        Args:
+            hostname: Hostname to look up
+
+        Returns:
+            Timing tuple, or None if the host has no stored state
+        """
+        self._flush_if_due()
+        self.get_host_state(hostname)  # refreshes the cache entry if stale
+        return self._state_cache[hostname][2]
 
     def get_host_state(self, hostname: str) -> Optional[HostCrawlState]:
         """
-        Get crawl state for hostname from database.
+        Get crawl state for hostname, from the cache or the database.
 
         Args:
             hostname: Hostname to look up
@@ -155,44 +337,155 @@ class DatabaseRateLimiter:
         Returns:
             HostCrawlState instance or None
         """
-        return self.db.query(HostCrawlState).filter(
+        cached = self._state_cache.get(hostname)
+        if cached is not None and time.monotonic() - cached[1] < self.STATE_CACHE_TTL:
+            return cached[0]
+
+        # Unwritten upserts are not visible to queries
+        if hostname in self._pending:
+            self.flush()
+
+        state = self.db.query(HostCrawlState).filter(
             HostCrawlState.hostname == hostname
         ).first()
+        self._cache_state(hostname, state)
+        return state
+
+    def get_host_states(self, hostnames: Iterable[str]) -> Dict[str, HostCrawlState]:
+        """
+        Load crawl states for many hostnames in a single query.
+
+        Also primes the cache used by get_host_state, including for hostnames
+        that have no stored state yet.
+
+        Args:
+            hostnames: Hostnames to look up
+
+        Returns:
+            Dictionary of hostname -> HostCrawlState (unknown hosts omitted)
+        """
+        hostnames = set(hostnames)
+        if not hostnames:
+            return {}
+        if not self._pending.keys().isdisjoint(hostnames):
+            self.flush()
+
+        states = {
+            state.hostname: state
+            for state in self.db.query(HostCrawlState).filter(
+                HostCrawlState.hostname.in_(hostnames)
+            ).all()
+        }
+        for hostname in hostnames:
+            self._cache_state(hostname, states.get(hostname))
+        return states
 
     def update_host_state(
         self,
         hostname: str,
         crawl_delay: Optional[timedelta] = None,
         robots_txt_delay: Optional[timedelta] = None
-    ):
+    ) -> None:
         """
         Update or create host crawl state.
 
+        The change is written with the next batch (see flush()).
+
         Args:
             hostname: Hostname to update
             crawl_delay: Optional custom crawl delay
             robots_txt_delay: Optional delay from robots.txt
         """
-        state = self.get_host_state(hostname)
+        values = {
+            'hostname': hostname,
+            'last_crawl_time': datetime.utcnow(),
+            'crawl_delay': crawl_delay or timedelta(seconds=self.default_delay),
+            'robots_txt_delay': robots_txt_delay,
+        }
+        # An existing host keeps its delays unless new ones are given
+        update_columns = {'last_crawl_time'}
+        if crawl_delay is not None:
+            update_columns.add('crawl_delay')
+        if robots_txt_delay is not None:
+            update_columns.add('robots_txt_delay')
+
+        self._stage(hostname, values, update_columns)
+
+        if len(self._pending) >= self.FLUSH_BATCH_SIZE:
+            self.flush()
+        else:
+            self._flush_if_due()
+
+    def _flush_if_due(self) -> None:
+        """Write pending updates if FLUSH_INTERVAL has passed since the last commit."""
+        if self._pending and time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
 
+    def _stage(self, hostname: str, values: Dict[str, Any], update_columns: Iterable[str]) -> None:
+        """
+        Queue an upsert for hostname and apply it to the cached state.
+
+        Args:
+            hostname: Hostname being written
+            values: Column values for a newly inserted row
+            update_columns: Columns overwritten when the row already exists
+        """
+        pending = self._pending.get(hostname)
+        if pending is not None:
+            # Fold into the upsert already queued for this host
+            values = {**pending[0], **values}
+            update_columns = pending[1].union(update_columns)
+        update_columns = frozenset(update_columns)
+        self._pending[hostname] = (values, update_columns)
+
+        # Keep the cached view current without a read. If the host's state
+        # is not cached, the next lookup writes pending upserts and queries.
+        cached = self._state_cache.get(hostname)
+        if cached is None or time.monotonic() - cached[1] >= self.STATE_CACHE_TTL:
+            self._state_cache.pop(hostname, None)
+            return
+        state = cached[0]
         if state is None:
-            # Create new state
-            state = HostCrawlState(
-                hostname=hostname,
-                last_crawl_time=datetime.utcnow(),
-                crawl_delay=crawl_delay or timedelta(seconds=self.default_delay),
-                robots_txt_delay=robots_txt_delay
-            )
-            self.db.add(state)
+            state = HostCrawlState(**values)
         else:
-            # Update existing state
-            state.last_crawl_time = datetime.utcnow()
-            if crawl_delay is not None:
-                state.crawl_delay = crawl_delay
-            if robots_txt_delay is not None:
-                state.robots_txt_delay = robots_txt_delay
+            fields = {
+                column: getattr(state, column)
+                for column in ('last_crawl_time', 'crawl_delay', 'robots_txt_delay', 'blocked_until')
+            }
+            fields.update((column, values[column]) for column in update_columns)
+            state = HostCrawlState(hostname=hostname, **fields)
+        self._cache_state(hostname, state)
+
+    def flush(self) -> None:
+        """
+        Write pending host state updates.
 
-        self.db.commit()
+        Each group of hosts with the same set of columns is written with a
+        single INSERT ... ON CONFLICT (hostname) DO UPDATE, so creating and
+        updating hosts needs no prior SELECT and concurrent crawler
+        processes cannot race between a read and a write.
+        """
+        if self._pending:
+            groups: Dict[Tuple[FrozenSet[str], FrozenSet[str]], List[Dict[str, Any]]] = {}
+            for values, update_columns in self._pending.values():
+                groups.setdefault((frozenset(values), update_columns), []).append(values)
+
+            for (_, update_columns), rows in groups.items():
+                stmt = pg_insert(HostCrawlState).values(rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[HostCrawlState.hostname],
+                    set_={column: stmt.excluded[column] for column in update_columns}
+                )
+                self.db.execute(stmt)
+
+            self.db.commit()
+            self._pending.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Commit any pending updates; call when the crawl finishes."""
+        atexit.unregister(self.close)
+        self.flush()
 
     def can_crawl_now(self, hostname: str) -> bool:
         """
@@ -204,52 +497,51 @@ class DatabaseRateLimiter:
         Returns:
             True if can crawl now, False otherwise
         """
-        state = self.get_host_state(hostname)
+        timing = self._get_host_timing(hostname)
 
-        if state is None:
+        if timing is None:
             return True
 
+        last_crawl_ts, delay_seconds, blocked_until_ts = timing
+        now = time.time()
+
         # Check if blocked
-        if state.blocked_until and datetime.utcnow() < state.blocked_until:
+        if blocked_until_ts is not None and now < blocked_until_ts:
             return False
 
-        # Get effective delay (use robots.txt if available)
-        delay = state.robots_txt_delay or state.crawl_delay or timedelta(seconds=self.default_delay)
-
         # Check if enough time has passed
-        time_since_last = datetime.utcnow() - state.last_crawl_time
-        return time_since_last >= delay
+        return now - last_crawl_ts >= delay_seconds
 
-    def wait_if_needed(self, hostname: str):
+    def wait_if_needed(self, hostname: str) -> None:
         """
         Wait until hostname can be crawled according to stored state.
 
         Args:
             hostname: Hostname to wait for
         """
-        state = self.get_host_state(hostname)
+        timing = self._get_host_timing(hostname)
 
-        if state is None:
+        if timing is None:
             return
 
+        last_crawl_ts, delay_seconds, blocked_until_ts = timing
+        now = time.time()
+
         # Check if blocked
-        if state.blocked_until and datetime.utcnow() < state.blocked_until:
-            wait_time = (state.blocked_until - datetime.utcnow()).total_seconds()
-            logger.warning(f"Host {hostname} blocked until {state.blocked_until}. Waiting {wait_time:.1f}s")
+        if blocked_until_ts is not None and now < blocked_until_ts:
+            wait_time = blocked_until_ts - now
+            logger.warning(f"Host {hostname} blocked for another {wait_time:.1f}s. Waiting")
             time.sleep(wait_time)
             return
 
-        # Get effective delay
-        delay = state.robots_txt_delay or state.crawl_delay or timedelta(seconds=self.default_delay)
-
         # Calculate wait time
-        time_since_last = datetime.utcnow() - state.last_crawl_time
-        if time_since_last < delay:
-            wait_seconds = (delay - time_since_last).total_seconds()
-            logger.debug(f"Rate limiting {hostname}: waiting {wait_seconds:.2f}s")
+        wait_seconds = last_crawl_ts + delay_seconds - now
+        if wait_seconds > 0:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rate limiting %s: waiting %.2fs", hostname, wait_seconds)
             time.sleep(wait_seconds)
 
-    def block_host(self, hostname: str, duration_seconds: int):
+    def block_host(self, hostname: str, duration_seconds: int) -> None:
         """
         Temporarily block a host (e.g., after receiving 429 or 503).
 
@@ -257,20 +549,16 @@ class DatabaseRateLimiter:
             hostname: Hostname to block
             duration_seconds: Block duration in seconds
         """
-        state = self.get_host_state(hostname)
         blocked_until = datetime.utcnow() + timedelta(seconds=duration_seconds)
 
-        if state is None:
-            state = HostCrawlState(
-                hostname=hostname,
-                last_crawl_time=datetime.utcnow(),
-                blocked_until=blocked_until
-            )
-            self.db.add(state)
-        else:
-            state.blocked_until = blocked_until
+        self._stage(hostname, {
+            'hostname': hostname,
+            'last_crawl_time': datetime.utcnow(),
+            'blocked_until': blocked_until,
+        }, {'blocked_until'})
 
-        self.db.commit()
+        # Blocks take effect immediately (this also writes pending updates)
+        self.flush()
         logger.warning(f"Blocked {hostname} until {blocked_until}")
 
 
@@ -291,12 +579,12 @@ class TokenBucket:
         """
         self.rate = rate
         self.capacity = capacity
-        self.tokens = capacity
-        self.last_update = time.time()
+        self.tokens: float = capacity
+        self.last_update = time.monotonic()
 
-    def _refill(self):
+    def _refill(self) -> None:
         """Refill tokens based on time elapsed."""
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self.last_update
 
         # Add tokens based on elapsed time
@@ -323,7 +611,7 @@ class TokenBucket:
             return True
         return False
 
-    def wait_for_tokens(self, tokens: int = 1):
+    def wait_for_tokens(self, tokens: int = 1) -> None:
         """
         Wait until tokens are available and consume them.
 
@@ -331,10 +619,9 @@ class TokenBucket:
             tokens: Number of tokens to wait for
         """
         while not self.consume(tokens):
-            # Calculate wait time
+            # Sleep exactly until enough tokens will have refilled
             tokens_needed = tokens - self.tokens
-            wait_time = tokens_needed / self.rate
-            time.sleep(min(wait_time, 0.1))  # Sleep in small increments
+            time.sleep(tokens_needed / self.rate)
 
 
 # Global rate limiter instance
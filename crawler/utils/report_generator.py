@@ -7,11 +7,154 @@ with consistent styling and presentation.
 
 from typing import List, Dict, Any
 from datetime import datetime
+from functools import lru_cache
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# Markdown links, removed by ReportGenerator.strip_markdown in their own
+# first pass (keeping the link text) so that emphasis markers inside a URL
+# or next to a link cannot pair up across it. Link bodies exclude their own
+# opening bracket, so a run of unclosed '[' fails at the next one instead of
+# rescanning the rest of the text from every opener (quadratic on long
+# summaries).
+_MARKDOWN_LINK_RE = re.compile(r'\[([^\[\]]+)\]\([^\[\)]+\)')
+
+# Remaining inline constructs, as one alternation so a summary is scanned
+# once more; each keeps its inner text (group 1-6).
+_MARKDOWN_RE = re.compile(
+    r'\*\*\*([^\*]+)\*\*\*'            # bold italic ***text***
+    r'|\*\*([^\*]+)\*\*'              # bold **text**
+    r'|__([^_]+)__'                    # bold __text__
+    r'|\*([^\*]+)\*'                  # italic *text*
+    r'|_([^_]+)_'                      # italic _text_
+    r'|`([^`]+)`'                      # inline code `text`
+)
+
+# Line-anchored constructs need re.MULTILINE, which slows every position of
+# the scan, so they are separate passes; the header and tag passes run only
+# when the text contains '#' or '<'. Tags are excluded from their own body
+# like links above.
+_MARKDOWN_HEADER_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_MARKDOWN_RULE_RE = re.compile(r'^[-*_]{3,}$', re.MULTILINE)
+_HTML_TAG_RE = re.compile(r'<[^<>]+>')
+
+# Anything the markdown patterns could match starts with one of these characters or is
+# a '---' rule line; text without them is returned as-is
+_MARKDOWN_CHAR_RE = re.compile(r'[*_`\[<#]|^-{3,}$', re.MULTILINE)
+
+
+def _strip_markdown_match(match: 're.Match') -> str:
+    """Replacement for one _MARKDOWN_RE match; markup nested inside is stripped too."""
+    return _MARKDOWN_RE.sub(_strip_markdown_match, match.group(match.lastindex))
+
+
+@lru_cache(maxsize=1024)
+def _format_iso_date(date: str) -> str:
+    """
+    Format an ISO 8601 date string for display (e.g. 'January 15, 2024').
+
+    Articles in a digest share few distinct dates, so results are cached.
+    Strings that do not parse are returned unchanged.
+    """
+    try:
+        date_obj = datetime.fromisoformat(date.replace('Z', '+00:00'))
+        return date_obj.strftime('%B %d, %Y')
+    except (ValueError, AttributeError):
+        return date
+
+
+# Stylesheet of the HTML email report (generate_html_report)
+_HTML_REPORT_STYLE = """    <style>
+        body {
+            font-family: 'Courier New', Courier, monospace;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 8px;
+            margin-bottom: 30px;
+        }
+        .header h1 {
+            margin: 0 0 10px 0;
+            font-size: 28px;
+        }
+        .header p {
+            margin: 0;
+            opacity: 0.9;
+            font-size: 16px;
+        }
+        .article-card {
+            background: white;
+            margin-bottom: 20px;
+            padding: 25px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            border-left: 4px solid #667eea;
+        }
+        .article-title {
+            margin: 0 0 10px 0;
+            font-size: 20px;
+        }
+        .article-title a {
+            color: #2c3e50;
+            text-decoration: none;
+            transition: color 0.2s;
+        }
+        .article-title a:hover {
+            color: #667eea;
+        }
+        .article-meta {
+            color: #7f8c8d;
+            font-size: 14px;
+            margin-bottom: 15px;
+        }
+        .article-meta strong {
+            color: #34495e;
+        }
+        .article-summary {
+            color: #555;
+            line-height: 1.7;
+            margin-bottom: 15px;
+        }
+        .read-more {
+            display: inline-block;
+            color: #667eea;
+            text-decoration: none;
+            font-weight: 600;
+            font-size: 14px;
+        }
+        .read-more:hover {
+            text-decoration: underline;
+        }
+        .footer {
+            text-align: center;
+            margin-top: 40px;
+            padding: 20px;
+            color: #7f8c8d;
+            font-size: 12px;
+        }
+        .stats {
+            background: #ecf0f1;
+            padding: 15px;
+            border-radius: 6px;
+            margin-bottom: 30px;
+        }
+        .stats p {
+            margin: 5px 0;
+            font-size: 14px;
+        }
+    </style>
+"""
+
 
 class ReportGenerator:
     """
@@ -21,6 +164,11 @@ class ReportGenerator:
     different notification channels (Slack, email, etc.).
     """
 
+    __slots__ = ('max_summary_length', '_format_cache')
+
+    # Most formatted articles remembered by format_article_summary
+    FORMAT_CACHE_SIZE = 1024
+
     def __init__(self, max_summary_length: int = 300):
         """
         Initialize report generator.
@@ -29,6 +177,9 @@ class ReportGenerator:
             max_summary_length: Maximum characters for summary truncation
         """
         self.max_summary_length = max_summary_length
+        # Article fields -> formatted article, so an article rendered into
+        # several report formats is formatted once
+        self._format_cache: Dict[tuple, Dict[str, str]] = {}
 
     @staticmethod
     def strip_markdown(text: str) -> str:
@@ -36,28 +187,22 @@ class ReportGenerator:
         if not text:
             return ""
 
-        # Remove markdown links [text](url) -> text
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-
-        # Remove bold **text** or __text__ -> text
-        text = re.sub(r'\*\*([^\*]+)\*\*', r'\1', text)
-        text = re.sub(r'__([^_]+)__', r'\1', text)
-
-        # Remove italics *text* or _text_ -> text
-        text = re.sub(r'\*([^\*]+)\*', r'\1', text)
-        text = re.sub(r'_([^_]+)_', r'\1', text)
+        # Plain-text summaries (the common case) need no substitution pass
+        if _MARKDOWN_CHAR_RE.search(text) is None:
+            return text.strip()
 
-        # Remove inline code `text` -> text
-        text = re.sub(r'`([^`]+)`', r'\1', text)
+        # Links, bold, italics and inline code keep their text. Links go
+        # first: an '_' in a URL must not open or close an emphasis span.
+        if '[' in text:
+            text = _MARKDOWN_LINK_RE.sub(r'\1', text)
+        text = _MARKDOWN_RE.sub(_strip_markdown_match, text)
 
-        # Remove headers ### text -> text
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-
-        # Remove horizontal rules
-        text = re.sub(r'^[-*_]{3,}$', '', text, flags=re.MULTILINE)
-
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        # Headers, horizontal rules and HTML tags are removed
+        if '#' in text:
+            text = _MARKDOWN_HEADER_RE.sub('', text)
+        text = _MARKDOWN_RULE_RE.sub('', text)
+        if '<' in text:
+            text = _HTML_TAG_RE.sub('', text)
 
         return text.strip()
 
@@ -77,39 +222,77 @@ class ReportGenerator:
         if len(summary) <= max_len:
             return summary
 
-        # Find last complete word before limit
-        truncated = summary[:max_len]
-        last_space = truncated.rfind(' ')
-
-        if last_space > 0:
-            truncated = truncated[:last_space]
+        # Find last complete word before limit (searching in place, so only
+        # the final cut is copied)
+        last_space = summary.rfind(' ', 0, max_len)
 
-        return truncated + '...'
+        return summary[:last_space if last_space > 0 else max_len] + '...'
 
     def format_article_summary(self, article: Dict[str, Any]) -> Dict[str, str]:
         """
         Format article data for display.
 
+        Results are cached by the article's field values, so formatting the
+        same article again (e.g. for another report format) is a lookup.
+        Treat the returned dictionary as read-only.
+
         Args:
             article: Article data dictionary
 
         Returns:
             Formatted article dictionary
         """
-        # Strip markdown from summary before truncating
+        title = article.get('title', 'Untitled')
+        university = article.get('university_name', 'Unknown University')
+        published_date = article.get('published_date')
         raw_summary = article.get('summary', 'No summary available')
+        url = article.get('url', '')
+        author = article.get('author', '')
+        word_count = article.get('word_count', 0)
+
+        key = (url, title, university, published_date, raw_summary, author, word_count)
+        try:
+            return self._format_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable field value; format without caching
+            key = None
+
+        # Strip markdown from summary before truncating
         plain_summary = self.strip_markdown(raw_summary)
 
-        return {
-            'title': article.get('title', 'Untitled'),
-            'university': article.get('university_name', 'Unknown University'),
-            'date': self._format_date(article.get('published_date')),
+        formatted = {
+            'title': title,
+            'university': university,
+            'date': self._format_date(published_date),
             'summary': self.truncate_summary(plain_summary),
-            'url': article.get('url', ''),
-            'author': article.get('author', ''),
-            'word_count': article.get('word_count', 0)
+            'url': url,
+            'author': author,
+            'word_count': word_count
         }
 
+        if key is not None:
+            if len(self._format_cache) >= self.FORMAT_CACHE_SIZE:
+                self._format_cache.clear()
+            self._format_cache[key] = formatted
+        return formatted
+
+    def format_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Format a list of articles for display.
+
+        The result can be passed to several report generators so each
+        article is formatted only once.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            List of formatted article dictionaries, in the same order
+        """
+        return [self.format_article_summary(article) for article in articles]
+
     def _format_date(self, date: Any) -> str:
         """
         Format date for display.
@@ -121,11 +304,7 @@ class ReportGenerator:
             Formatted date string
         """
         if isinstance(date, str):
-            try:
-                date_obj = datetime.fromisoformat(date.replace('Z', '+00:00'))
-                return date_obj.strftime('%B %d, %Y')
-            except (ValueError, AttributeError):
-                return date
+            return _format_iso_date(date)
 
         elif isinstance(date, datetime):
             return date.strftime('%B %d, %Y')
@@ -135,12 +314,17 @@ class ReportGenerator:
 
         return str(date) if date else 'Date unknown'
 
-    def generate_text_report(self, articles: List[Dict[str, Any]]) -> str:
+    def generate_text_report(
+        self,
+        articles: List[Dict[str, Any]],
+        formatted: List[Dict[str, str]] = None
+    ) -> str:
         """
         Generate plain text report.
 
         Args:
             articles: List of article dictionaries
+            formatted: Optional result of format_articles(articles)
 
         Returns:
             Plain text report
@@ -154,12 +338,14 @@ class ReportGenerator:
             f"\nFound {len(articles)} AI-related articles\n"
         ]
 
-        for i, article in enumerate(articles, 1):
-            formatted = self.format_article_summary(article)
-            lines.append(f"\n{i}. {formatted['title']}")
-            lines.append(f"   {formatted['university']} | {formatted['date']}")
-            lines.append(f"   {formatted['summary']}")
-            lines.append(f"   Read more: {formatted['url']}")
+        if formatted is None:
+            formatted = self.format_articles(articles)
+
+        for i, item in enumerate(formatted, 1):
+            lines.append(f"\n{i}. {item['title']}")
+            lines.append(f"   {item['university']} | {item['date']}")
+            lines.append(f"   {item['summary']}")
+            lines.append(f"   Read more: {item['url']}")
 
         return '\n'.join(lines)
 
@@ -198,7 +384,8 @@ class ReportGenerator:
     def generate_html_report(
         self,
         articles: List[Dict[str, Any]],
-        title: str = "AI News Digest"
+        title: str = "AI News Digest",
+        formatted: List[Dict[str, str]] = None
     ) -> str:
         """
         Generate HTML-formatted report for email.
@@ -206,6 +393,7 @@ class ReportGenerator:
         Args:
             articles: List of article dictionaries
             title: Report title
+            formatted: Optional result of format_articles(articles)
 
         Returns:
             HTML report
@@ -213,7 +401,7 @@ class ReportGenerator:
         if not articles:
             return self._generate_empty_html_report(title)
 
-        article_html = self._generate_article_cards_html(articles)
+        article_html = self._generate_article_cards_html(articles, formatted)
 
         html = f"""
 <!DOCTYPE html>
@@ -222,94 +410,7 @@ class ReportGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <style>
-        body {{
-            font-family: 'Courier New', Courier, monospace;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-        }}
-        .header h1 {{
-            margin: 0 0 10px 0;
-            font-size: 28px;
-        }}
-        .header p {{
-            margin: 0;
-            opacity: 0.9;
-            font-size: 16px;
-        }}
-        .article-card {{
-            background: white;
-            margin-bottom: 20px;
-            padding: 25px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            border-left: 4px solid #667eea;
-        }}
-        .article-title {{
-            margin: 0 0 10px 0;
-            font-size: 20px;
-        }}
-        .article-title a {{
-            color: #2c3e50;
-            text-decoration: none;
-            transition: color 0.2s;
-        }}
-        .article-title a:hover {{
-            color: #667eea;
-        }}
-        .article-meta {{
-            color: #7f8c8d;
-            font-size: 14px;
-            margin-bottom: 15px;
-        }}
-        .article-meta strong {{
-            color: #34495e;
-        }}
-        .article-summary {{
-            color: #555;
-            line-height: 1.7;
-            margin-bottom: 15px;
-        }}
-        .read-more {{
-            display: inline-block;
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 14px;
-        }}
-        .read-more:hover {{
-            text-decoration: underline;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding: 20px;
-            color: #7f8c8d;
-            font-size: 12px;
-        }}
-        .stats {{
-            background: #ecf0f1;
-            padding: 15px;
-            border-radius: 6px;
-            margin-bottom: 30px;
-        }}
-        .stats p {{
-            margin: 5px 0;
-            font-size: 14px;
-        }}
-    </style>
-</head>
+{_HTML_REPORT_STYLE}</head>
 <body>
     <div class="header">
         <h1>🤖 {title}</h1>
@@ -331,29 +432,31 @@ class ReportGenerator:
 """
         return html
 
-    def _generate_article_cards_html(self, articles: List[Dict[str, Any]]) -> str:
+    def _generate_article_cards_html(
+        self,
+        articles: List[Dict[str, Any]],
+        formatted: List[Dict[str, str]] = None
+    ) -> str:
         """Generate HTML for article cards."""
-        cards = []
+        if formatted is None:
+            formatted = self.format_articles(articles)
 
-        for article in articles:
-            formatted = self.format_article_summary(article)
-            card = f"""
+        # An f-string per card is compiled once with the method; a shared
+        # str.format template would be re-parsed for every card
+        return '\n'.join([f"""
     <div class="article-card">
         <h2 class="article-title">
-            <a href="{formatted['url']}" target="_blank">{formatted['title']}</a>
+            <a href="{item['url']}" target="_blank">{item['title']}</a>
         </h2>
         <div class="article-meta">
-            <strong>{formatted['university']}</strong> • {formatted['date']}
+            <strong>{item['university']}</strong> • {item['date']}
         </div>
         <div class="article-summary">
-            {formatted['summary']}
+            {item['summary']}
         </div>
-        <a href="{formatted['url']}" class="read-more" target="_blank">Read full article →</a>
+        <a href="{item['url']}" class="read-more" target="_blank">Read full article →</a>
     </div>
-"""
-            cards.append(card)
-
-        return '\n'.join(cards)
+""" for item in formatted])
 
     def _generate_empty_html_report(self, title: str) -> str:
         """Generate HTML for empty report."""
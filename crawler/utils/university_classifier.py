@@ -1,14 +1,122 @@
 """
 University Classifier - Categorizes universities into Peer, R1, HPC, National Lab, and Global
 """
-import json
-from pathlib import Path
-from typing import Set, Tuple
+import re
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple
+
+from crawler.utils._config_cache import load_config_file
+
+# Names are indexed for substring search by this many leading characters
+# (the shortest name used for fuzzy matching outside peer/R1 is 5)
+_PREFIX_LEN = 5
+
+# Common abbreviations mapping (read-only, shared by all classifiers)
+_ABBREVIATIONS = MappingProxyType({
+    'mit': 'massachusetts institute of technology',
+    'stanford': 'stanford university',
+    'harvard': 'harvard university',
+    'berkeley': 'university of california, berkeley',
+    'uc berkeley': 'university of california, berkeley',
+    'cmu': 'carnegie mellon university',
+    'caltech': 'california institute of technology',
+    'penn': 'university of pennsylvania',
+    'columbia': 'columbia university',
+    'cornell': 'cornell university',
+    'duke': 'duke university',
+    'yale': 'yale university',
+    'princeton': 'princeton university',
+    'uchicago': 'university of chicago',
+    'jhu': 'johns hopkins university',
+    'northwestern': 'northwestern university',
+    'brown': 'brown university',
+    'dartmouth': 'dartmouth college',
+    'rice': 'rice university',
+    'vanderbilt': 'vanderbilt university',
+    'ucla': 'university of california, los angeles',
+    'ucsd': 'university of california, san diego',
+    'gatech': 'georgia institute of technology',
+    'georgia tech': 'georgia institute of technology',
+    'uiuc': 'university of illinois urbana-champaign',
+    'umich': 'university of michigan',
+    'uw': 'university of washington',
+    'ut austin': 'university of texas at austin',
+    # Global institution abbreviations
+    'eth': 'eth zurich',
+    'epfl': 'epfl',
+    'oxford': 'university of oxford',
+    'cambridge': 'university of cambridge',
+    'imperial': 'imperial college london',
+    'ucl': 'university college london',
+    'tsinghua': 'tsinghua university',
+    'peking': 'peking university',
+    'utokyo': 'university of tokyo',
+    'kaist': 'kaist',
+    'nus': 'national university of singapore',
+    'ntu': 'nanyang technological university',
+    'technion': 'technion',
+    # National lab abbreviations
+    'anl': 'argonne national laboratory',
+    'llnl': 'lawrence livermore national laboratory',
+    'lanl': 'los alamos national laboratory',
+    'ornl': 'oak ridge national laboratory',
+    'lbnl': 'lawrence berkeley national laboratory',
+    'snl': 'sandia national laboratories',
+    'pnnl': 'pacific northwest national laboratory',
+    'bnl': 'brookhaven national laboratory',
+    'slac': 'slac national accelerator laboratory',
+    'fermilab': 'fermi national accelerator laboratory',
+    'inl': 'idaho national laboratory',
+    'nrel': 'national renewable energy laboratory',
+    'pppl': 'princeton plasma physics laboratory',
+    'srnl': 'savannah river national laboratory',
+    'netl': 'national energy technology laboratory',
+    'jpl': 'nasa jpl',
+    'darpa': 'darpa',
+    'mitre': 'mitre corporation',
+    'rand': 'rand corporation',
+    'lincoln lab': 'mit lincoln laboratory',
+    'jhu apl': 'johns hopkins apl',
+    'sei': 'cmu software engineering institute',
+    'nist': 'nist',
+    'nsf': 'national science foundation',
+    'arpa-e': 'arpa-e',
+})
+
+# Common prefixes removed by _normalize_name, each at most once and in this
+# order
+_NAME_PREFIX_RE = re.compile(r'^(?:the )?(?:university of )?(?:university at )?')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """
+    Normalize university name for better matching.
+    Removes common variations like 'The', trailing commas, etc.
+
+    The same names are classified over and over, so results are cached.
+    """
+    if not name:
+        return ''
+
+    return _NAME_PREFIX_RE.sub('', name.lower().strip(), count=1).strip()
 
 
 class UniversityClassifier:
     """Classifies universities and facilities into five categories for HTML display"""
 
+    __slots__ = (
+        'peer_institutions', 'r1_institutions',
+        'hpc_exact', 'hpc_fuzzy',
+        'national_labs_exact', 'national_labs_fuzzy',
+        'global_exact', 'global_fuzzy',
+        '_exact_category', '_fuzzy_index', '_prefix_index', '_short_names',
+    )
+
+    abbreviations = _ABBREVIATIONS
+
     def __init__(self):
         self.peer_institutions = self._load_peer_institutions()
         self.r1_institutions = self._load_r1_institutions()
@@ -16,99 +124,98 @@ class UniversityClassifier:
         self.national_labs_exact, self.national_labs_fuzzy = self._load_national_labs()
         self.global_exact, self.global_fuzzy = self._load_global_institutions()
 
-        # Common abbreviations mapping
-        self.abbreviations = {
-            'mit': 'massachusetts institute of technology',
-            'stanford': 'stanford university',
-            'harvard': 'harvard university',
-            'berkeley': 'university of california, berkeley',
-            'uc berkeley': 'university of california, berkeley',
-            'cmu': 'carnegie mellon university',
-            'caltech': 'california institute of technology',
-            'penn': 'university of pennsylvania',
-            'columbia': 'columbia university',
-            'cornell': 'cornell university',
-            'duke': 'duke university',
-            'yale': 'yale university',
-            'princeton': 'princeton university',
-            'uchicago': 'university of chicago',
-            'jhu': 'johns hopkins university',
-            'northwestern': 'northwestern university',
-            'brown': 'brown university',
-            'dartmouth': 'dartmouth college',
-            'rice': 'rice university',
-            'vanderbilt': 'vanderbilt university',
-            'ucla': 'university of california, los angeles',
-            'ucsd': 'university of california, san diego',
-            'gatech': 'georgia institute of technology',
-            'georgia tech': 'georgia institute of technology',
-            'uiuc': 'university of illinois urbana-champaign',
-            'umich': 'university of michigan',
-            'uw': 'university of washington',
-            'ut austin': 'university of texas at austin',
-            # Global institution abbreviations
-            'eth': 'eth zurich',
-            'epfl': 'epfl',
-            'oxford': 'university of oxford',
-            'cambridge': 'university of cambridge',
-            'imperial': 'imperial college london',
-            'ucl': 'university college london',
-            'tsinghua': 'tsinghua university',
-            'peking': 'peking university',
-            'utokyo': 'university of tokyo',
-            'kaist': 'kaist',
-            'nus': 'national university of singapore',
-            'ntu': 'nanyang technological university',
-            'technion': 'technion',
-            # National lab abbreviations
-            'anl': 'argonne national laboratory',
-            'llnl': 'lawrence livermore national laboratory',
-            'lanl': 'los alamos national laboratory',
-            'ornl': 'oak ridge national laboratory',
-            'lbnl': 'lawrence berkeley national laboratory',
-            'snl': 'sandia national laboratories',
-            'pnnl': 'pacific northwest national laboratory',
-            'bnl': 'brookhaven national laboratory',
-            'slac': 'slac national accelerator laboratory',
-            'fermilab': 'fermi national accelerator laboratory',
-            'inl': 'idaho national laboratory',
-            'nrel': 'national renewable energy laboratory',
-            'pppl': 'princeton plasma physics laboratory',
-            'srnl': 'savannah river national laboratory',
-            'netl': 'national energy technology laboratory',
-            'jpl': 'nasa jpl',
-            'darpa': 'darpa',
-            'mitre': 'mitre corporation',
-            'rand': 'rand corporation',
-            'lincoln lab': 'mit lincoln laboratory',
-            'jhu apl': 'johns hopkins apl',
-            'sei': 'cmu software engineering institute',
-            'nist': 'nist',
-            'nsf': 'national science foundation',
-            'arpa-e': 'arpa-e',
-        }
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """
+        Precompute lookup structures for classify().
+
+        Exact names map straight to their category (highest priority wins),
+        and each category's fuzzy names are also joined into one newline
+        separated string, so "is the query part of any name" is a single
+        substring search instead of a loop. For the reverse test ("is a name
+        part of the query") all fuzzy names are indexed by their first
+        _PREFIX_LEN characters, so one pass over the query finds every
+        contained name (see _contained_rank).
+        """
+        # Priority: national_lab > hpc > peer > global > r1
+        exact_sets = (
+            ('national_lab', self.national_labs_exact),
+            ('hpc', self.hpc_exact),
+            ('peer', self.peer_institutions),
+            ('global', self.global_exact),
+            ('r1', self.r1_institutions),
+        )
+        self._exact_category = {}
+        for category, names in exact_sets:
+            for name in names:
+                self._exact_category.setdefault(name, category)
+
+        # Peer and R1 sets hold full names only; the other fuzzy sets still
+        # skip names shorter than 5 characters
+        fuzzy_sets = (
+            ('national_lab', {n for n in self.national_labs_fuzzy if len(n) >= 5}),
+            ('hpc', {n for n in self.hpc_fuzzy if len(n) >= 5}),
+            ('peer', self.peer_institutions),
+            ('global', {n for n in self.global_fuzzy if len(n) >= 5}),
+            ('r1', self.r1_institutions),
+        )
+        index = []
+        self._prefix_index: Dict[str, List[Tuple[int, str]]] = {}
+        short_names = []
+        for rank, (category, names) in enumerate(fuzzy_sets):
+            ordered = tuple(sorted(names))
+            index.append((category, ordered, '\n'.join(ordered)))
+            for name in ordered:
+                if len(name) >= _PREFIX_LEN:
+                    self._prefix_index.setdefault(name[:_PREFIX_LEN], []).append((rank, name))
+                else:
+                    short_names.append((rank, name))
+        self._fuzzy_index = tuple(index)
+        self._short_names = tuple(short_names)
+
+    def _contained_rank(self, normalized: str) -> int:
+        """
+        Find the highest-priority fuzzy category with a name inside the query.
+
+        Args:
+            normalized: Normalized query name
+
+        Returns:
+            Index into self._fuzzy_index, or len(self._fuzzy_index) if no
+            registered name occurs in the query
+        """
+        best = len(self._fuzzy_index)
+        for rank, name in self._short_names:
+            if rank < best and name in normalized:
+                best = rank
+
+        lookup = self._prefix_index.get
+        for start in range(len(normalized) - _PREFIX_LEN + 1):
+            candidates = lookup(normalized[start:start + _PREFIX_LEN])
+            if candidates:
+                for rank, name in candidates:
+                    if rank < best and normalized.startswith(name, start):
+                        best = rank
+                        if best == 0:
+                            return best
+        return best
 
     def _load_peer_institutions(self) -> Set[str]:
         """Load peer institution names from peer_institutions.json"""
-        path = Path("crawler/config/peer_institutions.json")
-        if not path.exists():
+        data = load_config_file("peer_institutions.json")
+        if data is None:
             return set()
 
-        with open(path, 'r') as f:
-            data = json.load(f)
-
         universities = data.get('universities', [])
         return {univ['name'].lower() for univ in universities}
 
     def _load_r1_institutions(self) -> Set[str]:
         """Load R1 institution names from r1_universities.json"""
-        path = Path("crawler/config/r1_universities.json")
-        if not path.exists():
+        data = load_config_file("r1_universities.json")
+        if data is None:
             return set()
 
-        with open(path, 'r') as f:
-            data = json.load(f)
-
         universities = data.get('universities', [])
         return {univ['name'].lower() for univ in universities}
 
@@ -116,13 +223,10 @@ class UniversityClassifier:
         """Load HPC & Research Center names from major_facilities.json.
         Returns (exact_match_set, fuzzy_match_set). Short abbreviations
         are only in the exact set to prevent false substring matches."""
-        path = Path("crawler/config/major_facilities.json")
-        if not path.exists():
+        data = load_config_file("major_facilities.json")
+        if data is None:
             return set(), set()
 
-        with open(path, 'r') as f:
-            data = json.load(f)
-
         facilities = data.get('facilities', [])
         exact = set()
         fuzzy = set()
@@ -141,13 +245,10 @@ class UniversityClassifier:
         """Load national laboratory names from national_laboratories.json.
         Returns (exact_match_set, fuzzy_match_set). Short abbreviations
         are only in the exact set to prevent false substring matches."""
-        path = Path("crawler/config/national_laboratories.json")
-        if not path.exists():
+        data = load_config_file("national_laboratories.json")
+        if data is None:
             return set(), set()
 
-        with open(path, 'r') as f:
-            data = json.load(f)
-
         facilities = data.get('facilities', [])
         exact = set()
         fuzzy = set()
@@ -166,13 +267,10 @@ class UniversityClassifier:
         """Load global institution names from global_institutions.json.
         Returns (exact_match_set, fuzzy_match_set). Short abbreviations
         are only in the exact set to prevent false substring matches."""
-        path = Path("crawler/config/global_institutions.json")
-        if not path.exists():
+        data = load_config_file("global_institutions.json")
+        if data is None:
             return set(), set()
 
-        with open(path, 'r') as f:
-            data = json.load(f)
-
         universities = data.get('universities', [])
         exact = set()
         fuzzy = set()
@@ -187,24 +285,6 @@ class UniversityClassifier:
                     fuzzy.add(abbrev)
         return exact, fuzzy
 
-    def _normalize_name(self, name: str) -> str:
-        """
-        Normalize university name for better matching.
-        Removes common variations like 'The', trailing commas, etc.
-        """
-        if not name:
-            return ''
-
-        name = name.lower().strip()
-
-        # Remove common prefixes
-        prefixes_to_remove = ['the ', 'university of ', 'university at ']
-        for prefix in prefixes_to_remove:
-            if name.startswith(prefix):
-                name = name[len(prefix):]
-
-        return name.strip()
-
     def classify(self, university_name: str) -> str:
         """
         Classify a university or facility into one of five categories.
@@ -225,55 +305,28 @@ class UniversityClassifier:
         if name_lower in self.abbreviations:
             name_lower = self.abbreviations[name_lower]
 
-        # Check national labs first (highest priority) - exact match
-        if name_lower in self.national_labs_exact:
-            return 'national_lab'
-
-        # Check HPC centers - exact match
-        if name_lower in self.hpc_exact:
-            return 'hpc'
-
-        # Check peer institutions
-        if name_lower in self.peer_institutions:
-            return 'peer'
-
-        # Check global institutions - exact match
-        if name_lower in self.global_exact:
-            return 'global'
-
-        # Check R1 exact match
-        if name_lower in self.r1_institutions:
-            return 'r1'
+        # Exact match, national labs first (highest priority)
+        category = self._exact_category.get(name_lower)
+        if category is not None:
+            return category
 
         # Fuzzy matching with normalized names
         # Uses fuzzy sets that exclude short abbreviations to prevent
         # false positives (e.g. "ida" matching "florida")
-        normalized = self._normalize_name(university_name)
+        normalized = _normalize_name(university_name)
         if normalized:
-            # Check national labs fuzzy
-            for lab in self.national_labs_fuzzy:
-                if len(lab) >= 5 and (normalized in lab or lab in normalized):
-                    return 'national_lab'
-
-            # Check HPC centers fuzzy
-            for hpc in self.hpc_fuzzy:
-                if len(hpc) >= 5 and (normalized in hpc or hpc in normalized):
-                    return 'hpc'
-
-            # Check peer institutions fuzzy
-            for peer in self.peer_institutions:
-                if normalized in peer or peer in normalized:
-                    return 'peer'
-
-            # Check global institutions fuzzy
-            for glob in self.global_fuzzy:
-                if len(glob) >= 5 and (normalized in glob or glob in normalized):
-                    return 'global'
-
-            # Check R1 institutions fuzzy
-            for r1 in self.r1_institutions:
-                if normalized in r1 or r1 in normalized:
-                    return 'r1'
+            # A query without newlines can only occur inside the joined
+            # string by occurring inside one of the names
+            searchable = '\n' not in normalized
+            contained_rank = self._contained_rank(normalized)
+            for rank, (category, names, joined) in enumerate(self._fuzzy_index):
+                if rank == contained_rank:
+                    return category
+                if searchable:
+                    if normalized in joined:
+                        return category
+                elif any(normalized in name for name in names):
+                    return category
 
         # Default to r1 category
         return 'r1'
@@ -292,3 +345,27 @@ class UniversityClassifier:
             len(self.national_labs_exact),
             len(self.global_exact)
         )
+
+
+# Global classifier instance, created on first use. Concurrent first callers
+# would each build the name sets and indexes, so creation is locked.
+_classifier_instance: Optional[UniversityClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_classifier() -> UniversityClassifier:
+    """
+    Get the global UniversityClassifier instance.
+
+    Prefer this over constructing a classifier, which builds its name sets
+    and lookup indexes from the config files each time.
+
+    Returns:
+        The singleton classifier instance
+    """
+    global _classifier_instance
+    if _classifier_instance is None:
+        with _classifier_lock:
+            if _classifier_instance is None:
+                _classifier_instance = UniversityClassifier()
+    return _classifier_instance
@@ -5,18 +5,43 @@ This module helps standardize university names across different sources by mappi
 hostnames to canonical names from the configuration files.
 """
 
-import json
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
-from urllib.parse import urlparse
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from crawler.utils._config_cache import CONFIG_DIR, load_config_file
 
 logger = logging.getLogger(__name__)
 
+# Key under which a domain trie node stores its canonical name; child nodes
+# are keyed by label strings, so it cannot collide with one
+_NAME_KEY = None
+
+
+def _base_domain(hostname: str) -> Optional[str]:
+    """
+    Get the last two labels of a hostname (e.g. 'stanford.edu').
+
+    Args:
+        hostname: Lower-cased hostname
+
+    Returns:
+        Base domain, or None if the hostname has a single label
+    """
+    rest, dot, tld = hostname.rpartition('.')
+    if not dot:
+        return None
+    return f"{rest.rpartition('.')[2]}.{tld}"
+
 
 class UniversityNameMapper:
     """Maps hostnames to canonical university names."""
 
+    __slots__ = ('hostname_to_name', '_domain_trie', '_cached_lookup')
+
     # Source files to load: (filename, key_for_entries, name_field)
     SOURCE_FILES = [
         ("universities.json", None, "name"),               # Legacy format (list of dicts)
@@ -35,13 +60,20 @@ class UniversityNameMapper:
             config_path: Path to config directory. If None, uses default location.
         """
         if config_path is None:
-            config_dir = Path(__file__).parent.parent / "config"
+            config_dir = CONFIG_DIR
         else:
             # Support both file path (legacy) and directory path
             config_dir = config_path if config_path.is_dir() else config_path.parent
 
         self.hostname_to_name: Dict[str, str] = {}
+        # Reverse-label trie over the mapped domains ('edu' -> 'stanford'
+        # -> 'news'), so a hostname resolves to its most specific mapped
+        # domain at any subdomain depth
+        self._domain_trie: Dict[Optional[str], Any] = {}
         self._load_all_sources(config_dir)
+        # Crawled hostnames repeat for every article from a site; cache the
+        # lookup per raw hostname (the fallback is applied outside the cache)
+        self._cached_lookup = lru_cache(maxsize=2048)(self._lookup_canonical)
 
     def _load_all_sources(self, config_dir: Path) -> None:
         """
@@ -53,13 +85,10 @@ class UniversityNameMapper:
         total_loaded = 0
 
         for filename, entries_key, name_field in self.SOURCE_FILES:
-            filepath = config_dir / filename
-            if not filepath.exists():
-                continue
-
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = load_config_file(filename, config_dir)
+                if data is None:
+                    continue
 
                 # Get the entries list
                 if entries_key is None:
@@ -103,25 +132,39 @@ class UniversityNameMapper:
                 continue
 
             # Parse the news URL to get the hostname
-            parsed = urlparse(news_url)
-            hostname = parsed.netloc.lower()
+            hostname = urlsplit(news_url).netloc.lower()
             if not hostname:
                 continue
 
             # Store full hostname mapping
             self.hostname_to_name[hostname] = name
+            self._domain_node(hostname)[_NAME_KEY] = name
 
-            # Also store base domain mapping (e.g., stanford.edu)
-            parts = hostname.split('.')
-            if len(parts) >= 2:
-                base_domain = '.'.join(parts[-2:])
-                if base_domain not in self.hostname_to_name:
-                    self.hostname_to_name[base_domain] = name
+            # Also map the base domain (e.g., stanford.edu) unless it is
+            # already mapped, so any other subdomain resolves to it
+            base_domain = _base_domain(hostname)
+            if base_domain is not None:
+                self._domain_node(base_domain).setdefault(_NAME_KEY, name)
 
             count += 1
 
         return count
 
+    def _domain_node(self, domain: str) -> Dict[Optional[str], Any]:
+        """
+        Get the trie node for a domain, creating missing nodes.
+
+        Args:
+            domain: Lower-cased domain name
+
+        Returns:
+            The node for the domain's last (leftmost) label
+        """
+        node = self._domain_trie
+        for label in reversed(domain.split('.')):
+            node = node.setdefault(label, {})
+        return node
+
     @staticmethod
     def _extract_news_url(entry: dict) -> Optional[str]:
         """Extract the primary news URL from various source formats."""
@@ -146,6 +189,34 @@ class UniversityNameMapper:
 
         return None
 
+    def _lookup_canonical(self, hostname: str) -> Tuple[str, Optional[str]]:
+        """
+        Look up the canonical name for a hostname.
+
+        Args:
+            hostname: The hostname to look up
+
+        Returns:
+            Tuple of (normalized hostname, canonical name or None)
+        """
+        # Normalize hostname
+        hostname = hostname.lower().strip()
+
+        # A configured hostname is the deepest possible match
+        name = self.hostname_to_name.get(hostname)
+        if name is not None:
+            return hostname, name
+
+        # Otherwise walk the labels from the TLD down; the closest mapped
+        # parent domain wins
+        node = self._domain_trie
+        for label in reversed(hostname.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            name = node.get(_NAME_KEY, name)
+        return hostname, name
+
     def get_canonical_name(self, hostname: str, fallback_sitename: Optional[str] = None) -> str:
         """
         Get the canonical university name for a given hostname.
@@ -160,19 +231,9 @@ class UniversityNameMapper:
         if not hostname:
             return fallback_sitename or "Unknown"
 
-        # Normalize hostname
-        hostname = hostname.lower().strip()
-
-        # Try exact match first
-        if hostname in self.hostname_to_name:
-            return self.hostname_to_name[hostname]
-
-        # Try extracting base domain and matching
-        parts = hostname.split('.')
-        if len(parts) >= 2:
-            base_domain = '.'.join(parts[-2:])
-            if base_domain in self.hostname_to_name:
-                return self.hostname_to_name[base_domain]
+        hostname, name = self._cached_lookup(hostname)
+        if name is not None:
+            return name
 
         # If no match found, use fallback or hostname
         if fallback_sitename:
@@ -182,9 +243,35 @@ class UniversityNameMapper:
             logger.debug(f"No mapping found for {hostname}, using hostname as name")
             return hostname
 
+    def get_canonical_names(self, hostnames: Iterable[str]) -> List[str]:
+        """
+        Get canonical university names for many hostnames at once.
+
+        Each distinct hostname is resolved once, so a report whose articles
+        come from a handful of sites does one lookup per site.
+
+        Args:
+            hostnames: Hostnames to look up, typically with many repeats
 
-# Global mapper instance
+        Returns:
+            Canonical names in the same order as hostnames, as returned by
+            get_canonical_name() without a fallback sitename
+        """
+        resolved: Dict[str, str] = {}
+        names = []
+        for hostname in hostnames:
+            name = resolved.get(hostname)
+            if name is None:
+                name = resolved[hostname] = self.get_canonical_name(hostname)
+            names.append(name)
+        return names
+
+
+# Global mapper instance, created on first use. The spider and pipeline
+# threads may ask for it concurrently, so creation is locked to load the
+# config files only once.
 _mapper_instance: Optional[UniversityNameMapper] = None
+_mapper_lock = threading.Lock()
 
 
 def get_mapper() -> UniversityNameMapper:
@@ -196,5 +283,7 @@ def get_mapper() -> UniversityNameMapper:
     """
     global _mapper_instance
     if _mapper_instance is None:
-        _mapper_instance = UniversityNameMapper()
+        with _mapper_lock:
+            if _mapper_instance is None:
+                _mapper_instance = UniversityNameMapper()
     return _mapper_instance
@@ -8,182 +8,183 @@ a database connection or actual crawl data.
 
 from pathlib import Path
 from datetime import datetime
-
-
-def generate_demo_index():
-    """Generate a demo index.html page"""
-    date_str = datetime.now().strftime('%A, %B %d, %Y')
-
-    html = f'''<!DOCTYPE html>
+from string import Template
+
+
+# Rules shared by the demo pages, written once to docs/styles/demo.css
+_DEMO_CSS = '''* { margin: 0; padding: 0; box-sizing: border-box; }
+
+body {
+    font-family: 'Courier New', Courier, monospace;
+    background-color: #ffffff;
+    color: #000000;
+    max-width: 900px;
+    margin: 0 auto;
+    padding: 20px;
+    line-height: 1.5;
+}
+
+.header {
+    text-align: center;
+    border-bottom: 3px solid #000;
+    padding-bottom: 15px;
+    margin-bottom: 25px;
+}
+
+.header h1 {
+    font-size: 42px;
+    font-weight: bold;
+    letter-spacing: -1px;
+    margin-bottom: 5px;
+}
+
+.header .tagline {
+    font-size: 14px;
+    color: #666;
+    font-style: italic;
+}
+
+.nav a {
+    color: #cc0000;
+    text-decoration: none;
+    font-weight: bold;
+    margin: 0 15px;
+    font-size: 14px;
+}
+
+.nav a:hover {
+    text-decoration: underline;
+}
+
+.footer {
+    text-align: center;
+    margin-top: 40px;
+    padding-top: 20px;
+    border-top: 2px solid #000;
+    font-size: 12px;
+    color: #666;
+}
+'''
+
+# Demo front page; only the date and update time vary between runs
+_DEMO_INDEX_TEMPLATE = Template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI University News - {date_str}</title>
+    <title>AI University News - $date_str</title>
+    <link rel="stylesheet" href="styles/demo.css">
     <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-
-        body {{
-            font-family: 'Courier New', Courier, monospace;
-            background-color: #ffffff;
-            color: #000000;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            line-height: 1.5;
-        }}
-
-        .header {{
-            text-align: center;
-            border-bottom: 3px solid #000;
-            padding-bottom: 15px;
-            margin-bottom: 25px;
-        }}
-
-        .header h1 {{
-            font-size: 42px;
-            font-weight: bold;
-            letter-spacing: -1px;
-            margin-bottom: 5px;
-        }}
-
-        .header .tagline {{
-            font-size: 14px;
-            color: #666;
-            font-style: italic;
-        }}
-
-        .header .date {{
+        .header .date {
             font-size: 16px;
             color: #000;
             margin-top: 10px;
             font-weight: bold;
-        }}
+        }
 
-        .nav {{
+        .nav {
             text-align: center;
             margin-bottom: 20px;
             padding: 10px;
             background-color: #f5f5f5;
             border: 1px solid #ddd;
-        }}
-
-        .nav a {{
-            color: #cc0000;
-            text-decoration: none;
-            font-weight: bold;
-            margin: 0 15px;
-            font-size: 14px;
-        }}
-
-        .nav a:hover {{
-            text-decoration: underline;
-        }}
+        }
 
-        .stats {{
+        .stats {
             text-align: center;
             font-size: 14px;
             color: #333;
             margin-bottom: 20px;
             padding: 10px;
             background-color: #f9f9f9;
-        }}
+        }
 
-        .three-column-layout {{
+        .three-column-layout {
             display: grid;
             grid-template-columns: 1fr 1fr 1fr;
             gap: 20px;
             margin-top: 20px;
-        }}
+        }
 
-        .column {{
+        .column {
             border: 2px solid #ddd;
             padding: 15px;
             background-color: #fafafa;
             min-height: 200px;
-        }}
+        }
 
-        .column-title {{
+        .column-title {
             font-size: 22px;
             color: #cc0000;
             margin-bottom: 15px;
             padding-bottom: 10px;
             border-bottom: 3px solid #cc0000;
             text-align: center;
-        }}
+        }
 
-        .university-section {{
+        .university-section {
             margin-bottom: 30px;
             border-bottom: 1px solid #ddd;
             padding-bottom: 20px;
-        }}
+        }
 
-        .university-section h3 {{
+        .university-section h3 {
             font-size: 18px;
             color: #000;
             margin-bottom: 12px;
             padding-bottom: 5px;
             border-bottom: 2px solid #cc0000;
-        }}
+        }
 
-        .article {{
+        .article {
             margin-bottom: 15px;
             padding-left: 10px;
-        }}
+        }
 
-        .headline a {{
+        .headline a {
             color: #0000cc;
             text-decoration: none;
             font-size: 18px;
             font-weight: bold;
-        }}
+        }
 
-        .headline a:hover {{
+        .headline a:hover {
             text-decoration: underline;
-        }}
+        }
 
-        .topics {{
+        .topics {
             font-size: 12px;
             color: #666;
             font-style: italic;
             margin-left: 8px;
-        }}
+        }
 
-        .meta {{
+        .meta {
             font-size: 12px;
             color: #666;
             font-style: italic;
-        }}
+        }
 
-        .summary {{
+        .summary {
             font-size: 13px;
             color: #333;
             margin-top: 5px;
             padding-left: 10px;
             line-height: 1.5;
-        }}
-
-        .footer {{
-            text-align: center;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 2px solid #000;
-            font-size: 12px;
-            color: #666;
-        }}
+        }
 
-        @media (max-width: 1024px) {{
-            .three-column-layout {{
+        @media (max-width: 1024px) {
+            .three-column-layout {
                 grid-template-columns: 1fr;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="header">
         <h1>AI UNIVERSITY NEWS</h1>
         <div class="tagline">Latest AI Research & Developments from Top Universities (Last 3 Days)</div>
-        <div class="date">Updated: {date_str}</div>
+        <div class="date">Updated: $date_str</div>
     </div>
 
     <div class="nav">
@@ -287,13 +288,20 @@ def generate_demo_index():
 
     <div class="footer">
         <p>Powered by AI University News Crawler</p>
-        <p>Last updated: {datetime.now().strftime('%I:%M %p UTC')}</p>
+        <p>Last updated: $updated_time</p>
         <p><em>This is a demo page - run the crawler to generate real data</em></p>
     </div>
 </body>
-</html>'''
+</html>''')
 
-    return html
+
+def generate_demo_index():
+    """Generate a demo index.html page"""
+    now = datetime.now()
+    return _DEMO_INDEX_TEMPLATE.substitute(
+        date_str=now.strftime('%A, %B %d, %Y'),
+        updated_time=now.strftime('%I:%M %p UTC'),
+    )
 
 
 def generate_demo_archive_index():
@@ -304,39 +312,8 @@ def generate_demo_archive_index():
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Archive - AI University News</title>
+    <link rel="stylesheet" href="../styles/demo.css">
     <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-
-        body {
-            font-family: 'Courier New', Courier, monospace;
-            background-color: #ffffff;
-            color: #000000;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            line-height: 1.5;
-        }
-
-        .header {
-            text-align: center;
-            border-bottom: 3px solid #000;
-            padding-bottom: 15px;
-            margin-bottom: 25px;
-        }
-
-        .header h1 {
-            font-size: 42px;
-            font-weight: bold;
-            letter-spacing: -1px;
-            margin-bottom: 5px;
-        }
-
-        .header .tagline {
-            font-size: 14px;
-            color: #666;
-            font-style: italic;
-        }
-
         .nav {
             text-align: center;
             margin-bottom: 30px;
@@ -345,32 +322,11 @@ def generate_demo_archive_index():
             border: 1px solid #ddd;
         }
 
-        .nav a {
-            color: #cc0000;
-            text-decoration: none;
-            font-weight: bold;
-            margin: 0 15px;
-            font-size: 14px;
-        }
-
-        .nav a:hover {
-            text-decoration: underline;
-        }
-
         .no-results {
             text-align: center;
             padding: 40px;
             color: #666;
         }
-
-        .footer {
-            text-align: center;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 2px solid #000;
-            font-size: 12px;
-            color: #666;
-        }
     </style>
 </head>
 <body>
@@ -398,6 +354,23 @@ def generate_demo_archive_index():
     return html
 
 
+def write_if_changed(path: Path, text: str) -> bool:
+    """
+    Write text to path unless the file already holds exactly that content.
+
+    Leaving unchanged files alone keeps their mtimes, so git and the Pages
+    CDN do not see a new version on every run.
+
+    Returns:
+        True if the file was written
+    """
+    payload = text.encode('utf-8')
+    if path.exists() and path.read_bytes() == payload:
+        return False
+    path.write_bytes(payload)
+    return True
+
+
 def main():
     """Generate demo GitHub Pages files"""
     docs_dir = Path("docs")
@@ -406,27 +379,43 @@ def main():
     archive_dir = docs_dir / "archive"
     archive_dir.mkdir(parents=True, exist_ok=True)
 
+    styles_dir = docs_dir / "styles"
+    styles_dir.mkdir(parents=True, exist_ok=True)
+
+    # Generate the shared stylesheet
+    if write_if_changed(styles_dir / "demo.css", _DEMO_CSS):
+        print(f"✅ Generated: docs/styles/demo.css")
+    else:
+        print(f"✅ Unchanged: docs/styles/demo.css")
+
     # Generate index.html
     index_html = generate_demo_index()
-    (docs_dir / "index.html").write_text(index_html, encoding='utf-8')
-    print(f"✅ Generated: docs/index.html")
+    if write_if_changed(docs_dir / "index.html", index_html):
+        print(f"✅ Generated: docs/index.html")
+    else:
+        print(f"✅ Unchanged: docs/index.html")
 
     # Generate archive/index.html
     archive_html = generate_demo_archive_index()
-    (archive_dir / "index.html").write_text(archive_html, encoding='utf-8')
-    print(f"✅ Generated: docs/archive/index.html")
+    if write_if_changed(archive_dir / "index.html", archive_html):
+        print(f"✅ Generated: docs/archive/index.html")
+    else:
+        print(f"✅ Unchanged: docs/archive/index.html")
 
     # Copy how_it_works.html from html_output if it exists, or we'll generate it via the main generator
     print(f"\nℹ️  Note: how_it_works.html will be generated when you run the crawler")
     print(f"   Or you can run: python -c 'from crawler.utils.html_generator import HTMLReportGenerator; HTMLReportGenerator(github_pages_dir=\"docs\").generate_how_it_works()'")
 
-    print(f"\n✅ Demo GitHub Pages files created in docs/")
-    print(f"   - docs/index.html (main page with sample articles)")
-    print(f"   - docs/archive/index.html (empty archive)")
-    print(f"\nNext steps:")
-    print(f"   1. Run the full crawler to generate real data")
-    print(f"   2. Commit the docs/ directory to git")
-    print(f"   3. Enable GitHub Pages in repository settings")
+    print("\n".join([
+        "\n✅ Demo GitHub Pages files created in docs/",
+        "   - docs/index.html (main page with sample articles)",
+        "   - docs/archive/index.html (empty archive)",
+        "   - docs/styles/demo.css (stylesheet shared by both pages)",
+        "\nNext steps:",
+        "   1. Run the full crawler to generate real data",
+        "   2. Commit the docs/ directory to git",
+        "   3. Enable GitHub Pages in repository settings",
+    ]))
 
 
 if __name__ == "__main__":
@@ -12,22 +12,29 @@ import json
 import shutil
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from crawler.utils.json_utils import load_json
+
+
+def load_report(path: Path) -> Optional[Dict]:
+    """Parse a verification report, or return None if it does not exist."""
+    if not path.exists():
+        return None
+    return load_json(path)
+
 def load_batch_1_2_corrections() -> List[Dict]:
     """Load corrections from Batches 1-2 report."""
     corrections = []
 
     report_path = Path('crawler/config/url_verification_report_batches_1_2.json')
-    if not report_path.exists():
+    report = load_report(report_path)
+    if report is None:
         return corrections
 
-    with open(report_path) as f:
-        report = json.load(f)
-
     # Extract broken URLs from Batch 1 (Peer)
     for item in report.get('batch_1_peer_institutions', {}).get('broken_urls', []):
         corrections.append({
@@ -53,12 +60,10 @@ def load_batch_3_corrections() -> List[Dict]:
     corrections = []
 
     report_path = Path('crawler/config/batch_3_verification_report.json')
-    if not report_path.exists():
+    report = load_report(report_path)
+    if report is None:
         return corrections
 
-    with open(report_path) as f:
-        report = json.load(f)
-
     for item in report.get('broken_urls', []):
         corrections.append({
             'name': item['name'],
@@ -74,12 +79,10 @@ def load_batch_4_corrections() -> List[Dict]:
     corrections = []
 
     report_path = Path('crawler/config/batch_4_verification_report.json')
-    if not report_path.exists():
+    report = load_report(report_path)
+    if report is None:
         return corrections
 
-    with open(report_path) as f:
-        report = json.load(f)
-
     for item in report.get('verified_urls', []):
         if item.get('status') == 'corrected':
             corrections.append({
@@ -96,12 +99,10 @@ def load_batch_5_corrections() -> List[Dict]:
     corrections = []
 
     report_path = Path('crawler/config/batch_5_verification_report.json')
-    if not report_path.exists():
+    report = load_report(report_path)
+    if report is None:
         return corrections
 
-    with open(report_path) as f:
-        report = json.load(f)
-
     for item in report.get('verified_urls', []):
         if item.get('status') == 'corrected':
             corrections.append({
@@ -118,12 +119,10 @@ def load_batch_6_corrections() -> List[Dict]:
     corrections = []
 
     corrections_path = Path('crawler/config/batch_6_corrections.json')
-    if not corrections_path.exists():
+    batch_6 = load_report(corrections_path)
+    if batch_6 is None:
         return corrections
 
-    with open(corrections_path) as f:
-        batch_6 = json.load(f)
-
     for item in batch_6.get('corrections', []):
         corrections.append({
             'name': item['university'],
@@ -138,31 +137,45 @@ def apply_corrections_to_config(filepath: Path, corrections: List[Dict], item_ke
     """Apply corrections to a config file."""
 
     # Load config
-    with open(filepath) as f:
-        data = json.load(f)
+    data = load_json(filepath)
 
     applied = 0
     changes = []
 
+    # Index corrections by exact name, keeping list order
+    by_name = {}
+    for correction in corrections:
+        by_name.setdefault(correction['name'], []).append(correction)
+
     for item in data.get(item_key, []):
         name = item.get('name') or item.get('canonical_name')
 
-        # Find matching correction
-        for correction in corrections:
-            if correction['name'] == name or name in correction['name'] or correction['name'] in name:
-                news_sources = item.get('news_sources', [])
-                if news_sources:
-                    old_url = news_sources[0].get('url')
-                    new_url = correction['new_url']
-
-                    if old_url != new_url:
-                        news_sources[0]['url'] = new_url
-                        news_sources[0]['verified'] = True
-                        news_sources[0]['last_verified'] = datetime.now().isoformat()
-
-                        applied += 1
-                        changes.append(f"{name}: {old_url} → {new_url}")
-                        break
+        news_sources = item.get('news_sources', [])
+        if not news_sources:
+            continue
+        old_url = news_sources[0].get('url')
+
+        # Find matching correction: an exact name match, else the first
+        # correction whose name contains or is contained in this one
+        correction = next(
+            (c for c in by_name.get(name, ()) if c['new_url'] != old_url), None
+        )
+        if correction is None:
+            correction = next(
+                (c for c in corrections
+                 if (name in c['name'] or c['name'] in name) and c['new_url'] != old_url),
+                None
+            )
+        if correction is None:
+            continue
+
+        new_url = correction['new_url']
+        news_sources[0]['url'] = new_url
+        news_sources[0]['verified'] = True
+        news_sources[0]['last_verified'] = datetime.now().isoformat()
+
+        applied += 1
+        changes.append(f"{name}: {old_url} → {new_url}")
 
     # Save updated config
     if applied > 0:
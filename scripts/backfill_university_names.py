@@ -29,7 +29,7 @@ from crawler.config.settings import settings
 from crawler.db.session import init_db, SessionLocal
 from crawler.db.models import Article, URL
 from crawler.utils.university_name_mapper import get_mapper
-from crawler.utils.university_classifier import UniversityClassifier
+from crawler.utils.university_classifier import get_classifier
 
 # Configure logging
 logging.basicConfig(
@@ -104,7 +104,7 @@ def backfill_articles(dry_run: bool = False, backfill_all: bool = False) -> Dict
     init_db(settings.database_url)
     session = SessionLocal()
     mapper = get_mapper()
-    classifier = UniversityClassifier()
+    classifier = get_classifier()
 
     stats = {
         'total_checked': 0,
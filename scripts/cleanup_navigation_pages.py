@@ -17,57 +17,59 @@ from crawler.config.settings import settings
 from crawler.db.session import init_db, get_db
 from crawler.db.models import Article, URL, AIAnalysis
 
+# Generic title patterns that indicate navigation pages
+NAVIGATION_TITLE_PATTERNS = [
+    r'^News\s*$',
+    r'^News & Events',
+    r'^News and Events',
+    r'^Press Releases?\s*$',
+    r'^Media\s*$',
+    r'^Stories\s*$',
+    r'^Articles\s*$',
+    r'^Latest News',
+    r'^Latest Stories',
+    r'^All News',
+    r'^All Stories',
+    r'^\w+\s+News\s*$',  # e.g., "Pittwire News", "University News"
+    r'^Features & Articles',
+    r'^Accolades & Honors',
+]
+
+# URL path endings that indicate navigation pages
+NAVIGATION_URL_PATTERNS = [
+    r'/news/?$',
+    r'/news-events/?$',
+    r'/news-and-events/?$',
+    r'/press-releases?/?$',
+    r'/features-articles/?$',
+    r'/accolades-honors/?$',
+    r'/media/?$',
+    r'/stories/?$',
+    r'/articles/?$',
+]
+
+# Each list compiled once into a single alternation, so a row is checked
+# with one regex call instead of one per pattern
+_NAVIGATION_TITLE_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in NAVIGATION_TITLE_PATTERNS), re.IGNORECASE
+)
+_NAVIGATION_URL_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in NAVIGATION_URL_PATTERNS), re.IGNORECASE
+)
+
 def is_navigation_page_title(title: str) -> bool:
     """Check if title matches navigation page patterns."""
     if not title:
         return False
 
-    # Generic title patterns that indicate navigation pages
-    generic_patterns = [
-        r'^News\s*$',
-        r'^News & Events',
-        r'^News and Events',
-        r'^Press Releases?\s*$',
-        r'^Media\s*$',
-        r'^Stories\s*$',
-        r'^Articles\s*$',
-        r'^Latest News',
-        r'^Latest Stories',
-        r'^All News',
-        r'^All Stories',
-        r'^\w+\s+News\s*$',  # e.g., "Pittwire News", "University News"
-        r'^Features & Articles',
-        r'^Accolades & Honors',
-    ]
-
-    for pattern in generic_patterns:
-        if re.match(pattern, title, re.IGNORECASE):
-            return True
-
-    return False
+    return _NAVIGATION_TITLE_RE.match(title) is not None
 
 def is_navigation_page_url(url: str) -> bool:
     """Check if URL matches navigation page patterns."""
     if not url:
         return False
 
-    url_navigation_patterns = [
-        r'/news/?$',
-        r'/news-events/?$',
-        r'/news-and-events/?$',
-        r'/press-releases?/?$',
-        r'/features-articles/?$',
-        r'/accolades-honors/?$',
-        r'/media/?$',
-        r'/stories/?$',
-        r'/articles/?$',
-    ]
-
-    for pattern in url_navigation_patterns:
-        if re.search(pattern, url, re.IGNORECASE):
-            return True
-
-    return False
+    return _NAVIGATION_URL_RE.search(url) is not None
 
 def main():
     """Clean up navigation pages from database."""
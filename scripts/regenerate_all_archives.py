@@ -45,11 +45,9 @@ def main():
         github_pages_dir="docs"
     )
 
-    for date_obj in dates:
-        # Convert date to datetime
-        dt = datetime.combine(date_obj, datetime.min.time())
-        print(f"Generating report for {date_obj}...")
-        html_gen.generate_daily_report(dt)
+    # One query for all dates; pages are rendered in parallel worker processes
+    print(f"Generating reports for {len(dates)} dates...")
+    html_gen.generate_dates([datetime.combine(date_obj, datetime.min.time()) for date_obj in dates])
 
     # Also regenerate archive index and how it works
     print("Generating archive index...")
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Test script for the HTML report generator's persisted and rendered output.
+
+Covers the archive count sidecar (archive/index.json), generate_range versus
+per-date generate_daily_report, and escaping of scraped text in the pages.
+No database is needed: article rows are built in memory.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add crawler to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from crawler.utils import html_generator
+from crawler.utils.html_generator import HTMLReportGenerator
+
+
+FIXED_NOW = datetime(2026, 3, 20, 9, 30)
+
+Row = namedtuple('Row', [
+    'article_id', 'url', 'title', 'university_name', 'first_scraped',
+    'published_date', 'article_metadata', 'consensus_summary',
+    'claude_key_points', 'openai_category',
+])
+
+
+class _FixedDatetime(datetime):
+    """datetime whose now() is pinned so page footers and 'today' are stable"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW
+
+
+@contextmanager
+def _fixed_clock():
+    original = html_generator.datetime
+    html_generator.datetime = _FixedDatetime
+    try:
+        yield
+    finally:
+        html_generator.datetime = original
+
+
+@contextmanager
+def _temp_generator():
+    tmp = tempfile.mkdtemp(prefix='html_reports_test_')
+    try:
+        yield HTMLReportGenerator(output_dir=tmp, editorial_picks=[])
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _make_rows():
+    """Articles spread over the two weeks before FIXED_NOW"""
+    rows = []
+    universities = ['University of Arizona', 'Stanford University', 'Argonne National Laboratory']
+    for i in range(40):
+        day = FIXED_NOW.date() - timedelta(days=i % 14)
+        rows.append(Row(
+            article_id=i,
+            url=f'https://news.example.edu/story-{i}',
+            title=f'Story {i}',
+            university_name=universities[i % len(universities)],
+            first_scraped=datetime(2026, 3, 1) + timedelta(hours=i),
+            published_date=day,
+            article_metadata=None,
+            consensus_summary=f'Summary of story {i}.',
+            claude_key_points=['machine learning'],
+            openai_category=None,
+        ))
+    return rows
+
+
+def _articles_for_day(generator, rows, day):
+    window = [row for row in rows
+              if day.date() - timedelta(days=generator.REPORT_WINDOW_DAYS - 1) <= row.published_date <= day.date()]
+    return generator._rows_to_articles(window)
+
+
+def _write_reports(generator, rows, days):
+    """Write one dated report per day; returns {date_str: article count}"""
+    expected = {}
+    for day in days:
+        articles = _articles_for_day(generator, rows, day)
+        generator._write_daily_report(articles, day)
+        expected[day.strftime('%Y-%m-%d')] = len(articles)
+    return expected
+
+
+def _archive_index_bytes(generator):
+    return Path(generator.generate_archive_index()).read_bytes()
+
+
+def test_archive_counts_match_rescan():
+    """Counts read back from the sidecar must equal a rescan of the reports."""
+    print("=" * 60)
+    print("1. ARCHIVE COUNT SIDECAR VS RESCAN")
+    print("=" * 60)
+
+    with _fixed_clock(), _temp_generator() as generator:
+        rows = _make_rows()
+        days = [datetime(2026, 3, d) for d in range(10, 16)]
+        expected = _write_reports(generator, rows, days)
+        archive_dir = generator.output_dir / 'archive'
+
+        stored = generator._load_archive_counts(archive_dir)
+        assert set(stored) == set(expected), f"sidecar dates {sorted(stored)} != {sorted(expected)}"
+        for date_str, html_path in generator._iter_dated_reports(archive_dir):
+            rescanned = generator._count_articles_in_report(html_path)
+            assert stored[date_str][0] == rescanned == expected[date_str], \
+                f"{date_str}: sidecar {stored[date_str][0]}, rescan {rescanned}, written {expected[date_str]}"
+
+        # The archive index must not depend on whether the sidecar was used
+        from_sidecar = _archive_index_bytes(generator)
+        os.remove(archive_dir / generator.ARCHIVE_COUNTS_FILE)
+        from_rescan = _archive_index_bytes(generator)
+        assert from_sidecar == from_rescan, "archive index differs between sidecar and rescan"
+
+    print("\n[PASS] Sidecar counts match rescanned reports")
+    return True
+
+
+def test_missing_or_stale_sidecar_rescans():
+    """A missing, unreadable, incomplete or stale sidecar falls back to a rescan."""
+    print("=" * 60)
+    print("2. MISSING / STALE SIDECAR FALLS BACK TO RESCAN")
+    print("=" * 60)
+
+    with _fixed_clock(), _temp_generator() as generator:
+        rows = _make_rows()
+        days = [datetime(2026, 3, d) for d in range(10, 13)]
+        expected = _write_reports(generator, rows, days)
+        archive_dir = generator.output_dir / 'archive'
+        sidecar = archive_dir / generator.ARCHIVE_COUNTS_FILE
+
+        def counts_after_index():
+            generator.generate_archive_index()
+            return {date_str: entry[0] for date_str, entry in generator._load_archive_counts(archive_dir).items()}
+
+        # Missing sidecar
+        sidecar.unlink()
+        assert counts_after_index() == expected, "missing sidecar was not rebuilt by rescan"
+
+        # Corrupt sidecar
+        sidecar.write_text('{not json', encoding='utf-8')
+        assert counts_after_index() == expected, "corrupt sidecar was not rebuilt by rescan"
+
+        # Sidecar written before mtimes were recorded
+        sidecar.write_text('{"2026-03-10": {"count": 999}}', encoding='utf-8')
+        assert counts_after_index() == expected, "legacy sidecar entry was trusted"
+
+        # Sidecar missing one date
+        stored = generator._load_archive_counts(archive_dir)
+        del stored['2026-03-11']
+        generator._save_archive_counts(archive_dir, stored)
+        assert counts_after_index() == expected, "date missing from sidecar was not rescanned"
+
+        # Report rewritten behind the sidecar's back (e.g. by a repair script)
+        report = archive_dir / '2026-03-12.html'
+        old_mtime_ns = report.stat().st_mtime_ns
+        only_three = generator._rows_to_articles(rows[:3])
+        report.write_bytes(generator._render_main_page(only_three, datetime(2026, 3, 12), is_archive_page=True).encode('utf-8'))
+        os.utime(report, ns=(old_mtime_ns + 10**9, old_mtime_ns + 10**9))
+        counts = counts_after_index()
+        assert counts['2026-03-12'] == len(only_three), \
+            f"stale sidecar count {counts['2026-03-12']} used instead of rescan ({len(only_three)})"
+
+    print("\n[PASS] Missing and stale sidecar entries are rescanned")
+    return True
+
+
+def test_generate_range_matches_daily_reports():
+    """generate_range must write the same pages as one generate_daily_report per date."""
+    print("=" * 60)
+    print("3. GENERATE_RANGE VS PER-DATE GENERATE_DAILY_REPORT")
+    print("=" * 60)
+
+    rows = _make_rows()
+
+    def fetch_rows(session, start, end):
+        lower = start.date() - timedelta(days=HTMLReportGenerator.REPORT_WINDOW_DAYS - 1)
+        window = [row for row in rows if lower <= row.published_date <= end.date()]
+        return sorted(window, key=lambda row: row.published_date, reverse=True)
+
+    @contextmanager
+    def no_db():
+        yield None
+
+    original_get_db = html_generator.get_db
+    html_generator.get_db = no_db
+    try:
+        with _fixed_clock(), _temp_generator() as ranged, _temp_generator() as daily:
+            ranged._fetch_articles_for_range = fetch_rows
+            daily._fetch_articles_for_range = fetch_rows
+
+            start, end = datetime(2026, 3, 14), datetime(2026, 3, 20)
+            ranged.generate_range(start, end, max_workers=1)
+            day = start
+            while day <= end:
+                daily.generate_daily_report(day)
+                day += timedelta(days=1)
+
+            ranged_files = sorted(p.name for p in (ranged.output_dir / 'archive').glob('20*.html'))
+            daily_files = sorted(p.name for p in (daily.output_dir / 'archive').glob('20*.html'))
+            assert ranged_files == daily_files and len(ranged_files) == 7, \
+                f"different report sets: {ranged_files} vs {daily_files}"
+
+            for name in ranged_files + ['../index.html']:
+                a = (ranged.output_dir / 'archive' / name).read_bytes()
+                b = (daily.output_dir / 'archive' / name).read_bytes()
+                assert a == b, f"{name} differs between generate_range and generate_daily_report"
+
+            ranged_counts = ranged._load_archive_counts(ranged.output_dir / 'archive')
+            daily_counts = daily._load_archive_counts(daily.output_dir / 'archive')
+            assert {d: c for d, (c, _) in ranged_counts.items()} == {d: c for d, (c, _) in daily_counts.items()}, \
+                "sidecar counts differ between generate_range and generate_daily_report"
+    finally:
+        html_generator.get_db = original_get_db
+
+    print("\n[PASS] generate_range output matches per-date reports")
+    return True
+
+
+def test_scraped_text_is_escaped():
+    """&, < and \" in titles, URLs and source names must be HTML-escaped."""
+    print("=" * 60)
+    print("4. ESCAPING OF SCRAPED TEXT")
+    print("=" * 60)
+
+    hostile_title = 'AI <script>alert(1)</script> & "quotes"'
+    hostile_url = 'https://news.example.edu/a?x=1&y="2"<z>'
+    hostile_university = 'Institute of <b>Bold</b> & "Quoted" Research'
+
+    with _fixed_clock(), _temp_generator() as generator:
+        article = {
+            'article_id': 1,
+            'url': hostile_url,
+            'title': hostile_title,
+            'university': hostile_university,
+            'timestamp': datetime(2026, 3, 19, 8, 0),
+            'published_date': datetime(2026, 3, 19),
+            'summary': 'Summary with <tags> & "quotes".',
+            'topics': ['R&D <lab>'],
+            'category': None,
+            'article_metadata': None,
+        }
+        page = generator._render_main_page([article], datetime(2026, 3, 19), is_archive_page=True)
+
+        for raw in ['<script>alert(1)</script>', '"quotes"', 'x=1&y=', '<b>Bold</b>', '<tags>', 'R&D <lab>']:
+            assert raw not in page, f"unescaped text in report: {raw!r}"
+        for escaped in ['&lt;script&gt;alert(1)&lt;/script&gt; &amp; &quot;quotes&quot;',
+                        'x=1&amp;y=&quot;2&quot;&lt;z&gt;',
+                        '&lt;b&gt;Bold&lt;/b&gt; &amp; &quot;Quoted&quot;']:
+            assert escaped in page, f"escaped text missing from report: {escaped!r}"
+
+        generator._sources_cache = (
+            [('A&M <University> "Main"', 'https://a.example.edu/?q=1&r="2"')],
+            [('Plain & <Simple>', '')],
+            [], [], [],
+        )
+        sources = generator._render_sources_section()
+        for raw in ['<University>', '"Main"', 'q=1&r=', '<Simple>']:
+            assert raw not in sources, f"unescaped text in source list: {raw!r}"
+        for escaped in ['A&amp;M &lt;University&gt; &quot;Main&quot;',
+                        'href="https://a.example.edu/?q=1&amp;r=&quot;2&quot;"',
+                        '<li>Plain &amp; &lt;Simple&gt;</li>']:
+            assert escaped in sources, f"escaped text missing from source list: {escaped!r}"
+
+    print("\n[PASS] Titles, URLs and source names are escaped")
+    return True
+
+
+def main():
+    tests = [
+        test_archive_counts_match_rescan,
+        test_missing_or_stale_sidecar_rescans,
+        test_generate_range_matches_daily_reports,
+        test_scraped_text_is_escaped,
+    ]
+
+    results = []
+    for test in tests:
+        try:
+            results.append(test())
+        except AssertionError as e:
+            print(f"\n[FAIL] {test.__name__}: {e}")
+            results.append(False)
+        print()
+
+    print("=" * 60)
+    if all(results):
+        print("ALL TESTS PASSED")
+        return 0
+    print(f"{results.count(False)} OF {len(results)} TESTS FAILED")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
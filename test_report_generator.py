@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script to verify ReportGenerator.strip_markdown output.
+
+Regression cases for links, intraword underscores and underscores inside
+URLs: a link must be removed before emphasis, so an '_' in a URL or in a
+neighbouring word never pairs up across the link and leaks its markup.
+"""
+
+import sys
+from pathlib import Path
+
+# Add crawler to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from crawler.utils.report_generator import ReportGenerator
+
+
+def test_strip_markdown():
+    """
+    Test that markdown is stripped to plain text.
+    """
+    print("\n" + "="*70)
+    print("Testing ReportGenerator.strip_markdown")
+    print("="*70 + "\n")
+
+    # Test cases: (markdown, expected plain text)
+    test_cases = [
+        # Underscores in URLs and words next to links
+        ("Read about machine_learning at [site](https://x.edu/ai_news)",
+         "Read about machine_learning at site"),
+        ("a_b [x](http://y.com/c_d) e_f", "ab x ef"),
+        ("[release](https://x.edu/news/ai_lab_opens)", "release"),
+        ("See [one](https://a.edu/x_y) and [two](https://b.edu/z_w)", "See one and two"),
+        ("snake_case [docs](https://x.edu/a_b) *note*", "snake_case docs note"),
+
+        # Markup nested inside a link
+        ("[**Bold** link](https://x.edu)", "Bold link"),
+
+        # Emphasis and inline code
+        ("**bold** and __bold__", "bold and bold"),
+        ("*italic* and _italic_", "italic and italic"),
+        ("***both***", "both"),
+        ("use `code` here", "use code here"),
+
+        # Line-level constructs and HTML
+        ("## Heading\nbody", "Heading\nbody"),
+        ("intro\n---\nbody", "intro\n\nbody"),
+        ("intro\n-*-\nbody", "intro\n\nbody"),
+        ("<b>tag</b> text", "tag text"),
+
+        # Plain and unbalanced input
+        ("Plain summary text.", "Plain summary text."),
+        ("[[[ unclosed", "[[[ unclosed"),
+        ("", ""),
+    ]
+
+    all_passed = True
+
+    for markdown, expected in test_cases:
+        result = ReportGenerator.strip_markdown(markdown)
+        passed = result == expected
+        all_passed = all_passed and passed
+
+        status = "PASS" if passed else "FAIL"
+        print(f"[{status}] {markdown!r}")
+        if not passed:
+            print(f"      Expected: {expected!r}")
+            print(f"      Got:      {result!r}")
+
+    print()
+    print("="*70)
+    if all_passed:
+        print("ALL TESTS PASSED")
+        return 0
+    else:
+        print("SOME TESTS FAILED")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(test_strip_markdown())